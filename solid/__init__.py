@@ -4,6 +4,7 @@
 from .solidpython import scad_render, scad_render_to_file
 from .solidpython import scad_render_animated, scad_render_animated_file
 from .solidpython import OpenSCADObject, IncludedOpenSCADObject
+from .solidpython import clear_include_path_cache
 from .objects import *
 from .patch_euclid import run_euclid_patch
 
@@ -0,0 +1,94 @@
+#! /usr/bin/env python3
+import sys
+from math import cos, pi, radians, sin
+from time import perf_counter
+
+from solid import scad_render_to_file
+from solid.utils import extrude_along_path
+from euclid3 import Matrix4, Point3, Vector3
+
+PROFILE_POINTS = 200
+PATH_POINTS = 1000
+
+
+def star_profile(count=PROFILE_POINTS, r_outer=5, r_inner=3):
+    return [Point3((r_outer if i % 2 else r_inner) * cos(2 * pi * i / count),
+                   (r_outer if i % 2 else r_inner) * sin(2 * pi * i / count), 0) for i in range(count)]
+
+
+def helix_path(count=PATH_POINTS, radius=40, pitch=30, turns=4):
+    path = []
+    for i in range(count):
+        angle = 2 * pi * turns * i / count
+        path.append(Point3(radius * cos(angle), radius * sin(angle), pitch * turns * i / count))
+    return path
+
+
+def euclid3_extrude_points(shape_pts, path_pts, scales=None, rotations=None, transforms=None, connect_ends=False):
+    # The points extrude_along_path() produced before it switched to tuple
+    # math: every loop built from euclid3 objects and placed with its own
+    # look-at Matrix4, as transform_to_point() did
+    shape_pts = [Point3(*p) for p in shape_pts]
+    path_pts = [Point3(*p) for p in path_pts]
+    if connect_ends:
+        tangent_path_points = [path_pts[-1]] + path_pts + [path_pts[0]]
+    else:
+        first = Point3(*(path_pts[0] - (path_pts[1] - path_pts[0])))
+        last = Point3(*(path_pts[-1] - (path_pts[-2] - path_pts[-1])))
+        tangent_path_points = [first] + path_pts + [last]
+
+    points = []
+    for i, path_pt in enumerate(path_pts):
+        path_normal = i / (len(path_pts) - 1)
+        loop = shape_pts
+        if scales:
+            scale = scales[i]
+            sx, sy = (scale, scale) if isinstance(scale, (float, int)) else scale
+            loop = [Point3(p.x * sx, p.y * sy, p.z) for p in loop]
+        if rotations:
+            degrees = rotations[i] if len(rotations) > 1 else rotations[0] * path_normal
+            loop = [p.rotate_around(Vector3(0, 0, 1), radians(degrees)) for p in loop]
+        if transforms:
+            func = transforms[i] if len(transforms) > 1 else transforms[0]
+            loop = [func(p, path_normal, j / (len(loop) - 1)) for j, p in enumerate(loop)]
+
+        tangent = tangent_path_points[i + 2] - tangent_path_points[i]
+        up = Vector3(0, 0, 1)
+        if tangent.cross(up) == Vector3(0, 0, 0):
+            up = Vector3(0, 1, 0)
+        z = (path_pt - (path_pt + tangent)).normalized()
+        x = up.cross(z).normalized()
+        y = z.cross(x)
+        m = Matrix4.new_rotate_triple_axis(x, y, z)
+        m.d, m.h, m.l = path_pt.x, path_pt.y, path_pt.z
+        # euclidify() made Point3s of the loop, so the matrix translates too
+        points += [list(m * Point3(*p)) for p in loop]
+    return points
+
+
+def extrude_benchmark(profile, path):
+    scales = [1 + 0.5 * sin(4 * pi * i / len(path)) for i in range(len(path))]
+    kwargs = dict(scales=scales, rotations=[720])
+
+    start = perf_counter()
+    expected = euclid3_extrude_points(profile, path, **kwargs)
+    euclid_time = perf_counter() - start
+
+    start = perf_counter()
+    poly = extrude_along_path(profile, path, **kwargs)
+    tuple_time = perf_counter() - start
+
+    difference = max(abs(a - b) for p, q in zip(expected, poly.params['points']) for a, b in zip(p, q))
+    print(f"Sweeping a {len(profile)}-point profile along a {len(path)}-point path:")
+    print(f"    euclid3 objects: {euclid_time * 1000:.0f} ms")
+    print(f"    tuple math:      {tuple_time * 1000:.0f} ms ({euclid_time / tuple_time:.1f}x faster)")
+    print(f"    Largest difference between their points: {difference:g}")
+    return poly
+
+
+if __name__ == '__main__':
+    out_dir = sys.argv[1] if len(sys.argv) > 1 else None
+
+    a = extrude_benchmark(star_profile(), helix_path())
+    file_out = scad_render_to_file(a, out_dir=out_dir, include_orig_code=True)
+    print(f"{__file__}: SCAD file written to: \n{file_out}")
@@ -0,0 +1,52 @@
+#! /usr/bin/env python3
+import sys
+import tempfile
+from pathlib import Path
+from time import perf_counter
+
+from solid import objects, scad_render_to_file
+from solid.objects import import_scad
+
+# A synthetic library the size of the big ones (BOSL2, NopSCADlib, etc.):
+# DIR_COUNT directories of FILES_PER_DIR copies of scad_to_include.scad
+DIR_COUNT = 20
+FILES_PER_DIR = 50
+SOURCE = Path(__file__).parent / 'scad_to_include.scad'
+
+
+def write_library(lib_dir):
+    text = SOURCE.read_text()
+    for i in range(DIR_COUNT):
+        sub_dir = lib_dir / f'dir{i}'
+        sub_dir.mkdir()
+        for j in range(FILES_PER_DIR):
+            (sub_dir / f'part{j}.scad').write_text(text)
+
+
+def import_benchmark(lib_dir):
+    # Time from import_scad() to the first object made from one file in
+    # the library, which is all a typical script needs
+    timings = {}
+    for label, kwargs in [('eager', {}), ('parallel', {'parallel': True}), ('lazy', {'lazy': True})]:
+        objects.IMPORTED_SCAD_MODULES.clear()
+        start = perf_counter()
+        lib = import_scad(lib_dir, **kwargs)
+        obj = lib.dir3.part7.steps(howmany=5)
+        timings[label] = perf_counter() - start
+
+    file_count = DIR_COUNT * FILES_PER_DIR
+    print(f"Importing a {file_count}-file library and using one module:")
+    for label, elapsed in timings.items():
+        print(f"    {label:>8}: {elapsed * 1000:.0f} ms")
+    return obj
+
+
+if __name__ == '__main__':
+    out_dir = sys.argv[1] if len(sys.argv) > 1 else None
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        lib_dir = Path(tmp_dir)
+        write_library(lib_dir)
+        a = import_benchmark(lib_dir)
+        file_out = scad_render_to_file(a, out_dir=out_dir, include_orig_code=True)
+    print(f"{__file__}: SCAD file written to: \n{file_out}")
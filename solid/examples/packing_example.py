@@ -0,0 +1,68 @@
+#! /usr/bin/env python3
+import random
+import sys
+from math import ceil
+from time import perf_counter
+
+from solid import scad_render_to_file
+from solid.objects import cube, cylinder, union
+from solid.utils import object_bounds, pack_on_plates, right
+
+PLATE_SIZE = (250, 210)
+SPACING = 2
+PART_COUNT = 1000
+
+
+def random_parts(count, seed=0):
+    # Mostly boxes with some round parts, from 5 to 60 mm across
+    rand = random.Random(seed)
+    parts = []
+    for _ in range(count):
+        if rand.random() < 0.2:
+            parts.append(cylinder(r=rand.uniform(3, 20), h=5))
+        else:
+            size = [rand.uniform(5, 60), rand.uniform(5, 40), 5]
+            parts.append(cube(size))
+    return parts
+
+
+def grid_plate_count(parts):
+    # distribute_in_grid() puts each part in a cell the size of the largest
+    # part, so count how many plates of those cells the parts would need
+    sizes = [(hi[0] - lo[0], hi[1] - lo[1]) for lo, hi in map(object_bounds, parts)]
+    cell_w = max(w for w, h in sizes) + SPACING
+    cell_h = max(h for w, h in sizes) + SPACING
+    per_plate = int(PLATE_SIZE[0] // cell_w) * int(PLATE_SIZE[1] // cell_h)
+    return ceil(len(parts) / per_plate)
+
+
+def packing_benchmark(parts):
+    start = perf_counter()
+    plates = pack_on_plates(parts, PLATE_SIZE, spacing=SPACING)
+    elapsed = perf_counter() - start
+
+    part_area = 0.0
+    for lo, hi in map(object_bounds, parts):
+        part_area += (hi[0] - lo[0]) * (hi[1] - lo[1])
+    plate_area = PLATE_SIZE[0] * PLATE_SIZE[1]
+
+    grid_plates = grid_plate_count(parts)
+    print(f"{len(parts)} parts packed onto {len(plates)} plates in {elapsed * 1000:.0f} ms")
+    print(f"    Packing density: {part_area / (len(plates) * plate_area):.0%}")
+    print(f"    distribute_in_grid() would need {grid_plates} plates, "
+          f"density {part_area / (grid_plates * plate_area):.0%}")
+    return plates
+
+
+def assembly(plates):
+    # Show plates side by side
+    return union()(*[right(i * (PLATE_SIZE[0] + 20))(p) for i, p in enumerate(plates)])
+
+
+if __name__ == '__main__':
+    out_dir = sys.argv[1] if len(sys.argv) > 1 else None
+
+    plates = packing_benchmark(random_parts(PART_COUNT))
+    a = assembly(plates)
+    file_out = scad_render_to_file(a, out_dir=out_dir, include_orig_code=True)
+    print(f"{__file__}: SCAD file written to: \n{file_out}")
@@ -0,0 +1,51 @@
+#! /usr/bin/env python3
+import sys
+from math import cos, pi, sin
+from time import perf_counter
+
+from solid import scad_render_to_file
+from solid.objects import color, union
+from solid.polygon_offset import offset_polygon, offset_polygon_points
+from solid.utils import right
+
+TEETH = 100
+VERTEX_COUNT = 100000
+
+
+def gear_points(teeth=TEETH, count=VERTEX_COUNT, radius=80):
+    # A gear outline with flat-topped teeth, sampled much finer than it needs
+    points = []
+    for i in range(count):
+        a = 2 * pi * i / count
+        r = radius + max(-4, min(4, 8 * sin(teeth * a)))
+        points.append((r * cos(a), r * sin(a)))
+    return points
+
+
+def offset_benchmark(points):
+    for delta, join in [(1, 'miter'), (-1, 'chamfer'), (1, 'round'), (-3, 'miter')]:
+        start = perf_counter()
+        loops = offset_polygon_points(points, delta, join=join)
+        elapsed = perf_counter() - start
+        print(f"{join:>7} offset by {delta:>2}: {len(points)} vertices -> "
+              f"{sum(map(len, loops))} in {elapsed:.2f} s")
+
+
+def assembly(points):
+    # The gear, with a rounded outline around it and a mitered one inside it
+    outline = offset_polygon(points, 2, join='round')
+    inner = offset_polygon(points, -6, join='miter')
+    return union()(
+        color('gray')(outline - offset_polygon(points, 0)),
+        right(200)(color('red')(inner)),
+    )
+
+
+if __name__ == '__main__':
+    out_dir = sys.argv[1] if len(sys.argv) > 1 else None
+
+    points = gear_points()
+    offset_benchmark(points)
+    a = assembly(gear_points(count=2000))
+    file_out = scad_render_to_file(a, out_dir=out_dir, include_orig_code=True)
+    print(f"{__file__}: SCAD file written to: \n{file_out}")
@@ -1,12 +1,14 @@
 #! /usr/bin/env python
-from math import radians
+from math import radians, sqrt, sin, cos, atan2, ceil
 from solid import OpenSCADObject, Points, Indexes, ScadSize, polyhedron
-from solid.utils import euclidify, euc_to_arr, transform_to_point, centroid, EPSILON
+from solid.utils import EPSILON, Matrix34, apply_matrix, look_at_matrices
+from solid.utils import _cross, _dot, _magnitude_squared, _normalized, _scaled, _sub, _xyz_tuples
 from euclid3 import Point2, Point3, Vector2, Vector3
 
 from typing import Dict, Optional, Sequence, Tuple, Union, List, Callable
 
 Tuple2 = Tuple[float, float]
+Tuple3 = Tuple[float, float, float]
 FacetIndices = Tuple[int, int, int]
 Point3Transform = Callable[[Point3, Optional[float], Optional[float]], Point3]
 
@@ -19,7 +21,10 @@ def extrude_along_path( shape_pts:Points,
                         rotations: Sequence[float] = None,
                         transforms: Sequence[Point3Transform] = None,
                         connect_ends = False,
-                        cap_ends = True) -> OpenSCADObject:
+                        cap_ends = True,
+                        minimize_twist = False,
+                        chord_tolerance: float = None,
+                        max_bend: float = None) -> OpenSCADObject:
     '''
     Extrude the curve defined by shape_pts along path_pts.
     -- For predictable results, shape_pts must be planar, convex, and lie
@@ -41,6 +46,8 @@ def extrude_along_path( shape_pts:Points,
              def transform_func(p:Point3, path_norm:float, loop_norm:float): Point3
           where path_norm is in [0,1] and expresses progress through the extrusion
           and loop_norm is in [0,1] and express progress through a single loop of the extrusion
+          Functions decorated with @batch_transform instead transform a whole 
+          loop per call; see batch_transform()
     
     -- if connect_ends is True, the first and last loops of the extrusion will
           be joined, which is useful for toroidal geometries. Overrides cap_ends
@@ -49,66 +56,93 @@ def extrude_along_path( shape_pts:Points,
         will be connected to the centroid of that loop. For planar, convex shapes, this
         works nicely. If shape is less planar or convex, some self-intersection may happen.
         Not applied if connect_ends is True
-    '''
 
+    -- if minimize_twist is True, orient each loop with rotation-minimizing 
+        frames (computed by double reflection) rather than pointing each loop 
+        independently at the path's next point. The first loop is placed as 
+        usual; each later loop is rotated as little as possible relative to 
+        the one before it, so 3D paths don't twist or flip near vertical 
+        tangents. For closed paths, any twist left over after a full circuit
+        is spread evenly along the path so the ends meet
 
-    polyhedron_pts:Points= []
-    facet_indices:List[Tuple[int, int, int]] = []
+    -- if chord_tolerance or max_bend (degrees) is supplied, path_pts are 
+        resampled before extruding. Runs of nearly collinear points are merged
+        as long as no dropped point strays more than chord_tolerance from the 
+        remaining segment and the path turns less than max_bend degrees.
+        Segments next to sharper bends are subdivided along a Catmull-Rom 
+        curve through the path until each new piece stays within both limits.
+        With chord_tolerance, new points are pulled in where needed to stay
+        within chord_tolerance of the original path; with max_bend alone,
+        sharp corners are rounded off freely.
+        Scales & rotations are interpolated for any new points and each new 
+        point uses the transform of the nearest original point
+    '''
 
-    # Make sure we've got Euclid Point3's for all elements
-    shape_pts = euclidify(shape_pts, Point3)
-    path_pts = euclidify(path_pts, Point3)
 
-    src_up = Vector3(0, 0, 1)
+    # All the geometry below works on plain (x, y, z) tuples rather than on
+    # euclid3 objects, and the arithmetic is arranged exactly as euclid3 
+    # would do it, so results are identical to applying transform_to_point()
+    # to every loop, but without allocating several objects per vertex
+    shape_tuples = _xyz_tuples(shape_pts)
+    path_tuples = _xyz_tuples(path_pts)
 
-    shape_pt_count = len(shape_pts)
+    src_up = (0, 0, 1)
 
-    tangent_path_points: List[Point3] = []
+    shape_pt_count = len(shape_tuples)
 
     # If first & last points are the same, let's close the shape
-    first_last_equal = ((path_pts[0] - path_pts[-1]).magnitude_squared() < EPSILON)
+    first_last_equal = (_magnitude_squared(_sub(path_tuples[0], path_tuples[-1])) < EPSILON)
     if first_last_equal:
         connect_ends = True
-        path_pts = path_pts[:][:-1]
+        path_tuples = path_tuples[:-1]
+
+    # Position of each path point in terms of the original path_pts indices;
+    # only fractional for points added by resampling
+    last_param = len(path_tuples) - 1
+    path_params: Sequence[float] = range(len(path_tuples))
+    if chord_tolerance is not None or max_bend is not None:
+        path_tuples, path_params = _resample_path(path_tuples, connect_ends, chord_tolerance, max_bend)
 
+    path_count = len(path_tuples)
     if connect_ends:
-        tangent_path_points = [path_pts[-1]] + path_pts + [path_pts[0]]
+        tangent_path_points = [path_tuples[-1]] + path_tuples + [path_tuples[0]]
     else:
-        first = Point3(*(path_pts[0] - (path_pts[1] - path_pts[0])))
-        last = Point3(*(path_pts[-1] - (path_pts[-2] - path_pts[-1])))
-        tangent_path_points = [first] + path_pts + [last]
-    tangents = [tangent_path_points[i+2] - tangent_path_points[i] for i in range(len(path_pts))]
+        first = _sub(path_tuples[0], _sub(path_tuples[1], path_tuples[0]))
+        last = _sub(path_tuples[-1], _sub(path_tuples[-2], path_tuples[-1]))
+        tangent_path_points = [first] + path_tuples + [last]
+    tangents = [_sub(tangent_path_points[i+2], tangent_path_points[i]) for i in range(path_count)]
 
-    for which_loop in range(len(path_pts)):
-        # path_normal is 0 at the first path_pts and 1 at the last
-        path_normal = which_loop/ (len(path_pts) - 1)
+    # Compute every loop's placement up front, then apply them all
+    if minimize_twist:
+        matrices = _rotation_minimizing_matrices(path_tuples, tangents, src_up, closed=connect_ends)
+    else:
+        matrices = look_at_matrices(path_tuples, tangents, src_up)
 
-        path_pt = path_pts[which_loop]
-        tangent = tangents[which_loop]
-        scale = scales[which_loop] if scales else 1
+    polyhedron_pts: List[List[float]] = []
+    for param, matrix in zip(path_params, matrices):
+        # path_normal is 0 at the first path_pts and 1 at the last
+        path_normal = min(param / last_param, 1)
 
-        rotate_degrees = None
+        this_loop = shape_tuples
+        if scales:
+            this_loop = _scale_loop(this_loop, _interpolated(scales, param))
         if rotations:
-            rotate_degrees = rotations[which_loop] if len(rotations) > 1 else rotations[0] * path_normal
-
-        transform_func = None
+            rotate_degrees = _interpolated(rotations, param) if len(rotations) > 1 else rotations[0] * path_normal
+            this_loop = _rotate_loop(this_loop, rotate_degrees)
         if transforms:
-            transform_func = transforms[which_loop] if len(transforms) > 1 else transforms[0]
-
-        this_loop = shape_pts[:]
-        this_loop = _scale_loop(this_loop, scale)
-        this_loop = _rotate_loop(this_loop, rotate_degrees)
-        this_loop = _transform_loop(this_loop, transform_func, path_normal)
+            transform_func = transforms[round(param) % len(transforms)] if len(transforms) > 1 else transforms[0]
+            this_loop = _transform_loop(this_loop, transform_func, path_normal)
 
-        this_loop = transform_to_point(this_loop, dest_point=path_pt, dest_normal=tangent, src_up=src_up)
-        loop_start_index = which_loop * shape_pt_count
+        polyhedron_pts += apply_matrix(matrix, this_loop)
 
-        if (which_loop < len(path_pts) - 1):
-            loop_facets = _loop_facet_indices(loop_start_index, shape_pt_count)
-            facet_indices += loop_facets
-
-        # Add the transformed points & facets to our final list
-        polyhedron_pts += this_loop
+    # Facets between each pair of consecutive loops are the same, offset by 
+    # shape_pt_count indices per loop
+    loop_facets = _loop_facet_indices(0, shape_pt_count)
+    facet_indices: List[Tuple[int, int, int]] = [
+        (a + offset, b + offset, c + offset) 
+        for offset in range(0, (path_count - 1) * shape_pt_count, shape_pt_count) 
+        for a, b, c in loop_facets
+    ]
 
     if connect_ends:
         connect_loop_start_index = len(polyhedron_pts) - shape_pt_count
@@ -121,10 +155,26 @@ def extrude_along_path( shape_pts:Points,
         last_loop_start_index = len(polyhedron_pts) - shape_pt_count 
         start_loop_indices = list(reversed(range(shape_pt_count)))
         end_loop_indices = list(range(last_loop_start_index, last_loop_start_index + shape_pt_count))   
-        facet_indices.append(start_loop_indices)
-        facet_indices.append(end_loop_indices)
+        facet_indices.append(start_loop_indices) # type: ignore
+        facet_indices.append(end_loop_indices) # type: ignore
 
-    return polyhedron(points=euc_to_arr(polyhedron_pts), faces=facet_indices) # type: ignore
+    return polyhedron(points=polyhedron_pts, faces=facet_indices) # type: ignore
+
+def batch_transform(transform_func:Callable) -> Callable:
+    '''
+    Mark transform_func as transforming an entire loop of an extrusion in one
+    call, rather than one point at a time. It should have the signature:
+        def transform_func(points:List[Tuple3], path_norm:float, loop_norms:List[float]) -> Sequence[Point3]
+    where loop_norms[i] is the loop_norm for points[i], and return one 
+    transformed point for each point in points. This saves a Python call
+    per vertex, and lets the function use array math, e.g. with numpy:
+
+        @batch_transform
+        def bulge(points, path_norm, loop_norms):
+            return np.asarray(points) * (1 + np.sin(np.pi * path_norm))
+    '''
+    transform_func.batch_transform = True # type: ignore
+    return transform_func
 
 def _loop_facet_indices(loop_start_index:int, loop_pt_count:int, next_loop_start_index=None) -> List[FacetIndices]:
     facet_indices: List[FacetIndices] = []
@@ -149,33 +199,303 @@ def _loop_facet_indices(loop_start_index:int, loop_pt_count:int, next_loop_start
         facet_indices.append((b,d,c))
     return facet_indices
 
-def _rotate_loop(points:Sequence[Point3], rotation_degrees:float=None) -> List[Point3]:
+def _rotate_loop(points:Sequence[Tuple3], rotation_degrees:float=None) -> List[Tuple3]:
     if rotation_degrees is None:
         return points
-    up = Vector3(0,0,1)
     rads = radians(rotation_degrees)
-    return [p.rotate_around(up, rads) for p in points]
+    # This is euclid3's Vector3.rotate_around() about the Z axis, 
+    # term for term, so results match it exactly
+    u, v, w = 0, 0, 1
+    r2 = u**2 + v**2 + w**2
+    r = sqrt(r2)
+    ct = cos(rads)
+    st = sin(rads) / r
+    result = []
+    for x, y, z in points:
+        dt = (u*x + v*y + w*z) * (1 - ct) / r2
+        result.append(((u * dt + x * ct + (-w * y + v * z) * st),
+                       (v * dt + y * ct + ( w * x - u * z) * st),
+                       (w * dt + z * ct + (-v * x + u * y) * st)))
+    return result
 
-def _scale_loop(points:Sequence[Point3], scale:Union[float, Point2, Tuple2]=None) -> List[Point3]:
+def _scale_loop(points:Sequence[Tuple3], scale:Union[float, Point2, Tuple2]=None) -> List[Tuple3]:
     if scale is None:
         return points
 
     if isinstance(scale, (float, int)):
         scale = [scale] * 2
-    return [Point3(point.x * scale[0], point.y * scale[1], point.z) for point in points]
+    sx, sy = scale[0], scale[1]
+    return [(x * sx, y * sy, z) for x, y, z in points]
 
-def _transform_loop(points:Sequence[Point3], transform_func:Point3Transform = None, path_normal:float = None) -> List[Point3]:
+def _transform_loop(points:Sequence[Tuple3], transform_func:Point3Transform = None, path_normal:float = None) -> List[Tuple3]:
     # transform_func is a function that takes a point and optionally two floats,
     # a `path_normal`, in [0,1] that indicates where this loop is in a path extrusion,
     # and `loop_normal` in [0,1] that indicates where this point is in a list of points
     if transform_func is None:
         return points
 
+    if getattr(transform_func, 'batch_transform', False):
+        last = len(points) - 1
+        loop_normals = [i / last for i in range(len(points))]
+        return [(p[0], p[1], p[2]) for p in transform_func(points, path_normal, loop_normals)]
+
     result = []
     for i, p in enumerate(points):
         # i goes from 0 to 1 across points
         loop_normal = i/(len(points) -1)
-        new_p = transform_func(p, path_normal, loop_normal)
-        result.append(new_p)
+        new_p = transform_func(Point3(*p), path_normal, loop_normal)
+        result.append((new_p[0], new_p[1], new_p[2]))
     return result
 
+def _interpolated(values:Sequence, param:float):
+    # values[param], linearly interpolated between neighbours for fractional 
+    # params. Wraps around, for closed paths
+    i = int(param)
+    t = param - i
+    a = values[i % len(values)]
+    if t == 0:
+        return a
+    b = values[(i + 1) % len(values)]
+    if isinstance(a, (float, int)):
+        return a + (b - a) * t
+    return (a[0] + (b[0] - a[0]) * t, a[1] + (b[1] - a[1]) * t)
+
+# ===============
+# = Path frames =
+# ===============
+def _rotation_minimizing_matrices(dest_points:Sequence[Tuple3], 
+                                  dest_normals:Sequence[Tuple3], 
+                                  src_up:Tuple3=(0, 0, 1),
+                                  closed:bool=False) -> List[Matrix34]:
+    """
+    Like utils.look_at_matrices(), but only the first frame is a look-at frame; 
+    later frames are carried along the path by the double reflection method in:
+    Wang, Jüttler, Zheng & Liu, "Computation of Rotation Minimizing Frames", 
+    ACM Transactions on Graphics 27(1), 2008
+    """
+    first = look_at_matrices(dest_points[:1], dest_normals[:1], src_up)[0]
+    # Columns of the look-at matrix: local X & Z axes. Local Z points back
+    # along the path, so it plays the part of the tangent here
+    xs = [(first[0][0], first[1][0], first[2][0])]
+    zs = [(first[0][2], first[1][2], first[2][2])]
+    zs += [_normalized((-n[0], -n[1], -n[2])) for n in dest_normals[1:]]
+
+    count = len(dest_points)
+    steps = count if closed else count - 1
+    for i in range(steps):
+        j = (i + 1) % count
+        xs.append(_double_reflect(dest_points[i], dest_points[j], xs[i], zs[i], zs[j]))
+
+    if closed:
+        # Carrying the frame all the way around a closed path generally leaves
+        # it rotated relative to where it started. Spread that correction 
+        # evenly along the path
+        x_end, x_start, z_start = xs.pop(), xs[0], zs[0]
+        total = atan2(_dot(_cross(x_end, x_start), z_start), _dot(x_end, x_start))
+        xs = [_rotate_perpendicular(x, z, total * i / count) for i, (x, z) in enumerate(zip(xs, zs))]
+
+    matrices = []
+    for eye, x, z in zip(dest_points, xs, zs):
+        y = _cross(z, x)
+        matrices.append(((x[0], y[0], z[0], eye[0]),
+                         (x[1], y[1], z[1], eye[1]),
+                         (x[2], y[2], z[2], eye[2])))
+    return matrices
+
+def _double_reflect(a:Tuple3, b:Tuple3, r:Tuple3, t:Tuple3, next_t:Tuple3) -> Tuple3:
+    # Reflect reference vector r (& tangent t) at point a through the plane 
+    # bisecting a & b, then again through the plane that takes the reflected 
+    # tangent onto next_t. Returns the reference vector at b
+    v1 = _sub(b, a)
+    c1 = _dot(v1, v1)
+    if c1 == 0:
+        return r
+    r_l = _sub(r, _scaled(v1, 2 / c1 * _dot(v1, r)))
+    t_l = _sub(t, _scaled(v1, 2 / c1 * _dot(v1, t)))
+    v2 = _sub(next_t, t_l)
+    c2 = _dot(v2, v2)
+    if c2 == 0:
+        return r_l
+    return _sub(r_l, _scaled(v2, 2 / c2 * _dot(v2, r_l)))
+
+def _rotate_perpendicular(v:Tuple3, axis:Tuple3, theta:float) -> Tuple3:
+    # Rotate v around unit vector axis, which must be perpendicular to v
+    ct, st = cos(theta), sin(theta)
+    w = _cross(axis, v)
+    return (v[0] * ct + w[0] * st, v[1] * ct + w[1] * st, v[2] * ct + w[2] * st)
+
+# ===================
+# = Path resampling =
+# ===================
+def _resample_path(path:Sequence[Tuple3], 
+                   closed:bool=False,
+                   chord_tolerance:float=None, 
+                   max_bend:float=None) -> Tuple[List[Tuple3], List[float]]:
+    """
+    Merge nearly collinear runs of path, then subdivide segments next to 
+    sharp bends. Returns the new points and, for each, its position along 
+    the original path in units of original point indices
+    """
+    max_bend_rads = radians(max_bend) if max_bend is not None else None
+    points, params = _merge_collinear(path, closed, chord_tolerance, max_bend_rads)
+    return _subdivide_bends(path, points, params, closed, chord_tolerance, max_bend_rads)
+
+def _merge_collinear(path:Sequence[Tuple3], 
+                     closed:bool, 
+                     chord_tolerance:float=None, 
+                     max_bend_rads:float=None) -> Tuple[List[Tuple3], List[float]]:
+    count = len(path)
+    # The first and last points are always kept. Closed paths aren't merged
+    # across their closing segment, which would end back at the anchor
+    kept = [0]
+    anchor = 0
+    for i in range(1, count - 1):
+        if not _mergeable(path, anchor, i, i + 1, chord_tolerance, max_bend_rads):
+            kept.append(i)
+            anchor = i
+    if count > 1:
+        kept.append(count - 1)
+    if closed and len(kept) < 3 <= count:
+        # Keep the point farthest from the one remaining segment, so the
+        # path still encloses something
+        a, chord = path[0], _sub(path[-1], path[0])
+        kept.insert(1, max(range(1, count - 1), key=lambda k: _distance_to_segment_squared(path[k], a, chord)))
+    return [path[i] for i in kept], [float(i) for i in kept]
+
+def _mergeable(path:Sequence[Tuple3], 
+               anchor:int, 
+               i:int, 
+               j:int, 
+               chord_tolerance:float=None, 
+               max_bend_rads:float=None) -> bool:
+    # Can every point from anchor+1 up to i be dropped, replacing them with
+    # a single segment from path[anchor] to path[j]?
+    a = path[anchor]
+    chord = _sub(path[j], a)
+    if max_bend_rads is not None:
+        for k in range(anchor, i + 1):
+            segment = _sub(path[(k + 1) % len(path)], path[k])
+            if _bend_angle(segment, chord) >= max_bend_rads:
+                return False
+    if chord_tolerance is not None:
+        tol_sq = chord_tolerance**2
+        if any(_distance_to_segment_squared(path[k], a, chord) > tol_sq for k in range(anchor + 1, i + 1)):
+            return False
+    return True
+
+def _subdivide_bends(path:Sequence[Tuple3],
+                     points:List[Tuple3], 
+                     params:List[float], 
+                     closed:bool, 
+                     chord_tolerance:float=None, 
+                     max_bend_rads:float=None) -> Tuple[List[Tuple3], List[float]]:
+    count = len(points)
+    if count < 3:
+        return points, params
+
+    # Turning angle at each point; ends of an open path don't bend
+    bends = []
+    for i in range(count):
+        if not closed and i in (0, count - 1):
+            bends.append(0)
+        else:
+            prev_pt, next_pt = points[i - 1], points[(i + 1) % count]
+            bends.append(_bend_angle(_sub(points[i], prev_pt), _sub(next_pt, points[i])))
+
+    # A closed path's params wrap around to one past its last original point
+    end_param = len(path) if closed else None
+    new_points: List[Tuple3] = []
+    new_params: List[float] = []
+    segment_count = count if closed else count - 1
+    for i in range(segment_count):
+        j = (i + 1) % count
+        new_points.append(points[i])
+        new_params.append(params[i])
+
+        # A smooth curve through these points turns through roughly the 
+        # average of the bends at each end of the segment
+        turn = (bends[i] + bends[j]) / 2
+        pieces = 1
+        if max_bend_rads:
+            pieces = max(pieces, ceil(turn / max_bend_rads))
+        if chord_tolerance:
+            # Sagitta of an arc of length L turning through theta is about 
+            # L*theta/8; with n pieces each is (L/n)*(theta/n)/8
+            length = sqrt(_magnitude_squared(_sub(points[j], points[i])))
+            pieces = max(pieces, ceil(sqrt(length * turn / (8 * chord_tolerance))))
+        if pieces < 2:
+            continue
+
+        p0 = points[i - 1] if (closed or i > 0) else _sub(points[0], _sub(points[1], points[0]))
+        p3 = points[(i + 2) % count] if (closed or i + 2 < count) else _sub(points[j], _sub(points[i], points[j]))
+        start_param = params[i]
+        stop_param = params[j] if j else end_param
+        for k in range(1, pieces):
+            t = k / pieces
+            point = _catmull_rom(p0, points[i], points[j], p3, t)
+            if chord_tolerance:
+                # The curve swings wide of sharp corners; keep it within 
+                # chord_tolerance of the original path
+                straight = _lerp(points[i], points[j], t)
+                point = _limit_deviation(point, straight, path, start_param, stop_param, chord_tolerance)
+            new_points.append(point)
+            new_params.append(start_param + (stop_param - start_param) * t)
+
+    if not closed:
+        new_points.append(points[-1])
+        new_params.append(params[-1])
+    return new_points, new_params
+
+def _limit_deviation(point:Tuple3, 
+                     straight:Tuple3, 
+                     path:Sequence[Tuple3], 
+                     start_param:float, 
+                     stop_param:float, 
+                     tolerance:float) -> Tuple3:
+    # Move point towards straight, its position on the segment being 
+    # subdivided, until it's within tolerance of the original path between
+    # start_param & stop_param. straight itself is within tolerance, since 
+    # merged points are
+    segments = [(path[k % len(path)], _sub(path[(k + 1) % len(path)], path[k % len(path)])) 
+                for k in range(int(start_param), ceil(stop_param))]
+    tol_sq = tolerance**2
+
+    def near_path(p:Tuple3) -> bool:
+        return any(_distance_to_segment_squared(p, a, seg) <= tol_sq for a, seg in segments)
+
+    if near_path(point):
+        return point
+    # Bisect on the fraction of the way from straight to point
+    lo, hi = 0.0, 1.0
+    for _ in range(20):
+        mid = (lo + hi) / 2
+        if near_path(_lerp(straight, point, mid)):
+            lo = mid
+        else:
+            hi = mid
+    return _lerp(straight, point, lo)
+
+def _lerp(a:Tuple3, b:Tuple3, t:float) -> Tuple3:
+    return (a[0] + (b[0] - a[0]) * t, a[1] + (b[1] - a[1]) * t, a[2] + (b[2] - a[2]) * t)
+
+def _catmull_rom(p0:Tuple3, p1:Tuple3, p2:Tuple3, p3:Tuple3, t:float) -> Tuple3:
+    # Uniform Catmull-Rom segment from p1 (t=0) to p2 (t=1)
+    t2 = t * t
+    t3 = t2 * t
+    c0 = -t3 + 2 * t2 - t
+    c1 = 3 * t3 - 5 * t2 + 2
+    c2 = -3 * t3 + 4 * t2 + t
+    c3 = t3 - t2
+    return tuple((c0 * a + c1 * b + c2 * c + c3 * d) / 2 for a, b, c, d in zip(p0, p1, p2, p3)) # type: ignore
+
+def _bend_angle(a:Tuple3, b:Tuple3) -> float:
+    # Angle between consecutive segment vectors a & b; 0 for a straight path
+    cross = _cross(a, b)
+    return atan2(sqrt(_magnitude_squared(cross)), _dot(a, b))
+
+def _distance_to_segment_squared(p:Tuple3, start:Tuple3, segment:Tuple3) -> float:
+    seg_sq = _magnitude_squared(segment)
+    offset = _sub(p, start)
+    t = _dot(offset, segment) / seg_sq if seg_sq else 0
+    t = min(1, max(0, t))
+    return _magnitude_squared(_sub(offset, _scaled(segment, t)))
@@ -1,9 +1,11 @@
 """
 Classes for OpenSCAD builtins
 """
+import os
+import weakref
 from pathlib import Path
 from types import SimpleNamespace
-from typing import Dict, Optional, Sequence, Tuple, Union, List
+from typing import Callable, Dict, Optional, Sequence, Tuple, Union, List
 
 from .solidpython import IncludedOpenSCADObject, OpenSCADObject
 
@@ -24,6 +26,10 @@ OpenSCADObjectPlus = Union[OpenSCADObject, Sequence[OpenSCADObject]]
 
 IMPORTED_SCAD_MODULES: Dict[Path, SimpleNamespace] = {}
 
+# Library path lookups are cached; see solidpython.clear_include_path_cache()
+_library_paths: Dict[Tuple[str, Optional[str]], List[Path]] = {}
+_found_libraries: Dict[str, Path] = {}
+
 class polygon(OpenSCADObject):
     """
     Create a polygon with the specified points and paths.
@@ -757,11 +763,25 @@ def disable(openscad_obj: OpenSCADObject) -> OpenSCADObject:
 # ===========================
 # = IMPORTING OPENSCAD CODE =
 # ===========================
-def import_scad(scad_file_or_dir: PathStr) -> SimpleNamespace:
+def import_scad(scad_file_or_dir: PathStr, parallel: bool = False, lazy: bool = False) -> SimpleNamespace:
     '''
     Recursively look in current directory & OpenSCAD library directories for
         OpenSCAD files. Create Python mappings for all OpenSCAD modules & functions
     Return a namespace or raise ValueError if no scad files found
+
+    If `parallel` is True, all .scad files found under a directory are parsed
+    in a pool of worker processes before namespaces are built. The resulting
+    namespace is identical to the serial one; this just speeds up imports of
+    large libraries (BOSL2, NopSCADlib, MCAD, etc.). On platforms that start 
+    worker processes by spawning (Windows, macOS), a script that calls 
+    `import_scad(..., parallel=True)` at module level must do so under an
+    `if __name__ == '__main__':` guard, as with any multiprocessing code.
+
+    If `lazy` is True, only the directory structure is scanned up front. 
+    Each .scad file is parsed the first time an attribute is looked up in 
+    its namespace, so startup time depends on the files a script actually 
+    uses rather than the size of the library. `parallel` is ignored when 
+    `lazy` is True.
     '''
     global IMPORTED_SCAD_MODULES
     
@@ -776,13 +796,17 @@ def import_scad(scad_file_or_dir: PathStr) -> SimpleNamespace:
             candidates = [d/scad for d in _openscad_library_paths()]
 
         for candidate_path in candidates:
-            namespace = _import_scad(candidate_path)
+            if lazy:
+                namespace = _import_scad_lazy(candidate_path)
+            else:
+                parsed = _parse_scad_files_parallel(candidate_path) if parallel else None
+                namespace = _import_scad(candidate_path, parsed)
             if namespace is not None:
                 IMPORTED_SCAD_MODULES[scad] = namespace
                 return namespace
     raise ValueError(f'Could not find .scad files at or under {scad}. \nLocations searched were: {candidates}')
 
-def _import_scad(scad: Path) -> Optional[SimpleNamespace]:
+def _import_scad(scad: Path, parsed: Optional[Dict[Path, List[dict]]] = None) -> Optional[SimpleNamespace]:
     '''
     cases:
         single scad file:
@@ -792,13 +816,21 @@ def _import_scad(scad: Path) -> Optional[SimpleNamespace]:
             return namespace if scad files are underneath, otherwise None
         non-scad file:
             return None            
+
+    `parsed` optionally maps absolute .scad paths to the results of
+    `parse_scad_callables()`, so files parsed elsewhere aren't parsed again
     '''
     namespace: Optional[SimpleNamespace] = None
     if scad.is_file() and scad.suffix == '.scad':
-        namespace = SimpleNamespace()
-        use(scad.absolute(), dest_namespace_dict=namespace.__dict__)
+        namespace = SCADNamespace()
+        scad_path = scad.absolute()
+        symbols_dicts = parsed.get(scad_path) if parsed else None
+        if symbols_dicts is None:
+            from .solidpython import parse_scad_callables
+            symbols_dicts = parse_scad_callables(scad_path)
+        _add_scad_classes(scad_path, symbols_dicts, True, namespace.__dict__, namespace)
     elif scad.is_dir():
-        subspaces = [(f, _import_scad(f)) for f in scad.iterdir() if f.is_dir() or f.suffix == '.scad']
+        subspaces = [(f, _import_scad(f, parsed)) for f in scad.iterdir() if f.is_dir() or f.suffix == '.scad']
         for f, subspace in subspaces:
             if subspace:
                 if namespace is None:
@@ -813,18 +845,129 @@ def _import_scad(scad: Path) -> Optional[SimpleNamespace]:
                 setattr(namespace, package_name, subspace)
 
     return namespace
+
+class SCADNamespace(SimpleNamespace):
+    '''
+    A namespace for a single imported .scad file. Unlike a plain
+    SimpleNamespace it can be weakly referenced, so tracking it for
+    `refresh_scad_imports()` doesn't keep it alive
+    '''
+    __slots__ = ('__weakref__',)
+
+class LazySCADNamespace(SCADNamespace):
+    '''
+    A namespace for a single .scad file. The file isn't parsed and its
+    classes aren't created until an attribute is first looked up.
+    '''
+    # Slots keep our bookkeeping out of the namespace's __dict__, which
+    # holds only the generated classes, just like a SimpleNamespace
+    __slots__ = ('_scad_path', '_loaded')
+
+    def __init__(self, scad_path: Path):
+        super().__init__()
+        self._scad_path = scad_path
+        self._loaded = False
+
+    def _load(self):
+        if not self._loaded:
+            from .solidpython import parse_scad_callables
+            symbols_dicts = parse_scad_callables(self._scad_path)
+            _add_scad_classes(self._scad_path, symbols_dicts, True, self.__dict__, self)
+            # Only once the file has loaded, so a failed load is tried again
+            self._loaded = True
+
+    def __reduce__(self):
+        # SimpleNamespace's __reduce__ would call __init__ without a path and
+        # lose our slots; copies share the already generated classes
+        return (type(self), (self._scad_path,), (dict(self.__dict__), {'_loaded': self._loaded}))
+
+    def __getattr__(self, name: str):
+        # Only called when normal lookup fails, i.e. for names not yet loaded.
+        # Dunder lookups (from copy, pickle, etc.) never load the file, but 
+        # renamed SCAD identifiers like $foo => __foo do
+        if (name.startswith('__') and name.endswith('__')) or self._loaded:
+            raise AttributeError(f"'{self._scad_path.name}' has no attribute '{name}'")
+        self._load()
+        return getattr(self, name)
+
+    def __dir__(self):
+        self._load()
+        return super().__dir__()
+
+    def __repr__(self):
+        if not self._loaded:
+            return f'{type(self).__name__}(<{self._scad_path.as_posix()}, not loaded>)'
+        return super().__repr__()
+
+def _import_scad_lazy(scad: Path) -> Optional[SimpleNamespace]:
+    '''
+    Same as `_import_scad()`, but returns LazySCADNamespaces for .scad files
+    rather than parsing them immediately
+    '''
+    namespace: Optional[SimpleNamespace] = None
+    if scad.is_file() and scad.suffix == '.scad':
+        namespace = LazySCADNamespace(scad.absolute())
+    elif scad.is_dir():
+        for f in scad.iterdir():
+            if not (f.is_dir() or f.suffix == '.scad'):
+                continue
+            subspace = _import_scad_lazy(f)
+            if subspace:
+                if namespace is None:
+                    namespace = SimpleNamespace()
+                package_name = f.stem
+                if package_name[0].isdigit():
+                    package_name = '_' + package_name
+                setattr(namespace, package_name, subspace)
+
+    return namespace
+
+def _scad_files_under(scad: Path) -> List[Path]:
+    '''
+    Return absolute paths to all .scad files at or under `scad`, in the same 
+    order `_import_scad()` would visit them
+    '''
+    if scad.is_file() and scad.suffix == '.scad':
+        return [scad.absolute()]
+    elif scad.is_dir():
+        return [p for f in scad.iterdir() for p in _scad_files_under(f)]
+    return []
+
+def _parse_scad_files_parallel(scad: Path, max_workers: int = None) -> Dict[Path, List[dict]]:
+    '''
+    Parse every .scad file at or under `scad` in a process pool.
+    Parsing is CPU-bound PLY work, so separate processes sidestep the GIL.
+    Classes are still generated in this process by `_import_scad()`
+    '''
+    from concurrent.futures import ProcessPoolExecutor
+    from .solidpython import parse_scad_callables
+
+    scad_files = _scad_files_under(scad)
+    # No sense in starting a pool for one file
+    if len(scad_files) < 2:
+        return {}
+
+    workers = max_workers or os.cpu_count() or 1
+    chunksize = max(1, len(scad_files) // (4 * workers))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        symbols = executor.map(parse_scad_callables, scad_files, chunksize=chunksize)
+        return dict(zip(scad_files, symbols))
    
 def _openscad_library_paths() -> List[Path]:
     """
     Return system-dependent OpenSCAD library paths or paths defined in os.environ['OPENSCADPATH']
     """
     import platform
-    import os
     import re
 
+    user_path = os.environ.get('OPENSCADPATH')
+    key = (platform.system(), user_path)
+    cached = _library_paths.get(key)
+    if cached is not None:
+        return cached[:]
+
     paths = [Path('.')]
 
-    user_path = os.environ.get('OPENSCADPATH')
     if user_path:
         for s in re.split(r'\s*[;:]\s*', user_path):
             paths.append(Path(s))
@@ -845,19 +988,25 @@ def _openscad_library_paths() -> List[Path]:
     }
 
     paths += default_paths.get(platform.system(), [])
-    return paths
+    _library_paths[key] = paths
+    return paths[:]
 
 
 def _find_library(library_name: PathStr) -> Path:
     result = Path(library_name)
 
     if not result.is_absolute():
+        found = _found_libraries.get(str(library_name))
+        if found is not None:
+            return found
+
         paths = _openscad_library_paths()
         for p in paths:
             f = p / result
             # print(f'Checking {f} -> {f.exists()}')
             if f.exists():
                 result = f
+                _found_libraries[str(library_name)] = f
                 break
 
     return result
@@ -877,30 +1026,162 @@ def use(scad_file_path: PathStr, use_not_include: bool = True, dest_namespace_di
     # These functions in solidpython are used here and only here; don't pollute
     # the global namespace with them
     from .solidpython import parse_scad_callables
-    from .solidpython import new_openscad_class_str
     from .solidpython import calling_module
 
     scad_file_path = _find_library(scad_file_path) 
 
     symbols_dicts = parse_scad_callables(scad_file_path)
 
+    # If this is called from 'include', we have to look deeper in the stack
+    # to find the right module to add the new class to.
+    owner = None
+    if dest_namespace_dict is None:
+        stack_depth = 2 if use_not_include else 3
+        owner = calling_module(stack_depth)
+        dest_namespace_dict = owner.__dict__
+
+    _add_scad_classes(scad_file_path, symbols_dicts, use_not_include, dest_namespace_dict, owner)
+    return True
+
+def _add_scad_classes(scad_file_path: Path, 
+                      symbols_dicts: List[dict], 
+                      use_not_include: bool, 
+                      dest_namespace_dict: Dict,
+                      owner: object = None):
+    """
+    Create an IncludedOpenSCADObject subclass in dest_namespace_dict for each 
+    of the callables in symbols_dicts, as returned by `parse_scad_callables()`.
+    `owner` is the module or namespace whose __dict__ is dest_namespace_dict, 
+    if any
+    """
+    classes = _new_scad_classes(scad_file_path, symbols_dicts, use_not_include, 
+                                dest_namespace_dict.get('__name__', __name__))
+    dest_namespace_dict.update(classes)
+    _track_scad_file(scad_file_path, symbols_dicts, list(classes), use_not_include, 
+                     dest_namespace_dict, owner)
+
+def _new_scad_classes(scad_file_path: Path, 
+                      symbols_dicts: List[dict], 
+                      use_not_include: bool, 
+                      module_name: str) -> Dict[str, type]:
+    from .solidpython import new_openscad_class
+
+    classes: Dict[str, type] = {}
+    include_file_path = scad_file_path.as_posix()
     for sd in symbols_dicts:
-        class_str = new_openscad_class_str(sd['name'], sd['args'], sd['kwargs'],
-                                           scad_file_path.as_posix(), use_not_include)
-        # If this is called from 'include', we have to look deeper in the stack
-        # to find the right module to add the new class to.
-        if dest_namespace_dict is None:
-            stack_depth = 2 if use_not_include else 3
-            dest_namespace_dict = calling_module(stack_depth).__dict__
         try:
-            exec(class_str, dest_namespace_dict)
+            cls = new_openscad_class(sd['name'], sd['args'], sd['kwargs'],
+                                     include_file_path, use_not_include, module_name)
+            classes[cls.__name__] = cls
         except Exception as e:
             classname = sd['name']
             msg = f"Unable to import SCAD module: `{classname}` from `{scad_file_path.name}`, with error: {e}"
             print(msg)
-
-    return True
+    return classes
 
 def include(scad_file_path: PathStr) -> bool:
     return use(scad_file_path, use_not_include=False)
 
+# ===========================
+# = Refreshing edited files =
+# ===========================
+# Every .scad file that classes were created from is recorded, so 
+# `refresh_scad_imports()` can find edited files and re-create only their 
+# classes. Maps absolute path => a list of imports of that file, one for 
+# each namespace it was imported into. Each import is a dict of:
+#   'namespace':        callable returning the namespace dict, or None 
+#                       once the namespace's owner has been collected
+#   'use_not_include':  as passed to `use()`
+#   'mtime', 'digest':  the file's mtime and SHA-1 when it was parsed
+#   'symbols', 'names': its `parse_scad_callables()` results, and the 
+#                       names of the classes created from them
+_scad_file_records: Dict[Path, List[dict]] = {}
+
+def _scad_file_digest(scad_file_path: Path) -> str:
+    import hashlib
+    return hashlib.sha1(scad_file_path.read_bytes()).hexdigest()
+
+def _namespace_ref(dest_namespace_dict: Dict, owner: object = None) -> Callable[[], Optional[Dict]]:
+    if owner is None:
+        # Plain dicts can't be weakly referenced; the caller owns them
+        return lambda: dest_namespace_dict
+    owner_ref = weakref.ref(owner)
+    return lambda: getattr(owner_ref(), '__dict__', None)
+
+def _track_scad_file(scad_file_path: Path, 
+                     symbols_dicts: List[dict],
+                     names: List[str], 
+                     use_not_include: bool, 
+                     dest_namespace_dict: Dict,
+                     owner: object = None):
+    path = Path(scad_file_path).absolute()
+    imports = _scad_file_records.setdefault(path, [])
+    record = next((r for r in imports if r['namespace']() is dest_namespace_dict), None)
+    if record is None:
+        record = {'namespace': _namespace_ref(dest_namespace_dict, owner)}
+        imports.append(record)
+    # The file was just parsed, so this is the version any later changes 
+    # are compared against, even if it was imported here before
+    record.update(use_not_include=use_not_include,
+                  mtime=path.stat().st_mtime_ns, 
+                  digest=_scad_file_digest(path), 
+                  symbols=symbols_dicts, 
+                  names=names)
+
+def refresh_scad_imports() -> List[Path]:
+    """
+    Look for changes in every .scad file imported with `import_scad()`, 
+    `use()` or `include()`. Re-parse files whose contents have changed and 
+    replace their classes in the namespaces they were imported into. 
+    Unchanged files (same mtime, same contents, or the same callables) keep 
+    their classes.
+
+    Files that can't be read or parsed are reported and tried again on the 
+    next refresh. Objects created before the refresh keep their original class.
+    Returns the paths of the files that were re-imported
+    """
+    from .solidpython import parse_scad_callables
+
+    refreshed: List[Path] = []
+    for path, imports in list(_scad_file_records.items()):
+        imports[:] = [r for r in imports if r['namespace']() is not None]
+        if not imports:
+            # Everything imported from this file has been garbage collected
+            del _scad_file_records[path]
+            continue
+
+        try:
+            mtime = path.stat().st_mtime_ns
+            stale = [r for r in imports if r['mtime'] != mtime]
+            if not stale:
+                continue
+            digest = _scad_file_digest(path)
+            if all(r['digest'] == digest for r in stale):
+                symbols_dicts = None
+            else:
+                symbols_dicts = parse_scad_callables(path)
+        except Exception as e:
+            print(f"Unable to refresh SCAD file: `{path}`, with error: {e}")
+            continue
+
+        # Only note the new fingerprint once the file has parsed, so a failed
+        # refresh is tried again next time
+        replaced = False
+        for record in stale:
+            same_contents = record['digest'] == digest
+            record.update(mtime=mtime, digest=digest)
+            if same_contents or record['symbols'] == symbols_dicts:
+                continue
+
+            dest_namespace_dict = record['namespace']()
+            for name in record['names']:
+                dest_namespace_dict.pop(name, None)
+            classes = _new_scad_classes(path, symbols_dicts, record['use_not_include'], 
+                                        dest_namespace_dict.get('__name__', __name__))
+            dest_namespace_dict.update(classes)
+            record.update(symbols=symbols_dicts, names=list(classes))
+            replaced = True
+        if replaced:
+            refreshed.append(path)
+
+    return refreshed
@@ -0,0 +1,245 @@
+#! /usr/bin/env python
+from array import array
+from itertools import chain
+from math import cos, sin, sqrt
+from operator import add, mul, sub, truediv
+
+from typing import Any, Iterable, Iterator, List, Sequence, Tuple, Union
+
+Tuple3 = Tuple[float, float, float]
+PointTuple = Union[Tuple[float, float], Tuple3]
+# A single vector (tuple or euclid3 object), or a PointArray of the same length
+VectorOrArray = Union[Sequence[float], 'PointArray']
+
+# ===============
+# = Point array =
+# ===============
+# euclid3's Point3/Vector3 are full Python objects, so a million-point
+# pipeline allocates a million objects at every step. A PointArray keeps
+# all coordinates in one flat array('d') instead, and its vector operations
+# work a coordinate column at a time, returning new PointArrays.
+class PointArray:
+    """
+    A list of 2D or 3D points or vectors, stored as a flat array('d') of
+    coordinates: [x0, y0, z0, x1, y1, z1, ...].
+
+    points may be any iterable of points (tuples, lists, euclid3 objects),
+    another PointArray, or a NumPy array of shape (N, dimensions). 3D
+    points have their z-values dropped when dimensions is 2, and 2D points
+    get z == 0 when dimensions is 3, as with euclidify().
+
+    Indexing and iterating yield tuples, and a PointArray renders in
+    OpenSCAD as a list of points, so it can be passed directly as
+    e.g. polygon(points=...). With NumPy, `np.frombuffer(pa.data)` views the
+    coordinates without copying them.
+    """
+    __slots__ = ('data', 'dimensions')
+
+    def __init__(self, points: Iterable[Any] = (), dimensions: int = 3):
+        if dimensions not in (2, 3):
+            raise ValueError(f'PointArray dimensions must be 2 or 3, not {dimensions}')
+        self.dimensions = dimensions
+        if isinstance(points, PointArray):
+            if points.dimensions == dimensions:
+                self.data = array('d', points.data)
+            else:
+                self.data = PointArray._from_columns(points._columns(dimensions)).data
+            return
+
+        if hasattr(points, 'ndim') and hasattr(points, 'tobytes') and points.ndim == 2 \
+                and points.shape[1] == dimensions: # type: ignore
+            # NumPy arrays, copied in one go without importing NumPy here
+            self.data = array('d')
+            self.data.frombytes(points.astype('d').tobytes()) # type: ignore
+            return
+
+        if not isinstance(points, (list, tuple)):
+            points = list(points)
+        if all(len(p) == dimensions for p in points):
+            self.data = array('d', chain.from_iterable(points))
+        else:
+            self.data = array('d', chain.from_iterable(_resized(p, dimensions) for p in points))
+
+    @classmethod
+    def from_flat(cls, data: Iterable[float], dimensions: int = 3) -> 'PointArray':
+        """
+        Return a PointArray of the flat coordinates in data. An array('d') is
+        used as is, not copied
+        """
+        result = cls.__new__(cls)
+        result.dimensions = dimensions
+        result.data = data if isinstance(data, array) and data.typecode == 'd' else array('d', data)
+        if len(result.data) % dimensions:
+            raise ValueError(f'{len(result.data)} coordinates is not a whole number of {dimensions}D points')
+        return result
+
+    @classmethod
+    def _from_columns(cls, columns: Sequence[Iterable[float]]) -> 'PointArray':
+        # Interleave per-axis columns into flat coordinates
+        dimensions = len(columns)
+        columns = [c if isinstance(c, array) else array('d', c) for c in columns]
+        data = array('d', bytes(8 * dimensions * len(columns[0])))
+        for axis, column in enumerate(columns):
+            data[axis::dimensions] = column
+        return cls.from_flat(data, dimensions)
+
+    def _columns(self, dimensions: int = None) -> List[array]:
+        # Per-axis coordinates; a missing z column is all zeros
+        dimensions = dimensions or self.dimensions
+        columns = [self.data[axis::self.dimensions] for axis in range(min(dimensions, self.dimensions))]
+        if dimensions > self.dimensions:
+            columns.append(array('d', bytes(8 * len(self))))
+        return columns
+
+    # === Sequence ===
+    def __len__(self) -> int:
+        return len(self.data) // self.dimensions
+
+    def __iter__(self) -> Iterator[PointTuple]:
+        # zip() on one iterator groups flat values into points
+        return zip(*[iter(self.data)] * self.dimensions)
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[PointTuple, 'PointArray']:
+        d = self.dimensions
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step == 1:
+                return PointArray.from_flat(self.data[start * d:stop * d], d)
+            return PointArray._from_columns([c[index] for c in self._columns()])
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('PointArray index out of range')
+        return tuple(self.data[index * d:index * d + d])
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, PointArray):
+            return NotImplemented
+        return self.dimensions == other.dimensions and self.data == other.data
+
+    __hash__ = None # type: ignore
+
+    def __repr__(self) -> str:
+        return f'PointArray({self.tuples()!r}, dimensions={self.dimensions})'
+
+    def tuples(self) -> List[PointTuple]:
+        return list(self)
+
+    def as_arr(self) -> List[List[float]]:
+        # Same format as euc_to_arr() on a list of euclid3 objects
+        return [list(p) for p in self]
+
+    # === Vector math ===
+    def __add__(self, other: VectorOrArray) -> 'PointArray':
+        return self._elementwise(add, other)
+
+    def __sub__(self, other: VectorOrArray) -> 'PointArray':
+        return self._elementwise(sub, other)
+
+    def __neg__(self) -> 'PointArray':
+        return PointArray.from_flat(array('d', [-v for v in self.data]), self.dimensions)
+
+    def __mul__(self, factor: float) -> 'PointArray':
+        return self.scale(factor)
+
+    __rmul__ = __mul__
+
+    def scale(self, factor: Union[float, Sequence[float]]) -> 'PointArray':
+        """
+        Return these points multiplied by factor, either a number or a
+        per-axis vector
+        """
+        if isinstance(factor, (int, float)):
+            return PointArray.from_flat(array('d', [v * factor for v in self.data]), self.dimensions)
+        factor = _resized(factor, self.dimensions)
+        return PointArray._from_columns([[v * f for v in c] for c, f in zip(self._columns(), factor)])
+
+    def dot(self, other: VectorOrArray) -> array:
+        """Dot product of each point with other, as an array('d')"""
+        products = [list(map(mul, a, b)) for a, b in zip(self._columns(), self._other_columns(other))]
+        return array('d', map(sum, zip(*products)))
+
+    def cross(self, other: VectorOrArray) -> 'PointArray':
+        """
+        Cross product of each vector with other. The result is always 3D;
+        2D vectors have z == 0
+        """
+        ax, ay, az = self._columns(3)
+        bx, by, bz = _other_columns(other, 3, len(self))
+        return PointArray._from_columns([
+            [y * w - z * v for y, z, v, w in zip(ay, az, by, bz)],
+            [-x * w + z * u for x, z, u, w in zip(ax, az, bx, bz)],
+            [x * v - y * u for x, y, u, v in zip(ax, ay, bx, by)],
+        ])
+
+    def magnitudes(self) -> array:
+        """Length of each vector, as an array('d')"""
+        columns = self._columns()
+        if self.dimensions == 2:
+            return array('d', [sqrt(x * x + y * y) for x, y in zip(*columns)])
+        return array('d', [sqrt(x * x + y * y + z * z) for x, y, z in zip(*columns)])
+
+    def normalized(self) -> 'PointArray':
+        """Unit vectors in the direction of each vector. Zero vectors stay zero"""
+        lengths = [m or 1.0 for m in self.magnitudes()]
+        return PointArray._from_columns([list(map(truediv, c, lengths)) for c in self._columns()])
+
+    def rotate_around(self, axis: Sequence[float], theta: float) -> 'PointArray':
+        """
+        Return these 3D vectors rotated around axis through angle theta,
+        in radians, with the same arithmetic as euclid3's Vector3.rotate_around()
+        """
+        u, v, w = _resized(axis, 3)
+        r2 = u**2 + v**2 + w**2
+        r = sqrt(r2)
+        ct = cos(theta)
+        st = sin(theta) / r
+        k = (1 - ct) / r2
+        xs, ys, zs = self._columns(3)
+        dts = [(u * x + v * y + w * z) * k for x, y, z in zip(xs, ys, zs)]
+        return PointArray._from_columns([
+            [u * dt + x * ct + (-w * y + v * z) * st for x, y, z, dt in zip(xs, ys, zs, dts)],
+            [v * dt + y * ct + (w * x - u * z) * st for x, y, z, dt in zip(xs, ys, zs, dts)],
+            [w * dt + z * ct + (-v * x + u * y) * st for x, y, z, dt in zip(xs, ys, zs, dts)],
+        ])
+
+    def transform(self, matrix: Any) -> 'PointArray':
+        """
+        Return these points transformed by an affine matrix: a euclid3
+        Matrix4, or nested rows of which only the top three are used (e.g.
+        the Matrix34s from utils.look_at_matrices()). The result is 3D
+        """
+        if hasattr(matrix, 'm') and hasattr(matrix, 'p'):
+            # euclid3 Matrix4
+            m = matrix
+            rows = [(m.a, m.b, m.c, m.d), (m.e, m.f, m.g, m.h), (m.i, m.j, m.k, m.l)]
+        else:
+            rows = [tuple(row) for row in matrix][:3]
+        xs, ys, zs = self._columns(3)
+        return PointArray._from_columns([[a * x + b * y + c * z + d for x, y, z in zip(xs, ys, zs)]
+                                         for a, b, c, d in rows])
+
+    def _elementwise(self, op: Any, other: VectorOrArray) -> 'PointArray':
+        if isinstance(other, PointArray) and other.dimensions == self.dimensions:
+            if len(other) != len(self):
+                raise ValueError(f'PointArrays have different lengths: {len(self)} and {len(other)}')
+            return PointArray.from_flat(array('d', map(op, self.data, other.data)), self.dimensions)
+        return PointArray._from_columns([list(map(op, a, b)) for a, b in zip(self._columns(), self._other_columns(other))])
+
+    def _other_columns(self, other: VectorOrArray) -> List[Iterable[float]]:
+        return _other_columns(other, self.dimensions, len(self))
+
+def _other_columns(other: VectorOrArray, dimensions: int, length: int) -> List[Iterable[float]]:
+    # Columns of a PointArray, or a single vector repeated as columns
+    if isinstance(other, PointArray):
+        if len(other) != length:
+            raise ValueError(f'PointArrays have different lengths: {length} and {len(other)}')
+        return other._columns(dimensions) # type: ignore
+    return [array('d', [c]) * length for c in _resized(other, dimensions)]
+
+def _resized(point: Iterable[float], dimensions: int) -> PointTuple:
+    # Drop z, or add z == 0, so point has `dimensions` coordinates
+    point = tuple(point)
+    if len(point) < dimensions:
+        return point + (0.0,) * (dimensions - len(point)) # type: ignore
+    return point[:dimensions] # type: ignore
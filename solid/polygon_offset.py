@@ -0,0 +1,434 @@
+#! /usr/bin/env python
+from math import atan2, ceil, cos, floor, pi, sin, sqrt
+
+from solid import polygon, OpenSCADObject
+from euclid3 import Point2, Point3
+
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+Tuple2 = Tuple[float, float]
+Point23Input = Union[Point2, Point3, Tuple[float, float], Tuple[float, float, float]]
+# A single path of points, or a list of paths (e.g. an outline and its holes)
+PathsInput = Union[Sequence[Point23Input], Sequence[Sequence[Point23Input]]]
+Path = List[Tuple2]
+# Raw offset segment: (start x, start y, end x, end y)
+Segment = Tuple[float, float, float, float]
+
+MITER, ROUND, CHAMFER = 'miter', 'round', 'chamfer'
+JOINS = (MITER, ROUND, CHAMFER)
+
+DEFAULT_MITER_LIMIT = 2.0
+SEGMENTS = 32
+
+# ==================
+# = Polygon offset =
+# ==================
+# Offsetting works like Clipper's: each edge is moved `delta` along its
+# outward normal and neighboring edges are joined, which yields a raw
+# outline that loops over itself wherever the offset overlaps. The raw outline
+# is split at its self-intersections into simple loops, and only loops
+# bounding the area the raw outline winds around a positive number of times
+# are kept.
+def offset_polygon(paths: PathsInput,
+                   delta: float,
+                   join: str = MITER,
+                   miter_limit: float = DEFAULT_MITER_LIMIT,
+                   segments: int = SEGMENTS) -> OpenSCADObject:
+    """
+    Return an OpenSCAD polygon() of `paths` offset by `delta`; see
+    offset_polygon_points() for arguments. Holes in the result are
+    included as extra polygon paths.
+
+    This computes the same shape as OpenSCAD's native offset(), but in
+    Python, so the resulting points are available without rendering.
+    """
+    loops = offset_polygon_points(paths, delta, join, miter_limit, segments)
+    points: Path = []
+    polygon_paths: List[List[int]] = []
+    for loop in loops:
+        polygon_paths.append(list(range(len(points), len(points) + len(loop))))
+        points += loop
+    return polygon(points=points, paths=polygon_paths)
+
+def offset_polygon_points(paths: PathsInput,
+                          delta: float,
+                          join: str = MITER,
+                          miter_limit: float = DEFAULT_MITER_LIMIT,
+                          segments: int = SEGMENTS) -> List[Path]:
+    """
+    Offset the polygon described by `paths` by `delta`, and return the
+    resulting outlines as lists of (x, y) tuples.
+
+    -- paths may be one path of points, or a list of paths, such as an
+        outline followed by its holes. Holes must wind opposite to their
+        outline. Points may be 2- or 3-tuples, Point2s or Point3s; Z values
+        are ignored.
+    -- positive `delta` grows the polygon and negative `delta` shrinks it,
+        whichever way the paths wind. The largest path decides which
+        direction counts as outward.
+    -- join is one of 'miter', 'round' or 'chamfer' and sets how corners
+        that move apart are filled in. Miters reaching further than 
+        miter_limit * delta from their corner are cut off square at that
+        distance. Round joins use `segments` segments per full circle.
+
+    Concave corners and areas where the offset overlaps itself are cleaned
+    up, so the result may contain more or fewer outlines than `paths` did
+    (e.g. a shrunk dumbbell splits in two). Outlines wind the same way as
+    the largest input path, and holes wind the opposite way.
+    """
+    if join not in JOINS:
+        raise ValueError(f'join must be one of {JOINS}, not {join!r}')
+
+    clean_paths = [p for p in (_clean_path(p) for p in _as_paths(paths)) if len(p) > 2]
+    if not clean_paths:
+        return []
+
+    # Work with the largest path counterclockwise, so each edge's
+    # outward normal is on its right
+    largest = max(clean_paths, key=lambda p: abs(signed_area(p)))
+    reverse = signed_area(largest) < 0
+    if reverse:
+        clean_paths = [p[::-1] for p in clean_paths]
+
+    raw_paths = [_raw_offset(p, delta, join, miter_limit, segments) for p in clean_paths]
+    loops = _positive_loops([_clean_path(p) for p in raw_paths])
+
+    if reverse:
+        loops = [loop[::-1] for loop in loops]
+    return loops
+
+def signed_area(points: Sequence[Point23Input]) -> float:
+    """
+    Return the area of the polygon through `points`; positive if they run
+    counterclockwise, negative if they run clockwise
+    """
+    total = 0.0
+    prev = points[-1]
+    for p in points:
+        total += prev[0] * p[1] - p[0] * prev[1]
+        prev = p
+    return total / 2
+
+def is_counterclockwise(points: Sequence[Point23Input]) -> bool:
+    return signed_area(points) > 0
+
+def winding_number(point: Point23Input, points: Sequence[Point23Input]) -> int:
+    """
+    Return the number of times the closed path through `points` winds
+    counterclockwise around `point`; 0 for points outside the path
+    """
+    px, py = point[0], point[1]
+    winding = 0
+    prev = points[-1]
+    for p in points:
+        winding += _crossing(prev[0], prev[1], p[0], p[1], px, py)
+        prev = p
+    return winding
+
+def point_in_polygon(point: Point23Input, paths: PathsInput) -> bool:
+    """
+    Return True if `point` is inside the polygon described by `paths`,
+    a single path or an outline and its holes, by the nonzero winding rule
+    """
+    return sum(winding_number(point, p) for p in _as_paths(paths)) != 0
+
+# =========
+# = Joins =
+# =========
+def _raw_offset(path: Path, delta: float, join: str, miter_limit: float, segments: int) -> Path:
+    # Offset every edge of counterclockwise path along its right-hand normal,
+    # and join neighboring edges at each vertex. Wherever the offset edges
+    # overlap, the result loops over itself; _positive_loops() removes that
+    if delta == 0:
+        return list(path)
+    count = len(path)
+    dirs = []
+    for i in range(count):
+        (x0, y0), (x1, y1) = path[i], path[(i + 1) % count]
+        dx, dy = x1 - x0, y1 - y0
+        length = sqrt(dx * dx + dy * dy)
+        dirs.append((dx / length, dy / length, length))
+
+    dist = abs(delta)
+    sign = 1 if delta > 0 else -1
+    # Miters reach dist / cos(half the turn) from their corner,
+    # so 1 + cos(turn) must be at least this
+    min_miter_cos = 2 / (miter_limit * miter_limit)
+    shortcuts = _inner_shortcuts(path, dirs, dist, sign)
+    result: Path = []
+    for i, (vx, vy) in enumerate(path):
+        ax, ay, a_len = dirs[i - 1]
+        bx, by, b_len = dirs[i]
+        # Unit vectors from the vertex to the incoming & outgoing offset edges
+        u1x, u1y = ay * sign, -ax * sign
+        u2x, u2y = by * sign, -bx * sign
+        cross = ax * by - ay * bx
+        dot = ax * bx + ay * by
+        p1 = (vx + u1x * dist, vy + u1y * dist)
+        p2 = (vx + u2x * dist, vy + u2y * dist)
+
+        if cross * sign > 0 or (cross == 0 and dot < 0):
+            # The offset edges move apart here and need a join
+            if join == ROUND:
+                turn = atan2(cross, dot) if cross else pi * sign
+                steps = ceil(abs(turn) / (2 * pi) * segments)
+                if steps < 2:
+                    result += [p1, p2]
+                    continue
+                start = atan2(u1y, u1x)
+                result += [(vx + dist * cos(start + turn * k / steps),
+                            vy + dist * sin(start + turn * k / steps)) for k in range(steps + 1)]
+            elif join == CHAMFER:
+                result += [p1, p2]
+            elif 1 + dot >= min_miter_cos:
+                miter = dist / (1 + dot)
+                result.append((vx + (u1x + u2x) * miter, vy + (u1y + u2y) * miter))
+            else:
+                # Cut the miter off square, miter_limit * dist from the vertex
+                mx, my = u1x + u2x, u1y + u2y
+                m_len = sqrt(mx * mx + my * my)
+                if m_len > 1e-12:
+                    mx, my = mx / m_len, my / m_len
+                else:
+                    # The path doubles back, so the miter points straight ahead
+                    mx, my = ax, ay
+                extend = (miter_limit - (u1x * mx + u1y * my)) * dist / (ax * mx + ay * my)
+                result += [(p1[0] + ax * extend, p1[1] + ay * extend),
+                           (p2[0] - bx * extend, p2[1] - by * extend)]
+        elif shortcuts[i]:
+            # The offset edges cross here, and trimming both of them back to
+            # where they cross leaves them pointing the way their source edges do
+            result.append(shortcuts[i][0])
+        else:
+            # Go around through the vertex, as Clipper does, and let the 
+            # cleanup remove the resulting loop
+            result += [p1, (vx, vy), p2]
+    return result
+
+def _inner_shortcuts(path: Path, dirs: List[Tuple[float, float, float]], dist: float, sign: int) -> List[Optional[Tuple[Tuple2, float, float]]]:
+    # For each vertex where the offset edges cross, (crossing point, length
+    # trimmed from the incoming edge, length trimmed from the outgoing edge),
+    # or None. A crossing is only usable if trimming at both ends of each
+    # edge doesn't use up more than the edge's length; past that, the
+    # trimmed edge would run backwards and enclose area that isn't there.
+    count = len(path)
+    candidates: List[Optional[Tuple[Tuple2, float, float]]] = []
+    for i, (vx, vy) in enumerate(path):
+        ax, ay, _ = dirs[i - 1]
+        bx, by, _ = dirs[i]
+        cross = ax * by - ay * bx
+        dot = ax * bx + ay * by
+        if cross * sign >= 0 or 1 + dot <= 1e-12:
+            candidates.append(None)
+            continue
+        miter = dist / (1 + dot)
+        mx, my = (ay * sign + by * sign) * miter, (-ax * sign - bx * sign) * miter
+        candidates.append(((vx + mx, vy + my), -(mx * ax + my * ay), mx * bx + my * by))
+
+    shortcuts: List[Optional[Tuple[Tuple2, float, float]]] = []
+    for i, candidate in enumerate(candidates):
+        if candidate:
+            before, after = candidates[i - 1], candidates[(i + 1) % count]
+            trimmed_in = candidate[1] + (before[2] if before else 0)
+            trimmed_out = candidate[2] + (after[1] if after else 0)
+            if candidate[1] < 0 or candidate[2] < 0 \
+                    or trimmed_in > dirs[i - 1][2] or trimmed_out > dirs[i][2]:
+                candidate = None
+        shortcuts.append(candidate)
+    return shortcuts
+
+# ===========
+# = Cleanup =
+# ===========
+def _positive_loops(paths: Sequence[Path]) -> List[Path]:
+    # Split the closed paths at every point where they cross into simple loops,
+    # and return the loops that have positive winding numbers just to their
+    # left and zero just to their right: the outlines of the area with a
+    # positive winding number
+    paths = [p for p in paths if len(p) > 2]
+    segs: List[Segment] = []
+    for path in paths:
+        prev = path[-1]
+        for p in path:
+            segs.append((prev[0], prev[1], p[0], p[1]))
+            prev = p
+    if not segs:
+        return []
+    grid = _SegmentGrid(segs)
+
+    # Each crossing splits both of its segments. Segments start at the
+    # previous point of each path, so segment i ends at its path's point i
+    splits: Dict[int, List[Tuple[float, int]]] = {}
+    crossings: List[Tuple2] = []
+    for i, j in grid.candidate_pairs():
+        hit = _segment_intersection(segs[i], segs[j])
+        if hit:
+            t, u, point = hit
+            splits.setdefault(i, []).append((t, len(crossings)))
+            splits.setdefault(j, []).append((u, len(crossings)))
+            crossings.append(point)
+
+    # Walk each path, listing its points & the crossings in order. At each
+    # crossing, the two walks trade their continuations, which separates
+    # the paths into simple, non-crossing loops
+    nodes: List[Tuple2] = []
+    successors: List[int] = []
+    crossing_nodes: Dict[int, List[int]] = {}
+    seg_index = 0
+    for path in paths:
+        first = len(nodes)
+        for p in path:
+            for _, crossing in sorted(splits.get(seg_index, ())):
+                crossing_nodes.setdefault(crossing, []).append(len(nodes))
+                nodes.append(crossings[crossing])
+                successors.append(len(nodes))
+            nodes.append(p)
+            successors.append(len(nodes))
+            seg_index += 1
+        successors[-1] = first
+    for a, b in crossing_nodes.values():
+        successors[a], successors[b] = successors[b], successors[a]
+
+    loops = []
+    visited = [False] * len(nodes)
+    for start in range(len(nodes)):
+        if visited[start]:
+            continue
+        loop: Path = []
+        node = start
+        while not visited[node]:
+            visited[node] = True
+            loop.append(nodes[node])
+            node = successors[node]
+        loop = _clean_path(loop)
+        if len(loop) > 2 and signed_area(loop) != 0 and grid.winding_number(_right_of(loop)) == 0:
+            loops.append(loop)
+    return loops
+
+def _right_of(loop: Path) -> Tuple2:
+    # A point just to the right of the middle of loop's longest edge
+    best, best_len = (loop[-1], loop[0]), -1.0
+    prev = loop[-1]
+    for p in loop:
+        length = (p[0] - prev[0])**2 + (p[1] - prev[1])**2
+        if length > best_len:
+            best, best_len = (prev, p), length
+        prev = p
+    (x0, y0), (x1, y1) = best
+    step = 1e-7
+    return ((x0 + x1) / 2 + (y1 - y0) * step, (y0 + y1) / 2 - (x1 - x0) * step)
+
+def _segment_intersection(a: Segment, b: Segment):
+    # Return (t, u, point) where segments a & b cross at a's fraction t and
+    # b's fraction u, or None. Each segment includes its start but not its
+    # end, so crossings at shared points are only counted once
+    ax, ay, ax1, ay1 = a
+    bx, by, bx1, by1 = b
+    rx, ry = ax1 - ax, ay1 - ay
+    sx, sy = bx1 - bx, by1 - by
+    denom = rx * sy - ry * sx
+    if denom == 0:
+        return None
+    qx, qy = bx - ax, by - ay
+    t = (qx * sy - qy * sx) / denom
+    u = (qx * ry - qy * rx) / denom
+    if 0 <= t < 1 and 0 <= u < 1:
+        return t, u, (ax + t * rx, ay + t * ry)
+    return None
+
+def _crossing(x0: float, y0: float, x1: float, y1: float, px: float, py: float) -> int:
+    # +1 if the segment crosses the ray from (px, py) towards +X going up,
+    # -1 if going down, otherwise 0
+    if y0 <= py:
+        if y1 > py and (x1 - x0) * (py - y0) - (px - x0) * (y1 - y0) > 0:
+            return 1
+    elif y1 <= py and (x1 - x0) * (py - y0) - (px - x0) * (y1 - y0) < 0:
+        return -1
+    return 0
+
+class _SegmentGrid:
+    # Uniform grid of segments, so crossing tests & winding numbers only
+    # look at nearby segments. Cells are about twice the mean segment length
+    def __init__(self, segs: Sequence[Segment]):
+        self.segs = segs
+        self.min_x = min_x = min(min(s[0], s[2]) for s in segs)
+        self.min_y = min_y = min(min(s[1], s[3]) for s in segs)
+        total = sum(abs(s[2] - s[0]) + abs(s[3] - s[1]) for s in segs)
+        self.cell = cell = (2 * total / len(segs)) or 1.0
+        self.cells: Dict[Tuple[int, int], List[int]] = {}
+        # Segments touching each row of cells, for winding numbers
+        self.rows: Dict[int, List[int]] = {}
+        # Each segment's bounding box & its first cell
+        self.boxes: List[Tuple[float, float, float, float, int, int]] = []
+        cells, rows, boxes = self.cells, self.rows, self.boxes
+        for index, (x0, y0, x1, y1) in enumerate(segs):
+            lo_x, hi_x = (x0, x1) if x0 < x1 else (x1, x0)
+            lo_y, hi_y = (y0, y1) if y0 < y1 else (y1, y0)
+            c0, c1 = floor((lo_x - min_x) / cell), floor((hi_x - min_x) / cell)
+            r0, r1 = floor((lo_y - min_y) / cell), floor((hi_y - min_y) / cell)
+            boxes.append((lo_x, hi_x, lo_y, hi_y, c0, r0))
+            if c0 == c1 and r0 == r1:
+                # Most segments fit in a single cell
+                cells.setdefault((c0, r0), []).append(index)
+                rows.setdefault(r0, []).append(index)
+                continue
+            for row in range(r0, r1 + 1):
+                rows.setdefault(row, []).append(index)
+                for col in range(c0, c1 + 1):
+                    cells.setdefault((col, row), []).append(index)
+
+    def _row(self, y: float) -> int:
+        return floor((y - self.min_y) / self.cell)
+
+    def candidate_pairs(self) -> Iterator[Tuple[int, int]]:
+        # Pairs of segments whose bounding boxes overlap, except neighbors in 
+        # the same path. Segments spanning several cells may share more than 
+        # one; each pair is only reported from the first cell they share
+        segs, boxes = self.segs, self.boxes
+        for (col, row), members in self.cells.items():
+            if len(members) < 2:
+                continue
+            for n, i in enumerate(members):
+                lo_x, hi_x, lo_y, hi_y, c0, r0 = boxes[i]
+                si = segs[i]
+                for j in members[n + 1:]:
+                    b_lo_x, b_hi_x, b_lo_y, b_hi_y, b_c0, b_r0 = boxes[j]
+                    if b_lo_x > hi_x or lo_x > b_hi_x or b_lo_y > hi_y or lo_y > b_hi_y:
+                        continue
+                    if max(c0, b_c0) != col or max(r0, b_r0) != row:
+                        continue
+                    sj = segs[j]
+                    if (si[2], si[3]) == (sj[0], sj[1]) or (sj[2], sj[3]) == (si[0], si[1]):
+                        continue
+                    yield i, j
+
+    def winding_number(self, point: Tuple2) -> int:
+        # Count crossings of a ray towards +X, through this point's row of cells
+        px, py = point
+        boxes, segs = self.boxes, self.segs
+        winding = 0
+        for index in self.rows.get(self._row(py), ()):
+            if boxes[index][1] >= px:
+                winding += _crossing(*segs[index], px, py)
+        return winding
+
+# ===========
+# = Helpers =
+# ===========
+def _as_paths(paths: PathsInput) -> List[Sequence[Point23Input]]:
+    # A single path is a sequence of points, whose first item is a number
+    first = paths[0][0] if paths and len(paths[0]) else None
+    if isinstance(first, (int, float)):
+        return [paths] # type: ignore
+    return list(paths) # type: ignore
+
+def _clean_path(path: Sequence[Point23Input]) -> Path:
+    # (x, y) tuples, without repeated points
+    result: Path = []
+    for p in path:
+        xy = (p[0], p[1])
+        if not result or xy != result[-1]:
+            result.append(xy)
+    while len(result) > 1 and result[0] == result[-1]:
+        result.pop()
+    return result
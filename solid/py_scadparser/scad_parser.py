@@ -233,7 +233,9 @@ def parseFile(scadFile):
 
     lexer = lex.lex(debug=False)
     lexer.filename = scadFile
-    parser = yacc.yacc(debug=False)
+    # Never write parsetab.py from here; parallel imports run this in
+    # several processes at once
+    parser = yacc.yacc(debug=False, write_tables=False)
 
     modules = []
     functions = []
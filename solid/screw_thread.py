@@ -1,11 +1,12 @@
 #! /usr/bin/env python3
 import math
-from typing import Sequence, Tuple, Union
+from collections import OrderedDict
+from typing import Callable, List, Optional, Sequence, Tuple, Union
 
 from euclid3 import Point3, Vector3
 
-from solid import scad_render_to_file
-from solid.objects import cylinder, polyhedron, render
+from solid import OpenSCADObject, scad_render_to_file
+from solid.objects import cylinder, polyhedron, render, translate, union
 from solid.utils import EPSILON, UP_VEC, bounding_box, radians
 
 # NOTE: The PyEuclid on PyPi doesn't include several elements added to
@@ -19,6 +20,10 @@ P3 = Tuple[float, float, float]
 P23 = Union[P2, P3]
 Points = Sequence[P23]
 
+# thread() polyhedra, keyed on normalized arguments; least recently used first
+THREAD_CACHE_SIZE = 128
+_thread_cache: 'OrderedDict[tuple, Tuple[OpenSCADObject, float]]' = OrderedDict()
+
 def map_segment(x: float, domain_min:float, domain_max: float, range_min:float, range_max:float) -> float: 
     if domain_min == domain_max or range_min == range_max:
         return range_min
@@ -34,7 +39,8 @@ def thread(outline_pts: Points,
            neck_in_degrees: float = 0,
            neck_out_degrees: float = 0,
            rad_2: float=None,
-           inverse_thread_direction:bool=False):
+           inverse_thread_direction:bool=False,
+           instanced: bool = False):
     """
     Sweeps outline_pts (an array of points describing a closed polygon in XY)
     through a spiral.
@@ -66,6 +72,12 @@ def thread(outline_pts: Points,
     :param rad_2: radius of cylinder the screw will wrap around at top of screw. Defaults to inner_rad
     :type rad_2: number    
 
+    :param inverse_thread_direction: if True, the spiral turns clockwise going up
+    :type inverse_thread_direction: bool
+
+    :param instanced: if True, and the thread isn't conical, build a single full turn as a polyhedron and stack translated copies of it, with separate pieces for the neck-in and the neck-out. Segments then line up between levels for any length, and Python work and output size no longer grow with the thread's length. Falls back to one polyhedron for conical threads or threads too short to hold a full turn between their necks
+    :type instanced: bool
+
     NOTE: This functions works by creating and returning one huge polyhedron, with
     potentially thousands of faces.  An alternate approach would make one single
     polyhedron,then repeat it over and over in the spiral shape, unioning them
@@ -80,6 +92,63 @@ def thread(outline_pts: Points,
     all over the place.  For screws with essentially no space between
     threads, (i.e., pitch=tooth_height), I use pitch= tooth_height+EPSILON,
     since pitch=tooth_height will self-intersect for rotations >=1
+
+    NOTE: Calls with the same arguments return new intersection() objects that
+    all share one cached polyhedron node, so many identical fasteners cost 
+    little more than one. Up to THREAD_CACHE_SIZE polyhedra are kept; call
+    clear_thread_cache() to release them
+    """
+    rad_2 = rad_2 or inner_rad
+    # Identical fasteners share a single polyhedron node, so build each 
+    # distinct thread only once
+    key = (tuple((float(p[0]), float(p[1])) for p in outline_pts),
+           float(inner_rad), float(rad_2), float(pitch), float(length), 
+           bool(external), int(segments_per_rot), 
+           float(neck_in_degrees), float(neck_out_degrees), 
+           bool(inverse_thread_direction), bool(instanced))
+    cached = _thread_cache.get(key)
+    if cached:
+        _thread_cache.move_to_end(key)
+        a, outline_w = cached
+    else:
+        a, outline_w = _thread_polyhedron(outline_pts, inner_rad, pitch, length, external, 
+                                          segments_per_rot, neck_in_degrees, neck_out_degrees,
+                                          rad_2, inverse_thread_direction, instanced)
+        _thread_cache[key] = (a, outline_w)
+        if len(_thread_cache) > THREAD_CACHE_SIZE:
+            _thread_cache.popitem(last=False)
+
+    if external:
+        # Intersect with a cylindrical tube to make sure we fit into
+        # the correct dimensions
+        tube = cylinder(r1=inner_rad + outline_w + EPSILON, r2=rad_2 + outline_w + EPSILON, h=length, segments=segments_per_rot)
+        tube -= cylinder(r1=inner_rad, r2=rad_2, h=length, segments=segments_per_rot)
+    else:
+        # If the threading is internal, intersect with a central cylinder
+        # to make sure nothing else remains
+        tube = cylinder(r1=inner_rad, r2=rad_2, h=length, segments=segments_per_rot)
+    return a * tube
+
+def clear_thread_cache():
+    """
+    Forget all polyhedra built by thread(). Later calls build new nodes, 
+    even for arguments seen before
+    """
+    _thread_cache.clear()
+
+def _thread_polyhedron(outline_pts: Points,
+                       inner_rad: float,
+                       pitch: float,
+                       length: float,
+                       external: bool,
+                       segments_per_rot: int,
+                       neck_in_degrees: float,
+                       neck_out_degrees: float,
+                       rad_2: float,
+                       inverse_thread_direction: bool,
+                       instanced: bool = False) -> Tuple[OpenSCADObject, float]:
+    """
+    The spiral geometry for thread(), and the width of its tooth profile
     """
     # FIXME: For small segments_per_rot where length is not a multiple of
     # pitch, the the generated spiral will have irregularities, since we 
@@ -87,8 +156,8 @@ def thread(outline_pts: Points,
     # below. This would require a change in logic to fix. For now, larger values
     # of segments_per_rot and length that divides pitch evenly should avoid this issue
     # -ETJ 02 January 2020
+    # (instanced=True keeps segments aligned between levels, for cylindrical threads)
 
-    rad_2 = rad_2 or inner_rad
     rotations = length / pitch
 
     total_angle = 360 * rotations
@@ -97,10 +166,7 @@ def thread(outline_pts: Points,
     total_steps = math.ceil(rotations * segments_per_rot) + 1
     step_angle = total_angle / (total_steps - 1)
 
-    all_points = []
-    all_tris = []
     euc_up = Vector3(*UP_VEC)
-    poly_sides = len(outline_pts)
 
     # Make Point3s from outline_pts and flip inward for internal threads
     int_ext_angle = 0 if external else math.pi
@@ -115,7 +181,7 @@ def thread(outline_pts: Points,
     # outline_pts, since they were created in 2D , are in the XY plane.
     # But spirals move a profile in XZ around the Z-axis.  So swap Y and Z
     # coordinates... and hope users know about this
-    euc_points = list([Point3(p[0], 0, p[1]) for p in outline_pts])
+    profile = [(p[0], 0, p[1]) for p in outline_pts]
 
     # Figure out how wide the tooth profile is
     min_bb, max_bb = bounding_box(outline_pts)
@@ -136,6 +202,23 @@ def thread(outline_pts: Points,
         rad_2 - neck_distance
     ]
 
+    def radius(angle: float) -> float:
+        # Handle the neck-in radius for internal and external threads
+        if 0 <= angle < neck_in_degrees:
+            return map_segment(angle, 0, neck_in_degrees, section_rads[0], section_rads[1])
+        elif neck_in_degrees <= angle < neck_out_start:
+            return map_segment( angle, neck_in_degrees, neck_out_start, section_rads[1], section_rads[2])
+        else:
+            return map_segment( angle, neck_out_start, total_angle, section_rads[2], section_rads[3])
+
+    if instanced and inner_rad == rad_2:
+        turns = _instanced_turns(profile, pitch, total_angle, segments_per_rot, 
+                                 neck_in_degrees, neck_out_degrees, radius, 
+                                 inverse_thread_direction)
+        if turns:
+            return turns, outline_w
+
+    steps = []
     for i in range(total_steps):
         angle = i * step_angle
 
@@ -144,30 +227,87 @@ def thread(outline_pts: Points,
             angle = total_angle
             elevation = length
 
-        # Handle the neck-in radius for internal and external threads
-        if 0 <= angle < neck_in_degrees:
-            rad = map_segment(angle, 0, neck_in_degrees, section_rads[0], section_rads[1])
-        elif neck_in_degrees <= angle < neck_out_start:
-            rad = map_segment( angle, neck_in_degrees, neck_out_start, section_rads[1], section_rads[2])
-        elif neck_out_start <= angle <= total_angle:
-            rad = map_segment( angle, neck_out_start, total_angle, section_rads[2], section_rads[3])
-
-        elev_vec = Vector3(rad, 0, elevation)
-
-        # create new points
-        for p in euc_points:
-            theta = radians(angle) * (-1 if inverse_thread_direction else 1)
-            pt = (p + elev_vec).rotate_around(axis=euc_up, theta=theta)
-            all_points.append(pt.as_arr())
-
-        # Add the connectivity information
-        if i < total_steps - 1:
-            ind = i * poly_sides
-            for j in range(ind, ind + poly_sides - 1):
-                all_tris.append([j, j + 1, j + poly_sides])
-                all_tris.append([j + 1, j + poly_sides + 1, j + poly_sides])
-            all_tris.append([ind, ind + poly_sides - 1 + poly_sides, ind + poly_sides - 1])
-            all_tris.append([ind, ind + poly_sides, ind + poly_sides - 1 + poly_sides])
+        steps.append((angle, elevation, radius(angle)))
+
+    return _helix_polyhedron(profile, steps, inverse_thread_direction), outline_w
+
+def _instanced_turns(profile: Sequence[P3],
+                     pitch: float,
+                     total_angle: float,
+                     segments_per_rot: int,
+                     neck_in_degrees: float,
+                     neck_out_degrees: float,
+                     radius: Callable[[float], float],
+                     inverse_thread_direction: bool) -> Optional[OpenSCADObject]:
+    """
+    A cylindrical thread as a neck-in polyhedron, one full-turn polyhedron 
+    stacked as many times as fits, and an end polyhedron holding any partial 
+    turn and the neck-out. Every piece has its segments at multiples of 
+    360/segments_per_rot from the start, so pieces meet exactly.
+    Returns None if there's no room for a full turn
+    """
+    step_angle = 360 / segments_per_rot
+    neck_in_end = math.ceil(neck_in_degrees / step_angle) * step_angle
+    turn_count = math.floor((total_angle - neck_in_end - neck_out_degrees) / 360)
+    if turn_count < 1:
+        return None
+    turns_end = neck_in_end + 360 * turn_count
+
+    def piece(start_angle: float, end_angle: float) -> OpenSCADObject:
+        # Don't add a sliver segment for floating point noise at the end
+        segments = max(1, math.ceil((end_angle - start_angle) / step_angle - EPSILON))
+        angles = [start_angle + i * step_angle for i in range(segments)] + [end_angle]
+        steps = [(angle, angle / 360 * pitch, radius(angle)) for angle in angles]
+        return _helix_polyhedron(profile, steps, inverse_thread_direction)
+
+    pieces = []
+    if neck_in_end > 0:
+        pieces.append(piece(0, neck_in_end))
+    turn = piece(neck_in_end, neck_in_end + 360)
+    pieces.append(turn)
+    # One full rotation brings each turn back to its starting angle, so later 
+    # turns only need to move up
+    pieces += [translate([0, 0, i * pitch])(turn) for i in range(1, turn_count)]
+    if total_angle - turns_end > EPSILON:
+        pieces.append(piece(turns_end, total_angle))
+    return union()(*pieces)
+
+def _helix_polyhedron(profile: Sequence[P3], 
+                      steps: Sequence[P3], 
+                      inverse_thread_direction: bool) -> OpenSCADObject:
+    """
+    Sweep profile through each (angle, elevation, radius) in steps
+    """
+    all_points: List[List[float]] = []
+    poly_sides = len(profile)
+    u, v, w = UP_VEC
+    r2 = u**2 + v**2 + w**2
+    r = math.sqrt(r2)
+    for angle, elevation, rad in steps:
+        # Offset each outline point by (rad, 0, elevation), then rotate it
+        # around the Z axis. This is Vector3.rotate_around(), term for term, 
+        # so points match the euclid3 results exactly
+        theta = radians(angle) * (-1 if inverse_thread_direction else 1)
+        ct = math.cos(theta)
+        st = math.sin(theta) / r
+        for px, py, pz in profile:
+            x, y, z = px + rad, py, pz + elevation
+            dt = (u*x + v*y + w*z) * (1 - ct) / r2
+            all_points.append([(u * dt + x * ct + (-w * y + v * z) * st),
+                               (v * dt + y * ct + ( w * x - u * z) * st),
+                               (w * dt + z * ct + (-v * x + u * y) * st)])
+
+    # Connectivity is the same between every pair of consecutive loops, 
+    # offset by poly_sides indices per loop
+    strip_tris = [] 
+    for j in range(poly_sides - 1):
+        strip_tris.append((j, j + 1, j + poly_sides))
+        strip_tris.append((j + 1, j + poly_sides + 1, j + poly_sides))
+    strip_tris.append((0, poly_sides - 1 + poly_sides, poly_sides - 1))
+    strip_tris.append((0, poly_sides, poly_sides - 1 + poly_sides))
+    all_tris = [[a + ind, b + ind, c + ind] 
+                for ind in range(0, (len(steps) - 1) * poly_sides, poly_sides) 
+                for a, b, c in strip_tris]
 
     # End triangle fans for beginning and end
     last_loop = len(all_points) - poly_sides
@@ -178,23 +318,10 @@ def thread(outline_pts: Points,
     # Moving in the opposite direction, we need to reverse the order of
     # corners in each face so the OpenSCAD preview renders correctly
     if inverse_thread_direction:
-        all_tris = list([reversed(trio) for trio in all_tris])
+        all_tris = [trio[::-1] for trio in all_tris]
 
     # Make the polyhedron; convexity info needed for correct OpenSCAD render
-    a = polyhedron(points=all_points, faces=all_tris, convexity=2)
-
-    if external:
-        # Intersect with a cylindrical tube to make sure we fit into
-        # the correct dimensions
-        tube = cylinder(r1=inner_rad + outline_w + EPSILON, r2=rad_2 + outline_w + EPSILON, h=length, segments=segments_per_rot)
-        tube -= cylinder(r1=inner_rad, r2=rad_2, h=length, segments=segments_per_rot)
-    else:
-        # If the threading is internal, intersect with a central cylinder
-        # to make sure nothing else remains
-        tube = cylinder(r1=inner_rad, r2=rad_2, h=length, segments=segments_per_rot)
-    a *= tube 
-
-    return a
+    return polyhedron(points=all_points, faces=all_tris, convexity=2)
 
 def default_thread_section(tooth_height: float, tooth_depth: float):
     """
@@ -42,6 +42,10 @@ PYTHON_ONLY_RESERVED_WORDS = keyword.kwlist
 # = Internal Utilities    =
 # =========================
 class OpenSCADObject:
+    # Incremented whenever an object with derived data cached on it (e.g. by
+    # utils.object_bounds()) is changed, so those caches can be checked
+    # without walking the tree they belong to
+    _cache_version = 0
 
     def __init__(self, name: str, params: dict):
         self.name = name
@@ -62,6 +66,7 @@ class OpenSCADObject:
 
     def set_hole(self, is_hole: bool = True) -> "OpenSCADObject":
         self.is_hole = is_hole
+        self._changed()
         return self
 
     def set_part_root(self, is_root: bool = True) -> "OpenSCADObject":
@@ -111,8 +116,15 @@ class OpenSCADObject:
                        '!': '!'}
 
         self.modifier = string_vals.get(m.lower(), '')
+        self._changed()
         return self
 
+    def _changed(self):
+        # Objects nothing has been cached for can change freely, so 
+        # building new trees doesn't invalidate existing caches
+        if '_bounds_cache' in self.__dict__:
+            OpenSCADObject._cache_version += 1
+
     def _render(self, render_holes: bool = False) -> str:
         """
         NOTE: In general, you won't want to call this method. For most purposes,
@@ -258,6 +270,7 @@ class OpenSCADObject:
         else:
             self.children.append(child)  # type: ignore
             child.set_parent(self)  # type: ignore
+            self._changed()
         return self
 
     def set_parent(self, parent: "OpenSCADObject"):
@@ -267,6 +280,7 @@ class OpenSCADObject:
         if k == '$fn':
             k = 'segments'
         self.params[k] = v
+        self._changed()
         return self
 
     def copy(self) -> "OpenSCADObject":
@@ -371,8 +385,12 @@ class IncludedOpenSCADObject(OpenSCADObject):
     def __init__(self, name, params, include_file_path, use_not_include=False, **kwargs):
         self.include_file_path = self._get_include_path(include_file_path)
 
-        use_str = 'use' if use_not_include else 'include'
-        self.include_string = f'{use_str} <{self.include_file_path}>\n'
+        key = (self.include_file_path, use_not_include)
+        self.include_string = _include_strings.get(key)
+        if self.include_string is None:
+            use_str = 'use' if use_not_include else 'include'
+            self.include_string = f'{use_str} <{self.include_file_path}>\n'
+            _include_strings[key] = self.include_string
 
         # Just pass any extra arguments straight on to OpenSCAD; it'll accept
         # them
@@ -382,19 +400,54 @@ class IncludedOpenSCADObject(OpenSCADObject):
         OpenSCADObject.__init__(self, name, params)
 
     def _get_include_path(self, include_file_path):
-        # Look through sys.path for anyplace we can find a valid file ending
-        # in include_file_path.  Return that absolute path
-        if os.path.isabs(include_file_path) and os.path.isfile(include_file_path):
-            return include_file_path
-        else:
-            for p in sys.path:
-                whole_path = os.path.join(p, include_file_path)
-                if os.path.isfile(whole_path):
-                    return os.path.abspath(whole_path)
+        return _resolve_include_path(include_file_path)
+
+
+# =================================
+# = Include path resolution cache =
+# =================================
+# Finding an included file means stat-ing candidates all over sys.path (or the
+# OpenSCAD library directories, in objects._find_library()), and every 
+# IncludedOpenSCADObject instance needs its path. Only successful lookups are
+# cached, so a missing file is looked for again next time. If files move or
+# sys.path/OPENSCADPATH change, call clear_include_path_cache()
+_resolved_include_paths: Dict[str, str] = {}
+_include_strings: Dict[tuple, str] = {}
+
+def _resolve_include_path(include_file_path: PathStr) -> str:
+    key = str(include_file_path)
+    resolved = _resolved_include_paths.get(key)
+    if resolved is not None:
+        return resolved
+
+    # Look through sys.path for anyplace we can find a valid file ending
+    # in include_file_path.  Return that absolute path
+    if os.path.isabs(include_file_path) and os.path.isfile(include_file_path):
+        resolved = include_file_path
+    else:
+        for p in sys.path:
+            whole_path = os.path.join(p, include_file_path)
+            if os.path.isfile(whole_path):
+                resolved = os.path.abspath(whole_path)
+                break
 
+    if resolved is None:
         # No loadable SCAD file was found in sys.path.  Raise an error
         raise ValueError(f"Unable to find included SCAD file: {include_file_path} in sys.path")
 
+    _resolved_include_paths[key] = resolved
+    return resolved
+
+def clear_include_path_cache():
+    """
+    Forget all resolved SCAD include & library paths. They'll be looked up
+    on the filesystem again the next time they're needed.
+    """
+    _resolved_include_paths.clear()
+    _include_strings.clear()
+    objects._library_paths.clear()
+    objects._found_libraries.clear()
+
 
 # =========================================
 # = Rendering Python code to OpenSCAD code=
@@ -662,6 +715,13 @@ def new_openscad_class_str(class_name: str,
                            kwargs: Sequence[str] = None,
                            include_file_path: Optional[str] = None,
                            use_not_include: bool = True) -> str:
+    """
+    Deprecated: return Python source for the class `new_openscad_class()` 
+    creates. Imports no longer compile source code
+    """
+    import warnings
+    warnings.warn('new_openscad_class_str() is deprecated; use new_openscad_class()', 
+                  DeprecationWarning, stacklevel=2)
     args_str = ''
     args_pairs = ''
 
@@ -709,7 +769,104 @@ def new_openscad_class_str(class_name: str,
 
     return result
 
-def _subbed_keyword(keyword: str) -> str:
+def new_openscad_class(class_name: str,
+                       args: Sequence[str] = None,
+                       kwargs: Sequence[str] = None,
+                       include_file_path: Optional[str] = None,
+                       use_not_include: bool = True,
+                       module_name: str = None) -> type:
+    """
+    Return a new OpenSCADObject subclass (IncludedOpenSCADObject if 
+    include_file_path is supplied) that behaves like the class defined by
+    `new_openscad_class_str()`, but without compiling any source code. 
+    All generated classes share one __init__, driven by the parameter names 
+    stored on each class.
+    """
+    renames: List[tuple] = []
+    def subbed(name: str) -> str:
+        new_name = _subbed_keyword(name, report=False)
+        if new_name != name:
+            renames.append((name, new_name))
+        return new_name
+
+    class_name = subbed(class_name)
+    args = [subbed(a) for a in args or []]
+    kwargs = [subbed(k) for k in kwargs or []]
+    _report_renames(include_file_path, renames)
+    param_names = tuple(args + kwargs)
+
+    if include_file_path:
+        base: type = IncludedOpenSCADObject
+        include_file_path = Path(include_file_path).as_posix()
+    else:
+        base = OpenSCADObject
+
+    attrs = {
+        '__init__': _generated_class_init,
+        '__module__': module_name or __name__,
+        '__signature__': _generated_class_signature(param_names, len(args), bool(include_file_path)),
+        '_scad_name': class_name,
+        '_param_names': param_names,
+        '_required_count': len(args),
+        '_include_file_path': include_file_path,
+        '_use_not_include': use_not_include,
+    }
+    return type(class_name, (base,), attrs)
+
+def _generated_class_init(self, *args, **kwargs):
+    cls = type(self)
+    name = cls._scad_name
+    param_names = cls._param_names
+    if len(args) > len(param_names):
+        raise TypeError(f"{name}() takes {len(param_names)} positional arguments but {len(args)} were given")
+
+    params = dict(zip(param_names, args))
+    for i, param in enumerate(param_names):
+        if i < len(args):
+            if param in kwargs:
+                raise TypeError(f"{name}() got multiple values for argument '{param}'")
+        elif param in kwargs:
+            params[param] = kwargs.pop(param)
+        elif i < cls._required_count:
+            raise TypeError(f"{name}() missing required argument: '{param}'")
+        else:
+            params[param] = None
+
+    if cls._include_file_path:
+        IncludedOpenSCADObject.__init__(self, name, params, 
+                                        include_file_path=cls._include_file_path,
+                                        use_not_include=cls._use_not_include, **kwargs)
+    elif kwargs:
+        raise TypeError(f"{name}() got an unexpected keyword argument '{next(iter(kwargs))}'")
+    else:
+        OpenSCADObject.__init__(self, name, params)
+
+def _generated_class_signature(param_names: Sequence[str], required_count: int, var_kwargs: bool) -> inspect.Signature:
+    # Lets help() & IDEs show the same signature new_openscad_class_str() would
+    # have generated
+    P = inspect.Parameter
+    params = [P(n, P.POSITIONAL_OR_KEYWORD, default=(P.empty if i < required_count else None)) 
+              for i, n in enumerate(param_names)]
+    if var_kwargs:
+        params.append(P('kwargs', P.VAR_KEYWORD))
+    return inspect.Signature(params)
+
+# (include_file_path, keyword) pairs whose renaming has been reported
+_reported_renames: Set[tuple] = set()
+
+def _report_renames(include_file_path: Optional[str], renames: Sequence[tuple]):
+    # Tell users about each OpenSCAD identifier that had to be renamed, 
+    # once per file rather than once per module or function using it
+    for keyword, new_key in renames:
+        if (include_file_path, keyword) in _reported_renames:
+            continue
+        _reported_renames.add((include_file_path, keyword))
+        source = f" in `{include_file_path}`" if include_file_path else ''
+        print(f"\nFound OpenSCAD code that's not compatible with Python. \n"
+              f"Imported OpenSCAD code using `{keyword}`{source} \n"
+              f"can be accessed with `{new_key}` in SolidPython\n")
+
+def _subbed_keyword(keyword: str, report: bool = True) -> str:
     """
     Append an underscore to any python reserved word.
     Prepend an underscore to any OpenSCAD identifier starting with a digit.
@@ -729,7 +886,7 @@ def _subbed_keyword(keyword: str) -> str:
     elif keyword[0] == "$":
         new_key = "__" + keyword[1:]
 
-    if new_key != keyword:
+    if report and new_key != keyword:
         print(f"\nFound OpenSCAD code that's not compatible with Python. \n"
               f"Imported OpenSCAD code using `{keyword}` \n"
               f"can be accessed with `{new_key}` in SolidPython\n")
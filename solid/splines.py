@@ -3,9 +3,10 @@ from math import pow
 
 from solid import union, circle, cylinder, polygon, color, OpenSCADObject, translate, linear_extrude, polyhedron
 from solid.utils import bounding_box, right, Red, Tuple3, euclidify
+from solid.utils import _add, _scaled, _sub, _xyz_tuples
 from euclid3 import Vector2, Vector3, Point2, Point3
 
-from typing import Sequence, Tuple, Union, List, cast
+from typing import Dict, Sequence, Tuple, Union, List, cast
 
 Point23 = Union[Point2, Point3]
 # These *Input types accept either euclid3.Point* objects, or bare n-tuples
@@ -70,35 +71,39 @@ def catmull_rom_points( points: Sequence[Point23Input],
     https://www.habrador.com/tutorials/interpolation/1-catmull-rom-splines/
     retrieved 20190712
     """
-    catmull_points: List[Point3] = []
-    cat_points: List[Point3] = []
-    # points_list = cast(List[Point23], points)
+    return [Point3(*p) for p in catmull_rom_tuples(points, subdivisions, close_loop, start_tangent, end_tangent)]
 
-    points_list = list([euclidify(p, Point3) for p in points])
+def catmull_rom_tuples( points: Sequence[Point23Input], 
+                        subdivisions:int = DEFAULT_SUBDIVISIONS, 
+                        close_loop: bool=False,
+                        start_tangent: Vec23 = None,
+                        end_tangent: Vec23 = None) -> List[Tuple3]:
+    """
+    Same as catmull_rom_points(), but returns (x, y, z) tuples. All segments
+    are evaluated in one pass, without building euclid3 objects, which is
+    much faster for long or finely subdivided curves
+    """
+    quads = _catmull_rom_quads(_xyz_tuples(points), close_loop, start_tangent, end_tangent)
+    return _catmull_rom_segments(quads, subdivisions)
 
+def _catmull_rom_quads(points_list: List[Tuple3], 
+                       close_loop: bool=False,
+                       start_tangent: Vec23 = None,
+                       end_tangent: Vec23 = None) -> List[List[Tuple3]]:
+    """
+    The 4 control points for each segment of a Catmull-Rom curve through points_list
+    """
     if close_loop:
-        cat_points = euclidify([points_list[-1]] + points_list + points_list[0:2], Point3)
+        cat_points = [points_list[-1]] + points_list + points_list[0:2]
     else:
         # Use supplied tangents or just continue the ends of the supplied points
-        start_tangent = start_tangent or (points_list[1] - points_list[0])
-        start_tangent = euclidify(start_tangent, Vector3)
-        end_tangent = end_tangent or (points_list[-2] - points_list[-1])
-        end_tangent = euclidify(end_tangent, Vector3)
-        cat_points = [points_list[0]+ start_tangent] + points_list + [points_list[-1] + end_tangent]
-
-    last_point_range = len(cat_points) - 3 if close_loop else len(cat_points) - 3
-
-    for i in range(0, last_point_range):
-        include_last = True if i == last_point_range - 1 else False
-        controls = cat_points[i:i+4]
-        # If we're closing a loop, controls needs to wrap around the end of the array
-        points_needed = 4 - len(controls)
-        if points_needed > 0:
-            controls += cat_points[0:points_needed]
-        controls_tuple = cast(FourPoints, controls)
-        catmull_points += _catmull_rom_segment(controls_tuple, subdivisions, include_last)
-
-    return catmull_points
+        first, second, last, next_to_last = points_list[0], points_list[1], points_list[-1], points_list[-2]
+        start_tan = _xyz_tuples([start_tangent])[0] if start_tangent else _sub(second, first)
+        end_tan = _xyz_tuples([end_tangent])[0] if end_tangent else _sub(next_to_last, last)
+        cat_points = [_add(first, start_tan)] + points_list + [_add(last, end_tan)]
+
+    # Every run of 4 consecutive points defines one segment of the curve
+    return [cat_points[i:i+4] for i in range(len(cat_points) - 3)]
 
 def _catmull_rom_segment(controls: FourPoints, 
                          subdivisions: int, 
@@ -111,23 +116,36 @@ def _catmull_rom_segment(controls: FourPoints,
 
     No reason to call this unless you're trying to do something very specific
     """
-    pos: Point23 = None
-    positions: List[Point23] = []
-
-    num_points = subdivisions
-    if include_last:
-        num_points += 1
-
-    p0, p1, p2, p3 = [euclidify(p, Point3) for p in controls]
-    a = 2 * p1
-    b = p2 - p0
-    c = 2* p0 - 5*p1 + 4*p2 - p3
-    d = -p0 + 3*p1 - 3*p2 + p3
-
-    for i in range(num_points):
-        t = i/subdivisions
-        pos = 0.5 * (a + (b * t) + (c * t * t) + (d * t * t * t))
-        positions.append(Point3(*pos))
+    quad = _xyz_tuples(controls)
+    positions = _catmull_rom_segments([quad], subdivisions, include_last)
+    return [Point3(*p) for p in positions]
+
+def _catmull_rom_segments(quads: Sequence[Sequence[Tuple3]], 
+                          subdivisions: int, 
+                          include_last=True) -> List[Tuple3]:
+    """
+    Evaluate the Catmull-Rom segment for each quad of control points at 
+    `subdivisions` steps, plus the end of the final segment if `include_last`.
+    Each point is 0.5 * (a + b*t + c*t^2 + d*t^3); the coefficient rows 
+    depend only on each quad and the powers of t are shared by all quads. 
+    Operations are ordered as euclid3 would order them, so results match the 
+    original per-Point3 evaluation exactly
+    """
+    ts = [i/subdivisions for i in range(subdivisions + 1)]
+    positions: List[Tuple3] = []
+    last_quad = len(quads) - 1
+    for which, (p0, p1, p2, p3) in enumerate(quads):
+        coefficients = [(2 * x1, 
+                         x2 - x0, 
+                         2 * x0 - 5 * x1 + 4 * x2 - x3, 
+                         -x0 + 3 * x1 - 3 * x2 + x3) 
+                        for x0, x1, x2, x3 in zip(p0, p1, p2, p3)]
+        (ax, bx, cx, dx), (ay, by, cy, dy), (az, bz, cz, dz) = coefficients
+        segment_ts = ts if include_last and which == last_quad else ts[:-1]
+        positions += [(0.5 * (ax + bx * t + cx * t * t + dx * t * t * t),
+                       0.5 * (ay + by * t + cy * t * t + dy * t * t * t),
+                       0.5 * (az + bz * t + cz * t * t + dz * t * t * t))
+                      for t in segment_ts]
     return positions
 
 def catmull_rom_patch_points(patch:Tuple[PointInputs, PointInputs], 
@@ -166,28 +184,26 @@ def catmull_rom_prism(  control_curves:Sequence[PointInputs],
     if smooth_edges:
         return catmull_rom_prism_smooth_edges(control_curves, subdivisions, closed_ring, add_caps)
 
-    verts: List[Point3] = []
-    faces: List[FaceTrio] = []
-
-    curves = list([euclidify(c) for c in control_curves])
+    # Expand each control curve once; neighboring patches share them
+    expanded = [catmull_rom_tuples(c, subdivisions) for c in control_curves]
     if closed_ring:
-        curves.append(curves[0])
-    
-    curve_length = (len(curves[0]) -1) * subdivisions + 1
-    for i, (a, b) in enumerate(zip(curves[:-1], curves[1:])):
-        index_start = len(verts) - curve_length
-        first_new_vert = curve_length
-        if i == 0:
-            index_start = 0
-            first_new_vert = 0
-
-        new_verts, new_faces = catmull_rom_patch_points((a,b), subdivisions=subdivisions, index_start=index_start)
-
-        # new_faces describes all the triangles in the patch we just computed,
-        # but new_verts shares its first curve_length vertices with the last
-        # curve_length vertices; Add on only the new points
-        verts += new_verts[first_new_vert:]
-        faces += new_faces
+        expanded.append(expanded[0])
+
+    # Each patch blends linearly from one expanded curve to the next. A 
+    # patch's first row is the last row of the patch before it, so only 
+    # the first patch includes it
+    verts: List[Tuple3] = []
+    for i, (a, b) in enumerate(zip(expanded[:-1], expanded[1:])):
+        for row in range(0 if i == 0 else 1, subdivisions + 1):
+            frac = row/subdivisions
+            keep = 1 - frac
+            verts += [(pa[0] * keep + pb[0] * frac, 
+                       pa[1] * keep + pb[1] * frac, 
+                       pa[2] * keep + pb[2] * frac) for pa, pb in zip(a, b)]
+
+    curve_length = len(expanded[0])
+    row_count = len(verts) // curve_length
+    faces = _grid_faces(row_count, curve_length)
 
     if closed_ring and add_caps:
         bot_indices = range(0, len(verts), curve_length)
@@ -210,31 +226,23 @@ def catmull_rom_prism_smooth_edges( control_curves:Sequence[PointInputs],
                                     closed_ring:bool = True,
                                     add_caps:bool = True ) -> polyhedron:
 
-    verts: List[Point3] = []
-    faces: List[FaceTrio] = []
-
     # TODO: verify that each control_curve has the same length
 
-    curves = list([euclidify(c) for c in control_curves])
-
-    expanded_curves = [catmull_rom_points(c, subdivisions, close_loop=False) for c in curves]
-    expanded_length = len(expanded_curves[0])
-    for i in range(expanded_length):
-        contour_controls = [c[i] for c in expanded_curves]
-        contour = catmull_rom_points(contour_controls, subdivisions, close_loop=closed_ring)
-        verts += contour
-
-        contour_length = len(contour)
-        # generate the face triangles between the last two rows of vertices
-        if i > 0:
-            a_start = len(verts) - 2 * contour_length
-            b_start = len(verts) - contour_length
-            # Note the b_start, a_start order here. This makes sure our faces
-            # are pointed outwards for the test cases I ran. I think if control
-            # curves were specified clockwise rather than counter-clockwise, all
-            # of the faces would be pointed inwards
-            new_faces = face_strip_list(b_start,  a_start, length=contour_length, close_loop=closed_ring)
-            faces += new_faces
+    # This is a tensor-product surface: first expand every control curve, 
+    # then run a contour through the matching point of each expanded curve.
+    # Every contour shares the same table of t values
+    expanded_curves = [catmull_rom_tuples(c, subdivisions, close_loop=False) for c in control_curves]
+    verts: List[Tuple3] = []
+    for contour_controls in zip(*expanded_curves):
+        quads = _catmull_rom_quads(list(contour_controls), closed_ring)
+        verts += _catmull_rom_segments(quads, subdivisions)
+
+    contour_length = len(verts) // len(expanded_curves[0])
+    # Note the reversed row order here. This makes sure our faces
+    # are pointed outwards for the test cases I ran. I think if control
+    # curves were specified clockwise rather than counter-clockwise, all
+    # of the faces would be pointed inwards
+    faces = _grid_faces(len(expanded_curves[0]), contour_length, close_loop=closed_ring, reverse_rows=True)
     
     if closed_ring and add_caps:
         bot_indices = range(0, contour_length)
@@ -285,29 +293,122 @@ def bezier_polygon( controls: FourPoints,
     
     return shape
 
-def bezier_points(controls: FourPoints, 
+def bezier_points(controls: Sequence[Point23Input], 
                   subdivisions: int = DEFAULT_SUBDIVISIONS,
                   include_last: bool = True) -> List[Point3]:
     """
     Returns a list of `subdivisions` (+ 1, if `include_last` is True) points
-    on the cubic bezier curve defined by `controls`. The curve passes through 
-    controls[0] and controls[3]
+    on the bezier curve defined by `controls`. The curve passes through 
+    the first and last controls. Four controls make a cubic curve; in general,
+    n + 1 controls make a curve of degree n
 
-    If `include_last` is True, the last point returned will be controls[3]; if
-    False, (useful for linking several curves together), controls[3] won't be included
+    If `include_last` is True, the last point returned will be controls[-1]; if
+    False, (useful for linking several curves together), controls[-1] won't be included
 
     Ported from William A. Adams' Bezier OpenSCAD code at: 
     https://www.thingiverse.com/thing:8443
     """
-    # TODO: enable a smooth curve through arbitrarily many points, as described at:
-    # https://www.algosome.com/articles/continuous-bezier-curve-line.html
+    return [Point3(*p) for p in bezier_tuples(controls, subdivisions, include_last)]
 
-    points: List[Point3] = []
-    last_elt = 1 if include_last else 0
-    for i in range(subdivisions + last_elt):
-        u = i/subdivisions
-        points.append(_point_along_bez4(*controls, u))
-    return points
+def bezier_tuples(controls: Sequence[Point23Input], 
+                  subdivisions: int = DEFAULT_SUBDIVISIONS,
+                  include_last: bool = True) -> List[Tuple3]:
+    """
+    Same as bezier_points(), but returns (x, y, z) tuples
+    """
+    return bezier_tuples_batch([controls], subdivisions, include_last)[0]
+
+def bezier_tuples_batch(curves: Sequence[Sequence[Point23Input]],
+                        subdivisions: int = DEFAULT_SUBDIVISIONS,
+                        include_last: bool = True) -> List[List[Tuple3]]:
+    """
+    Evaluate many bezier curves at once; returns one list of points per curve,
+    as bezier_tuples() would. Curves may have different degrees. The 
+    Bernstein basis values for each degree & subdivision count are computed 
+    once and cached, so each point costs only a weighted sum of its controls
+    """
+    results: List[List[Tuple3]] = []
+    for controls in curves:
+        control_tuples = _xyz_tuples(controls)
+        table = _bernstein_table(len(control_tuples) - 1, subdivisions, include_last)
+        xs, ys, zs = zip(*control_tuples)
+        results.append([(_weighted_sum(weights, xs), _weighted_sum(weights, ys), _weighted_sum(weights, zs)) 
+                        for weights in table])
+    return results
+
+def bezier_chain_points(points: Sequence[Point23Input],
+                        subdivisions: int = DEFAULT_SUBDIVISIONS,
+                        close_loop: bool = False,
+                        smoothing: float = 0.5) -> List[Point3]:
+    """
+    Return a smooth curve through all of `points`, made of one cubic bezier 
+    curve with `subdivisions` steps between each pair of points. The handles
+    on either side of each point are parallel and equal in length, so the 
+    curve's tangent is continuous (C1) where curves join. 
+
+    Each handle is `smoothing`/3 times the vector between that point's 
+    neighbors. 0 gives straight lines between points; for closed loops, 0.5 
+    traces the same curve as catmull_rom_points(). Open ends act as though 
+    the path continued straight on past its first & last points
+
+    As described at: https://www.algosome.com/articles/continuous-bezier-curve-line.html
+    """
+    pts = _xyz_tuples(points)
+    if close_loop:
+        neighbors = [pts[-1]] + pts + [pts[0], pts[1]]
+    else:
+        before = _sub(pts[0], _sub(pts[1], pts[0]))
+        after = _add(pts[-1], _sub(pts[-1], pts[-2]))
+        neighbors = [before] + pts + [after]
+
+    factor = smoothing / 3
+    handles = [_scaled(_sub(neighbors[i + 2], neighbors[i]), factor) for i in range(len(neighbors) - 2)]
+    curve_count = len(pts) if close_loop else len(pts) - 1
+    curves = []
+    for i in range(curve_count):
+        j = (i + 1) % len(pts)
+        curves.append([pts[i], _add(pts[i], handles[i]), _sub(pts[j], handles[j]), pts[j]])
+
+    # Each curve starts where the last one ended, so only keep the final
+    # point of the final curve, and only for open curves
+    chain: List[Point3] = []
+    last_curve = len(curves) - 1
+    for curve in bezier_tuples_batch(curves[:last_curve], subdivisions, include_last=False):
+        chain += [Point3(*p) for p in curve]
+    chain += bezier_points(curves[last_curve], subdivisions, include_last=not close_loop)
+    return chain
+
+# Bernstein basis values, keyed on (degree, subdivisions, include_last)
+_bernstein_tables: Dict[Tuple[int, int, bool], List[Tuple[float, ...]]] = {}
+
+def _bernstein_table(degree: int, subdivisions: int, include_last: bool=True) -> List[Tuple[float, ...]]:
+    """
+    For each step u along a curve, the weight of each control point
+    """
+    key = (degree, subdivisions, include_last)
+    table = _bernstein_tables.get(key)
+    if table is None:
+        last_elt = 1 if include_last else 0
+        us = [i/subdivisions for i in range(subdivisions + last_elt)]
+        if degree == 3:
+            # Cubics are by far the most common; use the same functions
+            # bezier_points() always has, so points are unchanged
+            table = [(_bez03(u), _bez13(u), _bez23(u), _bez33(u)) for u in us]
+        else:
+            # Binomial coefficients: row `degree` of Pascal's triangle
+            coefficients = [1]
+            for k in range(degree):
+                coefficients.append(coefficients[k] * (degree - k) // (k + 1))
+            table = [tuple(c * pow(u, k) * pow(1 - u, degree - k) for k, c in enumerate(coefficients)) 
+                     for u in us]
+        _bernstein_tables[key] = table
+    return table
+
+def _weighted_sum(weights: Sequence[float], values: Sequence[float]) -> float:
+    total = weights[0] * values[0]
+    for w, v in zip(weights[1:], values[1:]):
+        total += w * v
+    return total
 
 def _point_along_bez4(p0: Point23Input, p1: Point23Input, p2: Point23Input, p3: Point23Input, u:float) -> Point3:
     p0 = euclidify(p0)
@@ -380,6 +481,19 @@ def face_strip_list(a_start:int,  b_start:int, length:int, close_loop:bool=False
         faces.append((a+loop, a, b))
     return faces
 
+def _grid_faces(row_count:int, row_length:int, close_loop:bool=False, reverse_rows:bool=False) -> List[FaceTrio]:
+    # Faces joining each of row_count rows of row_length vertices to the 
+    # next row, as face_strip_list() would make them one row at a time. 
+    # With reverse_rows, each strip is face_strip_list(next_row, row) instead.
+    # The faces for every strip are the same, offset by row_length indices per row
+    if reverse_rows:
+        strip = face_strip_list(row_length, 0, row_length, close_loop)
+    else:
+        strip = face_strip_list(0, row_length, row_length, close_loop)
+    return [(a + offset, b + offset, c + offset) 
+            for offset in range(0, (row_count - 1) * row_length, row_length) 
+            for a, b, c in strip]
+
 def fan_endcap_list(cap_points:int=3, index_start:int=0) -> List[FaceTrio]:
     '''
     Return a face-triangles list for the endpoint of a tube with cap_points points
@@ -428,7 +542,7 @@ def centroid_endcap(tube_points:Sequence[Point3], indices:Sequence[int], invert:
     faces.append((centroid_index, indices[-1], indices[0]))
 
     if invert:
-        faces = list((reversed(f) for f in faces)) # type: ignore
+        faces = [f[::-1] for f in faces]
 
     return (center, faces)
 
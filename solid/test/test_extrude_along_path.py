@@ -1,10 +1,12 @@
 #! /usr/bin/env python3
 import unittest
 import re
+from math import cos, sin, radians
 
 from solid import OpenSCADObject, scad_render
-from solid.utils import extrude_along_path
-from euclid3 import Point2, Point3
+from solid.utils import extrude_along_path, batch_transform
+from solid.examples.extrude_benchmark_example import euclid3_extrude_points, helix_path, star_profile
+from euclid3 import LineSegment3, Point2, Point3
 
 from typing import Union
 
@@ -106,6 +108,110 @@ class TestExtrudeAlongPath(unittest.TestCase):
         expected = 'polyhedron(convexity=10,faces=[[0,1,3],[1,4,3],[1,2,4],[2,5,4],[2,0,5],[0,3,5],[2,1,0],[3,4,5]],points=[[0.0000000000,0.0000000000,0.0000000000],[0.0000000000,-20.0000000000,0.0000000000],[0.0000000000,0.0000000000,20.0000000000],[20.0000000000,0.0000000000,0.0000000000],[20.0000000000,-20.0000000000,0.0000000000],[20.0000000000,0.0000000000,20.0000000000]]);'
         self.assertEqualOpenScadObject(expected, actual)
 
+    def test_extrude_along_path_minimize_twist(self):
+        # Frames along a planar path don't twist, so both modes should agree
+        path = [[0, 0, 0], [20, 0, 0], [20, 20, 0], [0, 20, 0]]
+        expected = scad_render(extrude_along_path(tri, path, connect_ends=True))
+        actual = extrude_along_path(tri, path, connect_ends=True, minimize_twist=True)
+        self.assertEqualOpenScadObject(expected, actual)
+
+        # Along a steep helix, look-at frames flip as the path passes vertical;
+        # rotation-minimizing frames should turn only a little per step
+        steps = 36
+        helix = [[10*cos(radians(a)), 10*sin(radians(a)), a] for a in range(0, 360, 360//steps)]
+        poly = extrude_along_path(tri, helix, minimize_twist=True)
+        pts = poly.params['points']
+        for i in range(steps - 1):
+            a, b = Point3(*pts[3*i]), Point3(*pts[3*i + 3])
+            prev_x = Point3(*pts[3*i + 1]) - a
+            next_x = Point3(*pts[3*i + 4]) - b
+            self.assertGreater(prev_x.normalized().dot(next_x.normalized()), 0.9)
+
+    def test_extrude_along_path_resampling(self):
+        # Collinear points are merged away...
+        path = [[0, 0, 0], [5, 0, 0], [10, 0, 0], [20, 0, 0]]
+        expected = scad_render(extrude_along_path(tri, [[0, 0, 0], [20, 0, 0]]))
+        actual = extrude_along_path(tri, path, chord_tolerance=0.01)
+        self.assertEqualOpenScadObject(expected, actual)
+
+        # ... while sharp bends gain points, keeping the originals
+        path = [[0, 0, 0], [20, 0, 0], [20, 20, 0], [0, 20, 0]]
+        poly = extrude_along_path(tri, path, max_bend=15, scales=[1, 2, 3, 4])
+        pts = poly.params['points']
+        loop_starts = [tuple(pts[i]) for i in range(0, len(pts), len(tri))]
+        self.assertGreater(len(loop_starts), len(path))
+        for p in path:
+            self.assertIn(tuple(p), [tuple(round(c, 9) for c in l) for l in loop_starts])
+
+    def test_extrude_along_path_resampling_closed(self):
+        # Most of the last side is merged into one segment, which is then subdivided
+        # at its sharp ends. New points stay close to the original square,
+        # and take their scales from the original points they fall between
+        path = [[0, 0, 0], [10, 0, 0], [10, 10, 0], [0, 10, 0], [0, 7.5, 0], [0, 5, 0], [0, 2.5, 0]]
+        scales = [1, 1, 1, 1, 1, 1, 5]
+        poly = extrude_along_path(tri, path, scales=scales, connect_ends=True, chord_tolerance=0.01, max_bend=10)
+        pts = poly.params['points']
+        loop_starts = pts[::len(tri)]
+        self.assertGreater(len(loop_starts), len(path))
+        for x, y, z in loop_starts:
+            self.assertLessEqual(max(-x, -y, x - 10, y - 10), 0.01)
+
+        # tri's first two points are 10 apart before scaling
+        sizes = [Point3(*pts[i + 1]).distance(Point3(*pts[i])) / 10 for i in range(0, len(pts), len(tri))]
+        self.assertGreater(max(sizes), 4)
+        self.assertAlmostEqual(1, min(sizes))
+
+    def test_extrude_along_path_resampling_closed_loose(self):
+        # Loose limits still leave a closed path that encloses something,
+        # within chord_tolerance of the original
+        square = [[0, 0, 0], [10, 0, 0], [10, 10, 0], [0, 10, 0]]
+        circle = [[10 * cos(radians(a)), 10 * sin(radians(a)), 0] for a in range(0, 360, 15)]
+        for path, kwargs in [(square, {'max_bend': 100}),
+                             (square, {'chord_tolerance': 8}),
+                             (circle, {'chord_tolerance': 3})]:
+            poly = extrude_along_path(tri, path, connect_ends=True, **kwargs)
+            loop_starts = [Point3(*p) for p in poly.params['points'][::len(tri)]]
+            self.assertGreaterEqual(len(loop_starts), 3)
+            area = sum(a.x * b.y - b.x * a.y for a, b in zip(loop_starts, loop_starts[1:] + loop_starts[:1])) / 2
+            self.assertGreater(area, 40)
+
+            tolerance = kwargs.get('chord_tolerance')
+            if tolerance:
+                segments = list(zip(loop_starts, loop_starts[1:] + loop_starts[:1]))
+                for p in path:
+                    distance = min(LineSegment3(a, b).connect(Point3(*p)).length for a, b in segments)
+                    self.assertLessEqual(distance, tolerance + 1e-9)
+
+    def test_extrude_along_path_batch_transforms(self):
+        path = [[0,0,0], [20, 0,0 ]]
+        per_point = [lambda p, path, loop: (1 + path + loop) * p]
+        expected = scad_render(extrude_along_path(tri, path, transforms=per_point))
+
+        @batch_transform
+        def batched(points, path, loops):
+            return [[(1 + path + loop) * c for c in p] for p, loop in zip(points, loops)]
+
+        actual = extrude_along_path(tri, path, transforms=[batched])
+        self.assertEqualOpenScadObject(expected, actual)
+
+    def test_extrude_along_path_matches_euclid3(self):
+        # The tuple math should place points where the old per-loop euclid3
+        # Matrix4s did
+        profile = star_profile(12)
+        path = helix_path(40)
+        scales = [(1 + 0.5 * sin(i), 1 - 0.25 * cos(i)) for i in range(len(path))]
+        wobble = lambda p, path, loop: Point3(p.x * (1 + path), p.y + loop, p.z)
+        for case, kwargs in enumerate([dict(scales=scales, rotations=[720]),
+                       dict(rotations=[15 * i for i in range(len(path))], transforms=[wobble]),
+                       dict(scales=scales, rotations=[90], transforms=[wobble], connect_ends=True)]):
+            with self.subTest(case=case):
+                expected = euclid3_extrude_points(profile, path, **kwargs)
+                actual = extrude_along_path(profile, path, **kwargs).params['points']
+                self.assertEqual(len(expected), len(actual))
+                for e, a in zip(expected, actual):
+                    for e_c, a_c in zip(e, a):
+                        self.assertAlmostEqual(e_c, a_c)
+
     def test_extrude_along_path_numpy(self):
         try: 
             import numpy as np # type: ignore
@@ -0,0 +1,68 @@
+#! /usr/bin/env python
+
+import unittest
+from math import pi
+from solid import polygon, scad_render
+from solid.test.ExpandedTestCase import DiffOutput
+from solid.point_array import PointArray
+from solid.utils import apply_matrix, bounding_box, euclidify, look_at_matrices, transform_to_points
+from euclid3 import Matrix4, Point2, Point3, Vector3
+
+class TestPointArray(DiffOutput):
+    def setUp(self):
+        self.tuples = [(1, 2, 3), (4, 5, 6), (0, 1, 0)]
+        self.points = PointArray(self.tuples)
+
+    def test_sequence(self):
+        self.assertEqual(3, len(self.points))
+        self.assertEqual((4, 5, 6), self.points[1])
+        self.assertEqual((0, 1, 0), self.points[-1])
+        self.assertEqual(self.tuples, list(self.points))
+        self.assertEqual(PointArray(self.tuples[::2]), self.points[::2])
+        self.assertEqual(PointArray(self.tuples[1:]), self.points[1:])
+
+        # Mixed input; 2D points get z == 0, 3D points lose z in 2D arrays
+        mixed = [(1, 2), Point3(3, 4, 5), [6, 7, 8]]
+        self.assertEqual([(1, 2, 0), (3, 4, 5), (6, 7, 8)], PointArray(mixed).tuples())
+        self.assertEqual([(1, 2), (3, 4), (6, 7)], PointArray(mixed, 2).tuples())
+        self.assertEqual(PointArray(mixed, 2), PointArray(PointArray(mixed), 2))
+
+        with self.assertRaises(ValueError):
+            PointArray.from_flat([1, 2, 3, 4], 3)
+
+    def test_vector_math(self):
+        self.assertEqual([(2, 3, 4), (5, 6, 7), (1, 2, 1)], (self.points + (1, 1, 1)).tuples())
+        self.assertEqual(PointArray([(0, 0, 0)] * 3), self.points - self.points)
+        self.assertEqual([(2, 4, 6), (8, 10, 12), (0, 2, 0)], (2 * self.points).tuples())
+        self.assertEqual([(1, 0, 6), (4, 0, 12), (0, 0, 0)], self.points.scale((1, 0, 2)).tuples())
+        self.assertEqual([1, 4, 0], list(self.points.dot((1, 0, 0))))
+        self.assertEqual([(2, -1, 0), (5, -4, 0), (1, 0, 0)], self.points.cross((0, 0, 1)).tuples())
+        self.assertEqual([(0, 0, 0), (0, 1, 0)], PointArray([(0, 0, 0), (0, 3, 0)]).normalized().tuples())
+
+    def test_matches_euclid(self):
+        # rotate_around() and transform() match euclid3 exactly
+        axis = Vector3(1, 2, 3)
+        expected = [tuple(Vector3(*p).rotate_around(axis, pi / 5)) for p in self.tuples]
+        self.assertEqual(expected, self.points.rotate_around(axis, pi / 5).tuples())
+
+        m = Matrix4.new_rotatez(0.3).translate(1, 2, 3)
+        expected = [tuple(m * Point3(*p)) for p in self.tuples]
+        self.assertEqual(expected, self.points.transform(m).tuples())
+
+    def test_utils(self):
+        # PointArrays go through the utils point helpers without conversion
+        square = PointArray([(0, 0), (10, 0), (10, 10), (0, 10)], 2)
+        self.assertEqual(((0, 0, 0), (10, 10, 0)), bounding_box(square))
+        self.assertEqual([Point2(0, 0), Point2(10, 0), Point2(10, 10), Point2(0, 10)], euclidify(square, Point2))
+
+        m = look_at_matrices([(1, 2, 3)], [(0, 0, 1)])[0]
+        expected = PointArray(apply_matrix(m, self.tuples))
+        self.assertEqual(expected, apply_matrix(m, self.points))
+        self.assertEqual([expected], transform_to_points(self.points, [(1, 2, 3)], [(0, 0, 1)]))
+
+        expected = scad_render(polygon(points=[[0.0, 0.0], [10.0, 0.0], [10.0, 10.0], [0.0, 10.0]]))
+        self.assertEqual(expected, scad_render(polygon(points=square)))
+
+
+if __name__ == '__main__':
+    unittest.main()
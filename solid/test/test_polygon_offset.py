@@ -0,0 +1,103 @@
+#! /usr/bin/env python
+
+import unittest
+from math import pi
+from solid.test.ExpandedTestCase import DiffOutput
+from solid.polygon_offset import offset_polygon, offset_polygon_points, point_in_polygon, signed_area, winding_number
+from euclid3 import Point2
+
+SQUARE = [(0, 0), (10, 0), (10, 10), (0, 10)]
+HOLE = [(3, 3), (3, 7), (7, 7), (7, 3)]
+
+class TestPolygonOffset(DiffOutput):
+    def test_signed_area(self):
+        self.assertEqual(100, signed_area(SQUARE))
+        self.assertEqual(-100, signed_area(SQUARE[::-1]))
+
+    def test_winding_number(self):
+        self.assertEqual(1, winding_number((5, 5), SQUARE))
+        self.assertEqual(-1, winding_number((5, 5), SQUARE[::-1]))
+        self.assertEqual(0, winding_number((15, 5), SQUARE))
+        self.assertTrue(point_in_polygon((1, 1), [SQUARE, HOLE]))
+        self.assertFalse(point_in_polygon((5, 5), [SQUARE, HOLE]))
+
+    def test_offset_joins(self):
+        actual = offset_polygon_points(SQUARE, 1, join='miter')
+        expected = [[(-1, -1), (11, -1), (11, 11), (-1, 11)]]
+        self.assertEqual(expected, actual)
+
+        actual = offset_polygon_points(SQUARE, 1, join='chamfer')
+        self.assertEqual(8, len(actual[0]))
+        self.assertAlmostEqual(144 - 2, signed_area(actual[0]))
+
+        actual = offset_polygon_points(SQUARE, 1, join='round', segments=360)
+        self.assertAlmostEqual(140 + pi, signed_area(actual[0]), places=3)
+
+        # Long miters are cut off at miter_limit * delta
+        spike = [(0, 0), (10, 0), (0, 1)]
+        actual = offset_polygon_points(spike, 1, join='miter', miter_limit=2)
+        self.assertLess(max(x for x, y in actual[0]), 12.1)
+        actual = offset_polygon_points(spike, 1, join='miter', miter_limit=100)
+        self.assertGreater(max(x for x, y in actual[0]), 25)
+
+        with self.assertRaises(ValueError):
+            offset_polygon_points(SQUARE, 1, join='bevel')
+
+    def test_offset_orientation(self):
+        # Points are accepted in either direction, and as euclid3 points.
+        # Results wind the same way as their input
+        actual = offset_polygon_points([Point2(*p) for p in SQUARE[::-1]], -1)
+        expected = [[(1, 9), (9, 9), (9, 1), (1, 1)]]
+        self.assertEqual(expected, actual)
+
+    def test_offset_concave(self):
+        # L shape, starting at its concave corner
+        l_shape = [(5, 5), (5, 10), (0, 10), (0, 0), (10, 0), (10, 5)]
+        actual = offset_polygon_points(l_shape, 1)
+        expected = [[(6, 6), (6, 11), (-1, 11), (-1, -1), (11, -1), (11, 6)]]
+        self.assertEqual(expected, actual)
+
+        actual = offset_polygon_points(l_shape, -1)
+        expected = [[(4, 4), (4, 9), (1, 9), (1, 1), (9, 1), (9, 4)]]
+        self.assertEqual(expected, actual)
+
+    def test_offset_collapse(self):
+        # Shrinking by the inradius or more leaves nothing
+        for delta in (-5, -6, -9.9, -10, -12):
+            self.assertEqual([], offset_polygon_points(SQUARE, delta))
+
+        triangle = [(0, 0), (10, 0), (5, 8)]
+        for join in ('miter', 'round', 'chamfer'):
+            self.assertEqual([], offset_polygon_points(triangle, -4, join=join))
+            # Just short of the inradius, a similar triangle remains
+            actual = offset_polygon_points(triangle, -1, join=join)
+            self.assertAlmostEqual(16.3405330189, signed_area(actual[0]))
+
+    def test_offset_self_intersecting(self):
+        # A dumbbell whose handle vanishes when shrunk splits into two squares
+        dumbbell = [(0, 0), (10, 0), (10, 4), (12, 4), (12, 0), (22, 0),
+                    (22, 10), (12, 10), (12, 6), (10, 6), (10, 10), (0, 10)]
+        actual = offset_polygon_points(dumbbell, -1.5)
+        self.assertEqual([49, 49], [signed_area(loop) for loop in actual])
+
+        # A C whose mouth closes when grown becomes a ring
+        c_shape = [(0, 0), (10, 0), (10, 4), (8, 4), (8, 2), (2, 2),
+                   (2, 8), (8, 8), (8, 6), (10, 6), (10, 10), (0, 10)]
+        actual = offset_polygon_points(c_shape, 1.5)
+        self.assertEqual([169, -9], [signed_area(loop) for loop in actual])
+
+    def test_offset_holes(self):
+        actual = offset_polygon_points([SQUARE, HOLE], 1)
+        self.assertEqual([144, -4], [signed_area(loop) for loop in actual])
+
+        # Holes grow until they swallow the whole polygon
+        self.assertEqual([], offset_polygon_points([SQUARE, HOLE], -4))
+
+    def test_offset_polygon(self):
+        poly = offset_polygon([SQUARE, HOLE], 1)
+        self.assertEqual([[0, 1, 2, 3], [4, 5, 6, 7]], poly.params['paths'])
+        self.assertEqual(8, len(poly.params['points']))
+
+
+if __name__ == '__main__':
+    unittest.main()
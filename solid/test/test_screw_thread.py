@@ -2,7 +2,7 @@
 import unittest
 import re
 
-from solid.screw_thread import default_thread_section, thread
+from solid.screw_thread import clear_thread_cache, default_thread_section, thread
 from solid.solidpython import scad_render
 from solid.test.ExpandedTestCase import DiffOutput
 
@@ -134,6 +134,60 @@ class TestScrewThread(DiffOutput):
         }'''
         self.assertEqualNoWhitespace(expected, actual)
 
+    def test_thread_cache(self):
+        kwargs = dict(outline_pts=self.outline, inner_rad=20, pitch=self.tooth_height,
+                      length=0.75 * self.tooth_height, segments_per_rot=SEGMENTS)
+        a = thread(**kwargs)
+        b = thread(**kwargs)
+        # Separate intersections around one shared polyhedron
+        self.assertIsNot(a, b)
+        self.assertIs(a.children[0], b.children[0])
+        self.assertEqual(scad_render(a), scad_render(b))
+
+        kwargs['inverse_thread_direction'] = True
+        c = thread(**kwargs)
+        self.assertIsNot(a.children[0], c.children[0])
+        # Reversed faces must survive rendering the shared node repeatedly
+        self.assertEqual(scad_render(c), scad_render(thread(**kwargs)))
+
+        clear_thread_cache()
+        self.assertIsNot(c.children[0], thread(**kwargs).children[0])
+
+    def test_thread_instanced(self):
+        actual_obj = thread(outline_pts=self.outline,
+                            inner_rad=20,
+                            pitch=self.tooth_height,
+                            length=2.5 * self.tooth_height,
+                            segments_per_rot=SEGMENTS,
+                            neck_in_degrees=45,
+                            neck_out_degrees=45,
+                            instanced=True)
+        neck_in, turn, turn_2, end = actual_obj.children[0].children
+        # The second turn is the first, moved up one pitch
+        self.assertEqual('translate', turn_2.name)
+        self.assertEqual([0, 0, self.tooth_height], turn_2.params['v'])
+        self.assertIs(turn, turn_2.children[0])
+
+        # Each piece starts where the previous one ends. Neck-in ends a full 
+        # segment (90 degrees) in, and the second turn ends at 90 + 720 degrees
+        def loops(poly):
+            pts = poly.params['points']
+            return pts[:len(self.outline)], pts[-len(self.outline):]
+        for (_, a_end), (b_start, _) in [(loops(neck_in), loops(turn))]:
+            for a, b in zip(a_end, b_start):
+                for i in range(3):
+                    self.assertAlmostEqual(a[i], b[i])
+        turn_end = [[x, y, z + self.tooth_height] for x, y, z in loops(turn)[1]]
+        for a, b in zip(turn_end, loops(end)[0]):
+            for i in range(3):
+                self.assertAlmostEqual(a[i], b[i])
+
+        # Conical threads can't be stacked, so get one polyhedron as usual
+        conical = thread(outline_pts=self.outline, inner_rad=20, rad_2=30, 
+                         pitch=self.tooth_height, length=2.5 * self.tooth_height,
+                         segments_per_rot=SEGMENTS, instanced=True)
+        self.assertEqual('polyhedron', conical.children[0].name)
+
 
 if __name__ == '__main__':
     unittest.main()
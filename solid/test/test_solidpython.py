@@ -1,8 +1,13 @@
 #! /usr/bin/env python
+import copy
+import gc
+import io
 import os
 import tempfile
 import unittest
+from contextlib import redirect_stdout
 from pathlib import Path
+from unittest import mock
 
 from solid.objects import background, circle, cube, cylinder, debug, disable
 from solid.objects import hole, import_scad, include, part, root, rotate, sphere
@@ -11,6 +16,7 @@ from solid.objects import import_, intersection, intersection_for, linear_extrud
 from solid.objects import import_stl, minkowski, mirror, multmatrix, offset, polygon
 from solid.objects import polyhedron, projection, render, resize, rotate_extrude
 from solid.objects import scale, surface, union
+from solid.objects import IMPORTED_SCAD_MODULES, LazySCADNamespace
 
 from solid.solidpython import scad_render, scad_render_animated_file, scad_render_to_file
 from solid.test.ExpandedTestCase import DiffOutput
@@ -271,6 +277,133 @@ class TestSolidPython(DiffOutput):
         mod2 = import_scad(include_file)
         self.assertEqual(mod1, mod2)
 
+    def test_import_scad_parallel(self):
+        include_file = self.expand_scad_path("examples/scad_to_include.scad")
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            lib_dir = Path(tmp_dir)
+            (lib_dir / 'sub').mkdir()
+            for p in [lib_dir / 'a.scad', lib_dir / 'sub' / 'b.scad']:
+                p.write_text(include_file.read_text())
+
+            parallel = import_scad(lib_dir, parallel=True)
+            del IMPORTED_SCAD_MODULES[lib_dir]
+            serial = import_scad(lib_dir)
+
+            self.assertEqual(sorted(vars(serial)), sorted(vars(parallel)))
+            self.assertEqual(sorted(vars(serial.sub.b)), sorted(vars(parallel.sub.b)))
+            actual = scad_render(parallel.sub.b.steps(3))
+            expected = scad_render(serial.sub.b.steps(3))
+            self.assertEqual(expected, actual)
+
+    def test_import_scad_lazy(self):
+        include_file = self.expand_scad_path("examples/scad_to_include.scad")
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            lib_dir = Path(tmp_dir)
+            (lib_dir / 'sub').mkdir()
+            (lib_dir / 'empty').mkdir()
+            for p in [lib_dir / 'a.scad', lib_dir / 'sub' / 'b.scad']:
+                p.write_text(include_file.read_text())
+
+            lazy = import_scad(lib_dir, lazy=True)
+            self.assertFalse(hasattr(lazy, 'empty'))
+            # Nothing is parsed until we look something up
+            self.assertEqual({}, vars(lazy.sub.b))
+
+            a = lazy.sub.b.steps(3)
+            expected = f"use <{lib_dir / 'sub' / 'b.scad'}>\n\n\nsteps(howmany = 3);"
+            self.assertEqual(expected, scad_render(a))
+            self.assertIn('blub', vars(lazy.sub.b))
+            self.assertEqual({}, vars(lazy.a))
+            self.assertRaises(AttributeError, getattr, lazy.sub.b, 'not_a_module')
+
+            # A load that fails is tried again on the next lookup
+            with mock.patch('solid.solidpython.parse_scad_callables', side_effect=OSError('busy')):
+                self.assertRaises(OSError, getattr, lazy.a, 'steps')
+            self.assertEqual(f"use <{lib_dir / 'a.scad'}>\n\n\nsteps(howmany = 3);", scad_render(lazy.a.steps(3)))
+
+            # Renamed identifiers load the file too
+            special = lib_dir / 'special.scad'
+            special.write_text('module $special(x=1){}\n')
+            self.assertEqual(f'use <{special}>\n\n\n$special(x = 2);', 
+                             scad_render(getattr(LazySCADNamespace(special), '__special')(x=2)))
+
+            # Copies keep their path, and whether they've been loaded
+            for copier in (copy.copy, copy.deepcopy):
+                self.assertIn('blub', vars(copier(lazy.a)))
+                unloaded = copier(LazySCADNamespace(include_file))
+                self.assertEqual({}, vars(unloaded))
+                self.assertIn('blub', dir(unloaded))
+
+    def test_refresh_scad_imports(self):
+        from solid.objects import refresh_scad_imports
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            lib_dir = Path(tmp_dir)
+            a, b = lib_dir / 'a.scad', lib_dir / 'b.scad'
+            a.write_text('module first(x=1){}\n')
+            b.write_text('module unchanged(y=1){}\n')
+            mod = import_scad(lib_dir)
+            unchanged = mod.b.unchanged
+
+            # Touching a file without changing it doesn't re-import it
+            os.utime(b, ns=(0, 0))
+            a.write_text('module second(x=1, y=2){}\n')
+            os.utime(a, ns=(10**9, 10**9))
+            self.assertEqual([a.absolute()], refresh_scad_imports())
+
+            self.assertFalse(hasattr(mod.a, 'first'))
+            self.assertEqual(f'use <{a}>\n\n\nsecond(y = 3);', scad_render(mod.a.second(y=3)))
+            self.assertIs(unchanged, mod.b.unchanged)
+            self.assertEqual([], refresh_scad_imports())
+
+            # A file that fails to parse is tried again on the next refresh
+            a.write_text('module third(z=3){}\n')
+            os.utime(a, ns=(2 * 10**9, 2 * 10**9))
+            with mock.patch('solid.solidpython.parse_scad_callables', side_effect=OSError('busy')):
+                self.assertEqual([], refresh_scad_imports())
+            self.assertTrue(hasattr(mod.a, 'second'))
+            self.assertEqual([a.absolute()], refresh_scad_imports())
+            self.assertTrue(hasattr(mod.a, 'third'))
+
+    def test_refresh_scad_imports_between_imports(self):
+        from solid.objects import refresh_scad_imports
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            a = Path(tmp_dir) / 'a.scad'
+            a.write_text('module first(x=1){}\n')
+            old_ns: dict = {}
+            use(a, dest_namespace_dict=old_ns)
+
+            # Just touching a file doesn't parse it again, even the first time
+            os.utime(a, ns=(10**9, 10**9))
+            with mock.patch('solid.solidpython.parse_scad_callables') as parse:
+                self.assertEqual([], refresh_scad_imports())
+            parse.assert_not_called()
+
+            # A file edited between two imports updates only the older one
+            a.write_text('module second(x=1, y=2){}\n')
+            os.utime(a, ns=(2 * 10**9, 2 * 10**9))
+            new_ns: dict = {}
+            use(a, dest_namespace_dict=new_ns)
+            second = new_ns['second']
+            self.assertEqual([a.absolute()], refresh_scad_imports())
+            self.assertNotIn('first', old_ns)
+            self.assertIn('second', old_ns)
+            self.assertIs(second, new_ns['second'])
+            self.assertEqual([], refresh_scad_imports())
+
+    def test_refresh_scad_imports_releases_namespaces(self):
+        from solid.objects import _scad_file_records, refresh_scad_imports
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            a = Path(tmp_dir) / 'a.scad'
+            a.write_text('module first(x=1){}\n')
+            mod = import_scad(a)
+            self.assertIn(a.absolute(), _scad_file_records)
+
+            # Tracking a namespace for refreshes doesn't keep it alive
+            del IMPORTED_SCAD_MODULES[a], mod
+            gc.collect()
+            self.assertEqual([], refresh_scad_imports())
+            self.assertNotIn(a.absolute(), _scad_file_records)
+
     def test_imported_scad_arguments(self):
         include_file = self.expand_scad_path("examples/scad_to_include.scad")
         mod = import_scad(include_file)
@@ -303,6 +436,49 @@ class TestSolidPython(DiffOutput):
         finally:
             os.remove(path)
 
+    def test_new_openscad_class(self):
+        import inspect
+        from solid.solidpython import new_openscad_class
+        include_file = self.expand_scad_path("examples/scad_to_include.scad")
+        blub = new_openscad_class('blub', ['a'], ['b', 'or'], include_file.as_posix())
+
+        self.assertEqual('(a, b=None, or_=None, **kwargs)', str(inspect.signature(blub)))
+        actual = scad_render(blub(1, or_=2, extra=3))
+        expected = f"use <{include_file}>\n\n\nblub(a = 1, extra = 3, or = 2);"
+        self.assertEqual(expected, actual)
+
+        self.assertRaises(TypeError, blub)
+        self.assertRaises(TypeError, blub, 1, 2, 3, 4)
+        self.assertRaises(TypeError, blub, 1, a=1)
+
+        # Renamed identifiers are reported once per file
+        def renames_reported(path):
+            out = io.StringIO()
+            with redirect_stdout(out):
+                new_openscad_class('blip', [], ['or', '$fa'], path)
+            return [line for line in out.getvalue().splitlines() if 'can be accessed with' in line]
+        self.assertEqual(['can be accessed with `or_` in SolidPython', 
+                          'can be accessed with `__fa` in SolidPython'], renames_reported('/tmp/renames_a.scad'))
+        self.assertEqual([], renames_reported('/tmp/renames_a.scad'))
+        self.assertEqual(2, len(renames_reported('/tmp/renames_b.scad')))
+
+    def test_include_path_cache(self):
+        from solid.solidpython import clear_include_path_cache
+        include_file = self.expand_scad_path("examples/scad_to_include.scad")
+        mod = import_scad(include_file)
+        first = mod.steps(1)
+
+        # Once a path is resolved, new instances don't touch the filesystem
+        with mock.patch('os.path.isfile', side_effect=AssertionError):
+            second = mod.steps(2)
+        self.assertEqual(first.include_file_path, second.include_file_path)
+        self.assertIs(first.include_string, second.include_string)
+
+        clear_include_path_cache()
+        with mock.patch('os.path.isfile', return_value=False):
+            self.assertRaises(ValueError, mod.steps, 3)
+        self.assertEqual(first.include_string, mod.steps(4).include_string)
+
     def test_include(self):
         include_file = self.expand_scad_path("examples/scad_to_include.scad")
         self.assertIsNotNone(include_file, 'examples/scad_to_include.scad not found')
@@ -4,7 +4,7 @@ import unittest
 from solid.test.ExpandedTestCase import DiffOutput
 from solid import *
 from solid.utils import euclidify
-from solid.splines import catmull_rom_points, catmull_rom_prism, bezier_points, bezier_polygon
+from solid.splines import catmull_rom_points, catmull_rom_tuples, catmull_rom_prism, bezier_points, bezier_polygon, bezier_tuples_batch, bezier_chain_points, face_strip_list
 from euclid3 import Point2, Point3, Vector2, Vector3
 from math import pi
 
@@ -53,11 +53,45 @@ class TestSplines(DiffOutput):
         actual = catmull_rom_points(points, subdivisions=2)
         self.assertPointsListsEqual(expected, actual)
 
+    def test_catmull_rom_tuples(self):
+        for close_loop in (False, True):
+            expected = [tuple(p) for p in catmull_rom_points(self.points, subdivisions=3, close_loop=close_loop)]
+            actual = catmull_rom_tuples(self.points_raw, subdivisions=3, close_loop=close_loop)
+            self.assertEqual(expected, actual)
+
     def test_bezier_points(self):
         expected = [Point3(0.00, 0.00), Point3(1.38, 0.62), Point3(2.00, -1.00)]
         actual = bezier_points(self.bezier_controls, subdivisions=self.subdivisions)
         self.assertPointsListsEqual(expected, actual)
 
+    def test_bezier_points_degree_n(self):
+        # A quadratic curve, and a straight line
+        expected = [Point3(0.00, 0.00), Point3(1.00, 0.50), Point3(2.00, 0.00)]
+        actual = bezier_points([(0, 0), (1, 1), (2, 0)], subdivisions=self.subdivisions)
+        self.assertPointsListsEqual(expected, actual)
+
+        expected = [(0, 0, 0), (1.0, 2.0, 0.0), (2, 4, 0)]
+        actual = bezier_tuples_batch([[(0, 0), (2, 4)]], subdivisions=self.subdivisions)[0]
+        self.assertEqual(expected, actual)
+
+    def test_bezier_tuples_batch(self):
+        curves = [self.bezier_controls, self.bezier_controls_raw[::-1]]
+        expected = [[tuple(p) for p in bezier_points(c, subdivisions=self.subdivisions)] for c in curves]
+        actual = bezier_tuples_batch(curves, subdivisions=self.subdivisions)
+        self.assertEqual(expected, actual)
+
+    def test_bezier_chain_points(self):
+        points = self.points_raw + [(3, -1)]
+        actual = bezier_chain_points(points, subdivisions=self.subdivisions)
+        self.assertEqual((len(points) - 1) * self.subdivisions + 1, len(actual))
+        # The chain passes through every point
+        self.assertPointsListsEqual(euclidify(points, Point3), actual[::self.subdivisions])
+
+        # Closed chains trace the same curve as closed Catmull-Rom splines
+        expected = catmull_rom_points(points, subdivisions=self.subdivisions, close_loop=True)[:-1]
+        actual = bezier_chain_points(points, subdivisions=self.subdivisions, close_loop=True)
+        self.assertPointsListsEqual(expected, actual)
+
     def test_bezier_points_raw(self):
         # Verify that we can use raw sequences of floats as inputs (e.g [(1,2), (3.2,4)])
         # rather than sequences of Point2s
@@ -89,6 +123,28 @@ class TestSplines(DiffOutput):
         actual = (len(poly.params['points']), len(poly.params['faces']))
         expected = (37, 62)
         self.assertEqual(expected, actual)
+
+    def test_catmull_rom_prism_smooth_edges(self):
+        sides = 3
+        UP = Vector3(0,0,1)
+        control_points = [[10, 10, 0], [10, 10, 5], [8, 8, 15]]
+        angle_step = 2*pi/sides
+        cat_tube = [[euclidify(p, Point3).rotate_around(UP, angle_step*i) for p in control_points] 
+                    for i in range(sides)]
+
+        poly = catmull_rom_prism(cat_tube, self.subdivisions, closed_ring=True, add_caps=True, smooth_edges=True)
+        points, faces = poly.params['points'], poly.params['faces']
+        # 5 contours of 7 points, plus a centroid for each cap
+        self.assertEqual(37, len(points))
+        self.assertEqual(4 * 14 + 2 * 7, len(faces))
+
+        # Each contour is the Catmull-Rom loop through the expanded control curves
+        expanded = [catmull_rom_points(c, self.subdivisions) for c in cat_tube]
+        expected = catmull_rom_points([c[1] for c in expanded], self.subdivisions, close_loop=True)
+        self.assertEqual([tuple(p) for p in expected], points[7:14])
+
+        # Faces join consecutive contours, as face_strip_list() would
+        self.assertEqual(face_strip_list(14, 7, 7, close_loop=True), [tuple(f) for f in faces[14:28]])
       
 
 
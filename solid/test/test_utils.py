@@ -6,15 +6,22 @@ import re
 from euclid3 import Point3, Vector3, Point2
 
 from solid import scad_render
-from solid.objects import cube, polygon, sphere, translate
+from solid.objects import cube, cylinder, hole, linear_extrude, polygon, rotate, sphere, square, text, translate
 from solid.test.ExpandedTestCase import DiffOutput
 from solid.utils import BoundingBox, arc, arc_inverted, euc_to_arr, euclidify 
-from solid.utils import extrude_along_path, fillet_2d, is_scad, offset_points
+from solid.utils import arc_points, arc_inverted_points
+from solid.utils import extrude_along_path, fillet_2d, fillet_points, is_scad, offset_points, offset_point_tuples
 from solid.utils import split_body_planar, transform_to_point, project_to_2D
 from solid.utils import path_2d, path_2d_polygon
 from solid.utils import FORWARD_VEC, RIGHT_VEC, UP_VEC
 from solid.utils import back, down, forward, left, right, up
 from solid.utils import label
+from solid.utils import clear_bounds_cache, distribute_in_grid, object_bounds
+from solid.utils import bounding_box, bounding_box_stream
+from solid.utils import pack_on_plates, pack_rectangles
+from solid.utils import apply_matrix, look_at_matrices, transform_to_points
+from array import array
+from math import pi
 
 from typing import Union
 
@@ -106,6 +113,54 @@ class TestSPUtils(DiffOutput):
         expected = 'difference(){polygon(points=[[0,0],[10,0],[0,10]]);translate(v=[5.1715728753,2.0000000000]){difference(){intersection(){rotate(a=-90.1000000000){translate(v=[-998,0,0]){square(center=false,size=[1000,1000]);}}rotate(a=45.1000000000){translate(v=[-998,-1000,0]){square(center=false,size=[1000,1000]);}}}circle(r=2);}}}'
         self.assertEqualOpenScadObject(expected, actual)
     
+    def test_arc_points(self):
+        expected = [(10, 0), (7.071067812, 7.071067812), (0, 10)]
+        actual = arc_points(10, 0, 90, segments=8)
+        self.assertEqual(expected, [(round(x, 9), round(y, 9)) for x, y in actual])
+
+        # Cached arcs come back as new lists, moved to center
+        actual.append((0, 0))
+        expected = [(11, 2), (8.071067812, 9.071067812), (1, 12)]
+        actual = arc_points(10, 0, 90, segments=8, center=(1, 2))
+        self.assertEqual(expected, [(round(x, 9), round(y, 9)) for x, y in actual])
+
+        # With no segments, as many as OpenSCAD's default for the radius
+        self.assertEqual(31, len(arc_points(10, 0, 360)))
+        self.assertEqual(6, len(arc_points(0.5, 0, 360)))
+
+    def test_arc_inverted_points(self):
+        expected = [(10, 10), (10, 0), (7.071067812, 7.071067812), (0, 10)]
+        for start, end in [(0, 90), (90, 0)]:
+            actual = arc_inverted_points(10, start, end, segments=8)
+            self.assertEqual(expected, [(round(x, 9) + 0, round(y, 9) + 0) for x, y in actual])
+
+        with self.assertRaises(ValueError):
+            arc_inverted_points(10, 0, 180)
+
+    def test_fillet_2d_batch(self):
+        pts = [[0, 5], [5, 5], [5, 0], [10, 0], [10, 10], [0, 10], ]
+        three_points = [euclidify(pts[0:3], Point2)]
+        actual = fillet_2d(three_points, orig_poly=polygon(pts), fillet_rad=2, remove_material=False, batch=True, segments=8)
+        expected = 'polygon(points=[[0,5],[3.0000000000,5.0000000000],[4.4142135624,4.4142135624],[5.0000000000,3.0000000000],[5,0],[10,0],[10,10],[0,10]]);'
+        self.assertEqualOpenScadObject(expected, actual)
+
+        # Removing material from a concave corner leaves it unchanged, as 
+        # the boolean version does
+        actual = fillet_2d(three_points, orig_poly=polygon(pts), fillet_rad=2, remove_material=True, batch=True)
+        self.assertEqualOpenScadObject(scad_render(polygon(pts)), actual)
+
+    def test_fillet_points(self):
+        square = [(0, 0), (10, 0), (10, 10), (0, 10)]
+        expected = [(0, 0), (8, 0), (10, 2), (10, 10), (0, 10)]
+        actual = fillet_points(square, 2, corners=[1], segments=4)
+        self.assertEqual(expected, [(round(x, 9), round(y, 9)) for x, y in actual])
+
+        # Every corner rounded; close to the area of a rounded square
+        actual = fillet_points(square, 2, segments=360)
+        self.assertEqual(4 * 91, len(actual))
+        area = sum(x0 * y1 - x1 * y0 for (x0, y0), (x1, y1) in zip(actual, actual[1:] + actual[:1])) / 2
+        self.assertAlmostEqual(100 - (16 - 4 * pi), area, places=2)
+
     def test_euclidify_non_mutating(self):
         base_tri = [Point2(0, 0), Point2(10, 0), Point2(0, 10)]
         next_tri = euclidify(base_tri, Point2)
@@ -113,6 +168,18 @@ class TestSPUtils(DiffOutput):
         actual = len(base_tri)
         self.assertEqual(expected, actual, 'euclidify should not mutate its arguments')
 
+    def test_euclidify_mixed(self):
+        # Lists of one type and lists of several types convert alike
+        expected = [Point3(0, 1, 0), Point3(2, 3, 4), Point3(5, 6, 0), Point3(7, 8, 9)]
+        mixed = [(0, 1), Vector3(2, 3, 4), Point2(5, 6), [7, 8, 9, 10]]
+        self.assertEqual(expected, euclidify(mixed, Point3))
+        for p in mixed:
+            self.assertEqual([euclidify(p, Point2)], euclidify([p, p], Point2)[:1])
+
+        points = euclidify([(0, 1, 2), (3, 4, 5)], Point3)
+        self.assertEqual([[0, 1, 2], [3, 4, 5]], euc_to_arr(points))
+        self.assertEqual([[0, 1, 2], [3, 4]], euc_to_arr([points[0], Point2(3, 4)]))
+
     def test_offset_points_closed(self):
         actual = euc_to_arr(offset_points(tri, offset=1, closed=True))
         expected = [[1.0, 1.0], [7.585786437626904, 1.0], [1.0, 7.585786437626905]]
@@ -123,6 +190,14 @@ class TestSPUtils(DiffOutput):
         expected = [[0.0, 1.0], [7.585786437626904, 1.0], [-0.7071067811865479, 9.292893218813452]]
         self.assertEqual(expected, actual)
 
+    def test_offset_points_parallel(self):
+        # Colinear & zero-length segments offset to the end of the incoming segment
+        points = [(0, 0), (5, 0), (10, 0), (10, 0), (10, 5)]
+        actual = offset_point_tuples(points, offset=1, closed=False)
+        expected = [(0, -1), (5, -1), (10, -1), (11, 0), (11, 5)]
+        self.assertEqual(expected, actual)
+        self.assertEqual([list(p) for p in expected], euc_to_arr(offset_points(points, offset=1, closed=False)))
+
     def test_path_2d(self):
         base_tri = [Point2(0, 0), Point2(10, 0), Point2(10, 10)]
         actual = euc_to_arr(path_2d(base_tri, width=2, closed=False))
@@ -147,6 +222,157 @@ class TestSPUtils(DiffOutput):
         actual = poly.params['paths']
         self.assertEqual(expected, actual)
 
+    def test_bounding_box(self):
+        points = [(1, -2, 3), Point3(-4, 5, 0), (2, 2)]
+        expected = ((-4, -2, 0), (2, 5, 3))
+        self.assertEqual(expected, bounding_box(points))
+        self.assertEqual(expected, bounding_box(iter(points)))
+
+        # Flat arrays of coordinates
+        flat = array('d', [1, -2, 3, -4, 5, 0, 2, 2, 0])
+        self.assertEqual(expected, bounding_box(flat))
+        self.assertEqual(((1, -4, 0), (5, 0, 0)), bounding_box(flat[:6], dimensions=2))
+
+        # Streams of chunks, including empty chunks & generators
+        chunks = iter([points[:1], [], (p for p in points[1:])])
+        self.assertEqual(expected, bounding_box_stream(chunks))
+
+        with self.assertRaises(ValueError):
+            bounding_box([])
+
+        # Errors from the points iterator itself aren't mistaken for
+        # points of another size
+        def bad_mesh():
+            yield (0, 0, 0)
+            yield (4, 5, 6)
+            yield tuple(float(v) for v in '1 2 x'.split())
+        with self.assertRaises(ValueError):
+            bounding_box(bad_mesh())
+
+    def test_object_bounds(self):
+        test_cases = [
+            (cube(10), ((0, 0, 0), (10, 10, 10))),
+            (translate([5, 0, 0])(cube(10, center=True)), ((0, -5, -5), (10, 5, 5))),
+            (cylinder(r1=2, r2=5, h=10) - up(50)(cube(100)), ((-5, -5, 0), (5, 5, 10))),
+            (cube(10) * translate([5, 5, 5])(cube(10)), ((5, 5, 5), (10, 10, 10))),
+            (up(5)(sphere(3)) + hole()(cube(100)), ((-3, -3, 2), (3, 3, 8))),
+            (linear_extrude(height=5)(square([2, 3])), ((0, 0, 0), (2, 3, 5))),
+            (polygon([(1, 2), (3, 4), (0, 5)]), ((0, 2, 0), (3, 5, 0))),
+        ]
+        for obj, expected in test_cases:
+            actual = object_bounds(obj)
+            for act, exp in zip(actual, expected):
+                for a, e in zip(act, exp):
+                    self.assertAlmostEqual(e, a)
+
+        # Rotated boxes are bounded by their rotated corners
+        lo, hi = object_bounds(rotate(a=90)(cube([10, 2, 1])))
+        self.assertEqual([-2, 0, 0], [round(v, 9) for v in lo])
+        self.assertEqual([0, 10, 1], [round(v, 9) for v in hi])
+
+        # Disjoint intersections & disabled objects have no bounds
+        self.assertIsNone(object_bounds(cube(1) * right(5)(cube(1))))
+        self.assertIsNone(object_bounds(cube(1).set_modifier('*')))
+
+        # Cached bounds follow changes made anywhere in a tree through 
+        # OpenSCADObject's methods
+        c = cube(1)
+        obj = right(1)(c)
+        self.assertEqual(((1, 0, 0), (2, 1, 1)), object_bounds(obj))
+        c.add_param('size', 5)
+        self.assertEqual(((1, 0, 0), (6, 5, 5)), object_bounds(obj))
+        obj.add(up(10)(cube(1)))
+        self.assertEqual(((1, 0, 0), (6, 5, 11)), object_bounds(obj))
+        c.set_modifier('*')
+        self.assertEqual(((1, 0, 10), (2, 1, 11)), object_bounds(obj))
+
+        # Building new objects from measured ones keeps their caches
+        cached = c._bounds_cache
+        right(5)(obj) + cube(3)
+        self.assertIs(cached, c._bounds_cache)
+        object_bounds(c)
+        self.assertIs(cached, c._bounds_cache)
+
+        # Changes made directly need clear_bounds_cache()
+        poly = polygon([[0, 0], [1, 0], [0, 1]])
+        self.assertEqual(((0, 0, 0), (1, 1, 0)), object_bounds(poly))
+        poly.params['points'].append([5, 5])
+        clear_bounds_cache()
+        self.assertEqual(((0, 0, 0), (5, 5, 0)), object_bounds(poly))
+
+        # Disabled & background children are skipped, as OpenSCAD does
+        base = cube(10).set_modifier('*')
+        self.assertEqual(((0, 0, 0), (2, 2, 2)), object_bounds(base - cube(2) - cube(1)))
+        base = cube(10).set_modifier('%')
+        self.assertEqual(((0, 0, 0), (2, 2, 2)), object_bounds(base * cube(2)))
+
+        with self.assertRaises(ValueError):
+            object_bounds(text('Hello'))
+
+    def test_distribute_in_grid_bounds(self):
+        objs = [translate([-5, -5, 0])(cube(2)), cube([4, 1, 1])]
+        actual = distribute_in_grid(objs)
+        # Cells are as large as the largest object, which moves into its cell
+        expected = 'union(){translate(v=[5,5,0]){translate(v=[-5,-5,0]){cube(size=2);}}translate(v=[4,0,0]){cube(size=[4,1,1]);}}'
+        self.assertEqualOpenScadObject(expected, actual)
+
+    def test_pack_rectangles(self):
+        sizes = [(30, 10), (10, 40), (20, 20), (45, 5), (20, 20)]
+        spacing = 2
+        positions = pack_rectangles(sizes, (50, 45), spacing=spacing)
+        rects = []
+        for (w, h), (plate, x, y, rotated) in zip(sizes, positions):
+            if rotated:
+                w, h = h, w
+            self.assertTrue(0 <= x and x + w <= 50 and 0 <= y and y + h <= 45)
+            rects.append((plate, x, y, x + w, y + h))
+        # No two parts on a plate are closer than spacing
+        for i, a in enumerate(rects):
+            for b in rects[i + 1:]:
+                overlaps = (a[0] == b[0] and a[1] < b[3] + spacing and b[1] < a[3] + spacing
+                            and a[2] < b[4] + spacing and b[2] < a[4] + spacing)
+                self.assertFalse(overlaps)
+        self.assertEqual({0, 1}, {r[0] for r in rects})
+
+        # Without rotation, the tall part needs its own plate
+        positions = pack_rectangles([(40, 10), (10, 40)], (40, 40), allow_rotation=False)
+        self.assertEqual([(0, 0, 0, False), (1, 0, 0, False)], positions)
+
+        with self.assertRaises(ValueError):
+            pack_rectangles([(60, 60)], (50, 50))
+
+    def test_pack_on_plates(self):
+        objs = [translate([-5, -5, 0])(cube([10, 4, 1])), cube([4, 10, 1])]
+        actual = pack_on_plates(objs, (20, 20), spacing=1)
+        self.assertEqual(1, len(actual))
+        # The first part moves to the origin; the second lies down above it
+        expected = 'union(){translate(v=[5,5.0000000000,0]){translate(v=[-5,-5,0]){cube(size=[10,4,1]);}}translate(v=[10,5.0000000000,0]){rotate(a=90){cube(size=[4,10,1]);}}}'
+        self.assertEqualOpenScadObject(expected, actual[0])
+
+        # Supplied footprints replace measured ones
+        actual = pack_on_plates(objs, (20, 20), footprints=[((0, 0), (20, 20)), None])
+        self.assertEqual(2, len(actual))
+
+    def test_transform_to_points(self):
+        # Includes normals parallel to src_up, which switch to another up vector
+        dest_points = [[2, 2, 2], (0, 0, 0), Point3(1, -1, 3)]
+        dest_normals = [[3, 3, 1], (0, 0, 1), Vector3(0, 0, -2)]
+        body = [[1, 0, 0], [0, 1, 0], [0, 0, 1]]
+        actual = transform_to_points(body, dest_points, dest_normals)
+        expected = [transform_to_point(body, p, n) for p, n in zip(dest_points, dest_normals)]
+        self.assertEqual(expected, actual)
+
+        actual = [scad_render(o) for o in transform_to_points(cube(2), dest_points, dest_normals)]
+        expected = [scad_render(transform_to_point(cube(2), p, n)) for p, n in zip(dest_points, dest_normals)]
+        self.assertEqual(expected, actual)
+
+        # An empty body stays empty at every destination
+        self.assertEqual([[], [], []], transform_to_points([], dest_points, dest_normals))
+        self.assertEqual([], transform_to_point((), dest_points[0], dest_normals[0]))
+
+        m = look_at_matrices([(1, 2, 3)], [(0, 1, 0)])[0]
+        self.assertEqual([[1, 2, 3], [2, 2, 4]], apply_matrix(m, [(0, 0, 0), (1, 1, 0)]))
+
     def test_label(self):
         expected = 'translate(v=[0,5.0000000000,0]){resize(newsize=[15,0,0.5000000000]){union(){translate(v=[0,0.0000000000,0]){linear_extrude(height=1){text($fn=40,font="MgOpenModata:style=Bold",halign="left",spacing=1,text="Hello,",valign="baseline");}}translate(v=[0,-11.5000000000,0]){linear_extrude(height=1){text($fn=40,font="MgOpenModata:style=Bold",halign="left",spacing=1,text="World",valign="baseline");}}}}}'
         actual = label("Hello,\nWorld")
@@ -1,22 +1,27 @@
 #! /usr/bin/env python
-from itertools import zip_longest
-from math import pi, ceil, floor, sqrt, atan2, degrees, radians
+from array import array
+from collections import OrderedDict
+from itertools import chain, repeat, starmap, zip_longest
+from math import pi, ceil, floor, sqrt, atan2, degrees, radians, sin, cos, tan
 
 from solid import union, cube, translate, rotate, square, circle, polyhedron, polygon
 from solid import difference, intersection, multmatrix, cylinder, color
 from solid import text, linear_extrude, resize
 from solid import run_euclid_patch
-from solid import OpenSCADObject, P2, P3, P4, Vec3 , Vec4, Vec34, P3s, P23
+from solid import OpenSCADObject, IncludedOpenSCADObject, P2, P3, P4, Vec3 , Vec4, Vec34, P3s, P23
 from solid import Points, Indexes, ScadSize
 
 from euclid3 import Point2, Point3, Vector2, Vector3, Line2, Line3
 from euclid3 import LineSegment2, LineSegment3, Matrix4
+
+from solid.point_array import PointArray
+from solid.polygon_offset import is_counterclockwise, signed_area
 run_euclid_patch()
 
 # ==========
 # = TYPING =
 # ==========
-from typing import Any, Union, Tuple, Sequence, List, Optional, Callable, Dict, cast
+from typing import Any, Union, Tuple, Sequence, List, Optional, Callable, Dict, Iterable, cast
 Point23 = Union[Point2, Point3]
 Vector23 = Union[Vector2, Vector3]
 PointVec23 = Union[Point2, Point3, Vector2, Vector3]
@@ -108,7 +113,7 @@ def grid_plane(grid_unit:int=12, count:int=10, line_weight:float=0.1, plane:str=
     return t
 
 def distribute_in_grid(objects:Sequence[OpenSCADObject], 
-                       max_bounding_box:Tuple[float,float], 
+                       max_bounding_box:Tuple[float,float]=None, 
                        rows_and_cols: Tuple[int,int]=None) -> OpenSCADObject:
     # Translate each object in objects in a grid with each cell of size
     # max_bounding_box.
@@ -116,14 +121,26 @@ def distribute_in_grid(objects:Sequence[OpenSCADObject],
     # objects:  array of SCAD objects
     # max_bounding_box: 2-tuple with x & y dimensions of grid cells.
     #   if a single number is passed, x  & y will both use it
+    #   If not supplied, cells are as large as the largest object's 
+    #   object_bounds(), and each object is moved so its bounds start 
+    #   at its cell's corner
     # rows_and_cols: 2-tuple of how many rows and columns to use. If
     #       not supplied, rows_and_cols will be the smallest square that
     #       can contain all members of objects (e.g, if len(objects) == 80,
     #       rows_and_cols will default to (9,9))
+    #
+    # For laying out differently sized parts on print plates, 
+    # pack_on_plates() uses far less space.
 
     # Distributes object in a grid in the xy plane
     # with objects spaced max_bounding_box apart
-    if isinstance(max_bounding_box, (list, tuple)):
+    offsets = [(0, 0)] * len(objects)
+    if max_bounding_box is None:
+        all_bounds = [object_bounds(o) or ((0, 0, 0), (0, 0, 0)) for o in objects]
+        x_trans = max(hi[0] - lo[0] for lo, hi in all_bounds)
+        y_trans = max(hi[1] - lo[1] for lo, hi in all_bounds)
+        offsets = [(-lo[0], -lo[1]) for lo, hi in all_bounds]
+    elif isinstance(max_bounding_box, (list, tuple)):
         x_trans, y_trans = max_bounding_box[0:2]
     elif isinstance(max_bounding_box, (int, float, complex)):
         x_trans = y_trans = max_bounding_box
@@ -140,13 +157,178 @@ def distribute_in_grid(objects:Sequence[OpenSCADObject],
     for y in range(grid_h):
         for x in range(grid_w):
             if objs_placed < len(objects):
+                x_offset, y_offset = offsets[objs_placed]
                 ret.append(
-                    translate((x * x_trans, y * y_trans, 0))(objects[objs_placed]))
+                    translate((x * x_trans + x_offset, y * y_trans + y_offset, 0))(objects[objs_placed]))
                 objs_placed += 1
             else:
                 break
     return union()(*ret)
 
+# ===========
+# = Packing =
+# ===========
+# Skyline bin packing: each plate keeps its "skyline", the top edge of 
+# everything placed so far, as a list of [x, y, width] segments from left to
+# right. Each part goes where its top edge would be lowest, then leftmost.
+# Space under overhangs is lost, but placing a part only touches the 
+# skyline, which stays short, so thousands of parts pack quickly.
+PackedPosition = Tuple[int, float, float, bool]
+
+def pack_rectangles(sizes: Sequence[Tuple2], 
+                    plate_size: Tuple2, 
+                    spacing: float = 0, 
+                    allow_rotation: bool = True) -> List[PackedPosition]:
+    '''
+    Pack rectangles of (width, height) `sizes` onto as few plates of 
+    `plate_size` as possible, with at least `spacing` between rectangles.
+
+    Returns a (plate_index, x, y, rotated) for each rectangle, in the order
+    of `sizes`. (x, y) is the rectangle's lower left corner; if `rotated`
+    is True, the rectangle is placed as (height, width).
+    Raises ValueError if a rectangle can't fit on an empty plate.
+    '''
+    # Pad every part and the plate by spacing, so gaps appear only 
+    # between parts, and not between parts & plate edges
+    plate_w, plate_h = plate_size[0] + spacing, plate_size[1] + spacing
+    padded = [(w + spacing, h + spacing) for w, h in sizes]
+    # Tallest parts first, so each row is as full as possible
+    order = sorted(range(len(padded)), key=lambda i: (-max(padded[i]), -min(padded[i])))
+
+    skylines: List[List[List[float]]] = []
+    floors: List[float] = []
+    rejects: List[Optional[Tuple2]] = []
+    positions: List[Optional[PackedPosition]] = [None] * len(padded)
+    for i in order:
+        w, h = padded[i]
+        if allow_rotation and w < h and h <= plate_w:
+            # Tall parts lie down; they stack better on a skyline
+            w, h = h, w
+        orientations = [(w, h, w != padded[i][0])]
+        if allow_rotation and w != h:
+            orientations.append((h, w, w == padded[i][0]))
+
+        # Skip plates whose lowest point is too high for this part, or
+        # that already turned away a part no larger than this one. Plates
+        # only fill up, so a part that didn't fit never will
+        size = (min(w, h), max(w, h)) if allow_rotation else (w, h)
+        ceiling = plate_h - min(w, h)
+        for plate, skyline in enumerate(skylines):
+            if floors[plate] > ceiling:
+                continue
+            rejected = rejects[plate]
+            if rejected and size[0] >= rejected[0] and size[1] >= rejected[1]:
+                continue
+            placed = _skyline_place(skyline, orientations, plate_w, plate_h)
+            if placed:
+                break
+            rejects[plate] = size
+        else:
+            plate, skyline = len(skylines), [[0, 0, plate_w]]
+            placed = _skyline_place(skyline, orientations, plate_w, plate_h)
+            if not placed:
+                raise ValueError(f'Part of size {tuple(sizes[i])} does not fit on a plate of size {tuple(plate_size)}')
+            skylines.append(skyline)
+            floors.append(0)
+            rejects.append(None)
+        floors[plate] = min(seg[1] for seg in skyline)
+        x, y, rotated = placed
+        positions[i] = (plate, x, y, rotated)
+    return positions # type: ignore
+
+def pack_on_plates(objects: Sequence[OpenSCADObject], 
+                   plate_size: Tuple2, 
+                   footprints: Sequence[Optional[Tuple[Sequence[float], Sequence[float]]]] = None,
+                   spacing: float = 1,
+                   allow_rotation: bool = True) -> List[OpenSCADObject]:
+    '''
+    Lay out objects in the XY plane on as few plates of `plate_size` as 
+    possible, and return one union of translated objects per plate. Every
+    plate's parts lie within (0, 0) to plate_size, at least `spacing` apart.
+
+    footprints: optional per-object ((min_x, min_y, ...), (max_x, max_y, ...))
+        bounds, as from bounding_box() or object_bounds(). Objects without a 
+        footprint are measured with object_bounds().
+    allow_rotation: if True, parts may be turned 90 degrees around Z to 
+        pack more tightly. 
+    '''
+    if footprints is None:
+        footprints = [None] * len(objects)
+    all_bounds = [b or object_bounds(o) or ((0, 0, 0), (0, 0, 0)) for o, b in zip(objects, footprints)]
+    sizes = [(hi[0] - lo[0], hi[1] - lo[1]) for lo, hi in all_bounds]
+    positions = pack_rectangles(sizes, plate_size, spacing, allow_rotation)
+
+    plates: List[List[OpenSCADObject]] = [[] for _ in range(max((p[0] + 1 for p in positions), default=0))]
+    for obj, (lo, hi), (plate, x, y, rotated) in zip(objects, all_bounds, positions):
+        if rotated:
+            # rotate(90) maps (x, y) to (-y, x)
+            plates[plate].append(translate((x + hi[1], y - lo[0], 0))(rotate(a=90)(obj)))
+        else:
+            plates[plate].append(translate((x - lo[0], y - lo[1], 0))(obj))
+    return [union()(*p) for p in plates]
+
+def _skyline_place(skyline: List[List[float]], 
+                   orientations: Sequence[Tuple[float, float, bool]], 
+                   plate_w: float, 
+                   plate_h: float) -> Optional[Tuple[float, float, bool]]:
+    # Find the lowest, then leftmost, spot for any orientation, 
+    # and add it to skyline
+    best = None
+    for w, h, rotated in orientations:
+        for index, (x, seg_y, _) in enumerate(skyline):
+            if x + w > plate_w:
+                break
+            # A part rests at least as high as the segment under its 
+            # left edge
+            if seg_y + h > plate_h or (best is not None and (seg_y + h, x) >= best[:2]):
+                continue
+            y = _skyline_fit(skyline, index, w)
+            if y + h <= plate_h and (best is None or (y + h, x) < best[:2]):
+                best = (y + h, x, index, w, h, rotated)
+    if best is None:
+        return None
+    top, x, index, w, h, rotated = best
+    _skyline_add(skyline, index, x, top, w)
+    return x, top - h, rotated
+
+def _skyline_fit(skyline: List[List[float]], index: int, w: float) -> float:
+    # Height at which a part of width w rests if its left edge is at 
+    # skyline[index]
+    x = skyline[index][0]
+    right_edge = x + w
+    y = 0.0
+    for seg_x, seg_y, _ in skyline[index:]:
+        if seg_x >= right_edge:
+            break
+        if seg_y > y:
+            y = seg_y
+    return y
+
+def _skyline_add(skyline: List[List[float]], index: int, x: float, top: float, w: float):
+    right_edge = x + w
+    skyline.insert(index, [x, top, w])
+    # Trim or remove the segments now covered by the new one
+    i = index + 1
+    while i < len(skyline):
+        seg = skyline[i]
+        if seg[0] >= right_edge:
+            break
+        seg_right = seg[0] + seg[2]
+        if seg_right <= right_edge:
+            del skyline[i]
+        else:
+            seg[2] = seg_right - right_edge
+            seg[0] = right_edge
+            break
+    # Merge neighbors at the same height
+    i = max(index - 1, 0)
+    while i < len(skyline) - 1 and i <= index + 1:
+        if skyline[i][1] == skyline[i + 1][1]:
+            skyline[i][2] += skyline[i + 1][2]
+            del skyline[i + 1]
+        else:
+            i += 1
+
 # ==============
 # = Directions =
 # ==============
@@ -238,6 +420,11 @@ def rot_x_to_neg_y(obj:OpenSCADObject) -> OpenSCADObject:
 # =======
 # = Arc =
 # =======
+# arc_points() results, keyed on (rad, start_degrees, end_degrees, segments);
+# least recently used first
+ARC_CACHE_SIZE = 1024
+_arc_cache: 'OrderedDict[tuple, Tuple[Tuple[float, float], ...]]' = OrderedDict()
+
 def arc(rad:float, start_degrees:float, end_degrees:float, segments:int=None) -> OpenSCADObject:
     # Note: the circle that this arc is drawn from gets segments,
     # not the arc itself.  That means a quarter-circle arc will
@@ -318,6 +505,88 @@ def arc_inverted(rad:float, start_degrees:float, end_degrees:float, segments:int
 
     return ret
 
+def arc_points(rad:float, 
+               start_degrees:float, 
+               end_degrees:float, 
+               segments:int=None, 
+               center:P2=(0, 0)) -> List[Tuple[float, float]]:
+    """
+    Return points along the arc of radius `rad` around `center`, 
+    counterclockwise from start_degrees to end_degrees, for use directly in
+    a polygon() instead of the boolean geometry of arc(). 
+    e.g. a pie slice is polygon([center] + arc_points(...))
+
+    As with arc(), `segments` is the number of segments in the whole
+    circle. When it's None, the count is the one OpenSCAD would use for
+    a circle() of radius rad with its default $fa and $fs.
+
+    Points are cached on (rad, start_degrees, end_degrees, segments), so 
+    repeated arcs are only computed once. Up to ARC_CACHE_SIZE arcs are 
+    kept; call clear_arc_cache() to release them
+    """
+    key = (float(rad), float(start_degrees), float(end_degrees), segments)
+    points = _arc_cache.get(key)
+    if points is None:
+        points = _sample_arc(*key)
+        _arc_cache[key] = points
+        if len(_arc_cache) > ARC_CACHE_SIZE:
+            _arc_cache.popitem(last=False)
+    else:
+        _arc_cache.move_to_end(key)
+
+    cx, cy = center[0], center[1]
+    if cx or cy:
+        return [(x + cx, y + cy) for x, y in points]
+    return list(points)
+
+def arc_inverted_points(rad:float, 
+                        start_degrees:float, 
+                        end_degrees:float, 
+                        segments:int=None, 
+                        center:P2=(0, 0)) -> List[Tuple[float, float]]:
+    """
+    Return the outline of the shape arc_inverted() draws: the corner where
+    the tangents at start_degrees and end_degrees meet, followed by the arc
+    between them, as from arc_points(). Angles are fixed up the same way 
+    arc_inverted() does, so the arc covers less than 180 degrees.
+    """
+    if end_degrees < start_degrees:
+        end_degrees += 360
+
+    if end_degrees - start_degrees >= 180:
+        start_degrees, end_degrees = end_degrees, start_degrees
+
+    span = (end_degrees - start_degrees) % 360
+    if span >= 180:
+        raise ValueError("Unable to draw inverted arc over 180 or more "
+                         "degrees. start_degrees: %s end_degrees: %s"
+                         % (start_degrees, end_degrees))
+
+    mid = radians(start_degrees + span / 2)
+    corner_dist = rad / cos(radians(span / 2))
+    corner = (center[0] + corner_dist * cos(mid), center[1] + corner_dist * sin(mid))
+    return [corner] + arc_points(rad, start_degrees, end_degrees, segments, center)
+
+def clear_arc_cache():
+    """Forget all arcs sampled by arc_points()"""
+    _arc_cache.clear()
+
+def _sample_arc(rad:float, start_degrees:float, end_degrees:float, segments:Optional[int]) -> Tuple[Tuple[float, float], ...]:
+    span = (end_degrees - start_degrees) % 360
+    if not span and end_degrees != start_degrees:
+        span = 360
+    # A little slack so spans that are whole numbers of segments don't
+    # round up to an extra one
+    steps = max(1, ceil(span * _circle_fragments(rad, segments) / 360 - 1e-9))
+    angles = [radians(start_degrees + span * k / steps) for k in range(steps + 1)]
+    return tuple(zip([rad * cos(a) for a in angles], [rad * sin(a) for a in angles]))
+
+def _circle_fragments(rad:float, segments:Optional[int]) -> int:
+    # OpenSCAD's get_fragments_from_r(), with its default $fa = 12, $fs = 2
+    if segments:
+        return max(int(segments), 3)
+    return int(ceil(max(min(360 / 12, rad * 2 * pi / 2), 5)))
+
 # TODO: arc_to that creates an arc from point to another point.
 # This is useful for making paths.  See the SVG path command:
 # See: http://www.w3.org/TR/SVG/implnote.html#ArcImplementationNotes
@@ -343,6 +612,15 @@ class BoundingBox(object):
         self.set_size(size)
         self.set_position(loc)
 
+    @classmethod
+    def from_object(cls, obj: OpenSCADObject) -> 'BoundingBox':
+        # Unlike a hand-built BoundingBox, this follows obj through any 
+        # transforms & CSG operations, using object_bounds()
+        bounds = object_bounds(obj) or ((0, 0, 0), (0, 0, 0))
+        size = [hi - lo for lo, hi in zip(*bounds)]
+        center = [(hi + lo) / 2 for lo, hi in zip(*bounds)]
+        return cls(size, center)
+
     def size(self) -> List[float]:
         return [self.w, self.h, self.d]
 
@@ -616,19 +894,372 @@ def _table_string(field_names: Sequence[str], rows:Sequence[Sequence[float]], cs
 # ================
 # = Bounding Box =
 # ================
-def bounding_box(points: Sequence[EucOrTuple]) -> Tuple[Tuple3, Tuple3]:
-    all_x = []
-    all_y = []
-    all_z = []
-    for p in points:
-        all_x.append(p[0])
-        all_y.append(p[1])
-        if len(p) > 2:
-            all_z.append(p[2]) # type:ignore 
+BoundingBoxTuple = Tuple[Tuple3, Tuple3]
+
+def bounding_box(points: Iterable[EucOrTuple], dimensions: int = 3) -> BoundingBoxTuple:
+    '''
+    Return ((min_x, min_y, min_z), (max_x, max_y, max_z)) for points, in a 
+    single pass and without copying them. 2D points have z == 0.
+
+    points may be any iterable of points (lists, generators, Point3s), a
+    PointArray, a flat array.array of coordinates, or a NumPy array, either (N, 2), (N, 3)
+    or flat. `dimensions` is the number of coordinates per point in flat 
+    arrays, and is ignored otherwise.
+    '''
+    if hasattr(points, 'ndim') and hasattr(points, 'min'):
+        # NumPy arrays, handled without importing NumPy here
+        arr = points.reshape(-1, dimensions) if points.ndim == 1 else points # type: ignore
+        if not len(arr):
+            raise ValueError('bounding_box() arg is an empty sequence')
+        min_bb, max_bb = arr.min(axis=0).tolist(), arr.max(axis=0).tolist()
+        if len(min_bb) == 2:
+            min_bb.append(0)
+            max_bb.append(0)
+        return (tuple(min_bb[:3]), tuple(max_bb[:3])) # type: ignore
+    
+    if isinstance(points, PointArray):
+        if not len(points):
+            raise ValueError('bounding_box() arg is an empty sequence')
+        columns = points._columns(3)
+        return (tuple(map(min, columns)), tuple(map(max, columns))) # type: ignore
+
+    if isinstance(points, array):
+        vals = iter(points)
+        # zip() on one iterator groups flat values into points; 2D points 
+        # get a constant 0 z
+        if dimensions == 2:
+            points = zip(vals, vals, repeat(0))
         else:
-            all_z.append(0)
+            points = zip(*[vals] * dimensions)
+    return _bounding_box_iter(iter(points))
+
+def bounding_box_stream(chunks: Iterable[Iterable[EucOrTuple]], dimensions: int = 3) -> BoundingBoxTuple:
+    '''
+    Bounding box of all the points in `chunks`, an iterable of point sets
+    in any form bounding_box() accepts. Each chunk is measured as it 
+    arrives and merged into the running box, so large meshes can be
+    checked piecewise without ever collecting them in one list.
+    Empty chunks are skipped.
+    '''
+    boxes = (bounding_box(c, dimensions) for c in chunks if _has_points(c))
+    return merge_bounding_boxes(boxes)
+
+def merge_bounding_boxes(boxes: Iterable[BoundingBoxTuple]) -> BoundingBoxTuple:
+    '''
+    Return the smallest box containing every box in `boxes`, all in 
+    bounding_box()'s ((min_x, min_y, min_z), (max_x, max_y, max_z)) format
+    '''
+    boxes = iter(boxes)
+    try:
+        (x0, y0, z0), (x1, y1, z1) = next(boxes)
+    except StopIteration:
+        raise ValueError('merge_bounding_boxes() arg is an empty sequence')
+    for (bx0, by0, bz0), (bx1, by1, bz1) in boxes:
+        if bx0 < x0: x0 = bx0
+        if by0 < y0: y0 = by0
+        if bz0 < z0: z0 = bz0
+        if bx1 > x1: x1 = bx1
+        if by1 > y1: y1 = by1
+        if bz1 > z1: z1 = bz1
+    return ((x0, y0, z0), (x1, y1, z1))
+
+def _has_points(chunk: Any) -> bool:
+    # Iterators can't be checked for emptiness without consuming them, 
+    # so they're always measured
+    return not hasattr(chunk, '__len__') or len(chunk) > 0
+
+def _bounding_box_iter(points: Any) -> BoundingBoxTuple:
+    try:
+        p = next(points)
+    except StopIteration:
+        raise ValueError('bounding_box() arg is an empty sequence')
+
+    # Fast path: unpack 3D points directly. The first point that doesn't
+    # unpack into 3 values (2D points, 4D points) falls through to the
+    # general loop below along with all the remaining points
+    if len(p) == 3:
+        x0, y0, z0 = x1, y1, z1 = p
+        for p in points:
+            # Only the unpacking is guarded; errors raised by the points 
+            # iterator itself propagate
+            try:
+                x, y, z = p
+            except ValueError:
+                points = chain([p], points)
+                break
+            if x < x0: x0 = x
+            elif x > x1: x1 = x
+            if y < y0: y0 = y
+            elif y > y1: y1 = y
+            if z < z0: z0 = z
+            elif z > z1: z1 = z
+        else:
+            return ((x0, y0, z0), (x1, y1, z1))
+    else:
+        x0 = x1 = p[0]
+        y0 = y1 = p[1]
+        z0 = z1 = p[2] if len(p) > 2 else 0
+
+    for p in points:
+        x, y = p[0], p[1]
+        z = p[2] if len(p) > 2 else 0
+        if x < x0: x0 = x
+        elif x > x1: x1 = x
+        if y < y0: y0 = y
+        elif y > y1: y1 = y
+        if z < z0: z0 = z
+        elif z > z1: z1 = z
+    return ((x0, y0, z0), (x1, y1, z1))
+
+# =================
+# = Object Bounds =
+# =================
+# Conservative axis-aligned bounds for OpenSCADObject trees, computed in 
+# Python without rendering. "Conservative" means the real geometry is 
+# always inside the returned box, though the box may be larger than needed
+# (e.g. after rotations, differences or intersections)
+Bounds = Optional[Tuple[Tuple3, Tuple3]]
+Matrix34 = Tuple[Tuple[float, float, float, float], 
+                 Tuple[float, float, float, float], 
+                 Tuple[float, float, float, float]]
+
+# Nodes whose extents depend on files or code outside of Python
+_UNBOUNDABLE = {'text', 'import', 'import_stl', 'import_dxf', 'surface', 
+                'dxf_linear_extrude', 'child', 'children', 'intersection_for'}
+_UNION_LIKE = {'union', 'hull', 'color', 'render', 'part', 'hole', 'assign'}
+
+def object_bounds(obj: OpenSCADObject) -> Bounds:
+    """
+    Return ((min_x, min_y, min_z), (max_x, max_y, max_z)) enclosing obj, in 
+    the same format as bounding_box(), or None if obj has no geometry
+    (e.g. a disabled or background object, or an empty intersection). 
+    2D objects have a z range of 0 to 0.
 
-    return ((min(all_x), min(all_y), min(all_z)), (max(all_x), max(all_y), max(all_z)))
+    Results are cached on each node. Changing any measured object with 
+    add(), add_param(), set_modifier() or set_hole() invalidates the caches;
+    after changing params or their values directly, call clear_bounds_cache().
+
+    Raises ValueError for objects whose extents Python can't know, like
+    text(), imported files, or modules imported with import_scad()
+    """
+    version = OpenSCADObject._cache_version
+    cached = obj.__dict__.get('_bounds_cache')
+    if cached and cached[0] == version:
+        return cached[1]
+
+    child_bounds = [object_bounds(c) for c in obj.children]
+    bounds = _node_bounds(obj, child_bounds)
+    obj._bounds_cache = (version, bounds) # type: ignore
+    return bounds
+
+def clear_bounds_cache():
+    """
+    Forget every object_bounds() result, e.g. after editing an object's
+    params or its list of points in place
+    """
+    OpenSCADObject._cache_version += 1
+
+def _node_bounds(obj: OpenSCADObject, child_bounds: Sequence[Bounds]) -> Bounds:
+    name, params = obj.name, obj.params
+    # Disabled & background objects don't contribute to a model
+    if obj.modifier in ('*', '%'):
+        return None
+
+    # Holes only remove geometry, so ignore them when combining children.
+    # OpenSCAD skips disabled & background children entirely, so e.g. the 
+    # next child becomes the base of a difference()
+    solid_bounds = [b for c, b in zip(obj.children, child_bounds) 
+                    if not c.is_hole and c.modifier not in ('*', '%')]
+
+    if name in _UNBOUNDABLE or isinstance(obj, IncludedOpenSCADObject):
+        raise ValueError(f"Can't determine bounds of {name}() without rendering it in OpenSCAD")
+
+    # Primitives
+    if name == 'cube':
+        size = _xyz(params.get('size'), 1)
+        return _sized_box(size, params.get('center'))
+    elif name == 'square':
+        w, h, _ = _xyz(params.get('size'), 1)
+        return _sized_box((w, h, 0), params.get('center'))
+    elif name in ('sphere', 'circle'):
+        r = _radius(params.get('r'), params.get('d'))
+        z = r if name == 'sphere' else 0
+        return ((-r, -r, -z), (r, r, z))
+    elif name == 'cylinder':
+        r = _radius(params.get('r'), params.get('d'))
+        r1 = _radius(params.get('r1'), params.get('d1'), r)
+        r2 = _radius(params.get('r2'), params.get('d2'), r)
+        r_max = max(r1, r2)
+        h = params.get('h')
+        h = 1 if h is None else h
+        z_min = -h / 2 if params.get('center') else 0
+        return ((-r_max, -r_max, z_min), (r_max, r_max, z_min + h))
+    elif name in ('polyhedron', 'polygon'):
+        points = params['points']
+        if isinstance(points, IncludedOpenSCADObject):
+            raise ValueError(f"Can't determine bounds of {name}() with points defined in OpenSCAD")
+        return bounding_box(points) if len(points) else None
+
+    # Combinations
+    elif name in ('difference',):
+        # Everything is cut from the first child
+        return solid_bounds[0] if solid_bounds else None
+    elif name == 'intersection':
+        result = None
+        for i, b in enumerate(solid_bounds):
+            if b is None:
+                return None
+            result = b if i == 0 else _intersect_bounds(result, b)
+            if result is None:
+                return None
+        return result
+    elif name == 'minkowski':
+        if not solid_bounds or None in solid_bounds:
+            return None
+        lo, hi = solid_bounds[0]
+        for b_lo, b_hi in solid_bounds[1:]:
+            lo = tuple(a + b for a, b in zip(lo, b_lo))
+            hi = tuple(a + b for a, b in zip(hi, b_hi))
+        return (lo, hi)
+
+    bounds = _union_bounds(solid_bounds)
+    if bounds is None or name in _UNION_LIKE:
+        return bounds
+
+    # Transforms
+    matrix = _transform_matrix(name, params, bounds)
+    if matrix is not None:
+        return _transformed_bounds(matrix, bounds)
+
+    (x0, y0, z0), (x1, y1, z1) = bounds
+    if name == 'linear_extrude':
+        h = params.get('height')
+        h = 100 if h is None else h
+        z_min = -h / 2 if params.get('center') else 0
+        sx, sy, _ = _xyz(params.get('scale'), 1)
+        # The top of the extrusion is scaled about the origin
+        x0, x1 = min(x0, x0 * sx), max(x1, x1 * sx)
+        y0, y1 = min(y0, y0 * sy), max(y1, y1 * sy)
+        if params.get('twist'):
+            # A twisted profile could face any way; allow for all of them
+            r = max(sqrt(x*x + y*y) for x in (x0, x1) for y in (y0, y1))
+            x0, y0, x1, y1 = -r, -r, r, r
+        return ((x0, y0, z_min), (x1, y1, z_min + h))
+    elif name == 'rotate_extrude':
+        # The 2D profile's X becomes radius, & its Y becomes Z
+        r = max(abs(x0), abs(x1))
+        return ((-r, -r, y0), (r, r, y1))
+    elif name == 'projection':
+        return ((x0, y0, 0), (x1, y1, 0))
+    elif name == 'offset':
+        grow = max(params.get('r') or 0, params.get('delta') or 0, 0)
+        return ((x0 - grow, y0 - grow, z0), (x1 + grow, y1 + grow, z1))
+
+    raise ValueError(f"Can't determine bounds of {name}() without rendering it in OpenSCAD")
+
+def _xyz(value: Any, default: float) -> Tuple3:
+    # Expand a scalar or short vector param to 3 values
+    if value is None:
+        value = default
+    if isinstance(value, (int, float)):
+        return (value, value, value)
+    value = list(value) + [default] * (3 - len(value))
+    return (value[0], value[1], value[2])
+
+def _radius(r: Optional[float], d: Optional[float], default: float = 1) -> float:
+    if r is not None:
+        return r
+    if d is not None:
+        return d / 2
+    return default
+
+def _sized_box(size: Tuple3, center: bool) -> Bounds:
+    if center:
+        return (tuple(-s / 2 for s in size), tuple(s / 2 for s in size)) # type: ignore
+    return ((0, 0, 0), size)
+
+def _union_bounds(all_bounds: Sequence[Bounds]) -> Bounds:
+    present = [b for b in all_bounds if b is not None]
+    if not present:
+        return None
+    return merge_bounding_boxes(present)
+
+def _intersect_bounds(a: Tuple[Tuple3, Tuple3], b: Tuple[Tuple3, Tuple3]) -> Bounds:
+    lo = tuple(max(a[0][i], b[0][i]) for i in range(3))
+    hi = tuple(min(a[1][i], b[1][i]) for i in range(3))
+    if any(l > h for l, h in zip(lo, hi)):
+        return None
+    return (lo, hi) # type: ignore
+
+def _transform_matrix(name: str, params: Dict[str, Any], bounds: Tuple[Tuple3, Tuple3]) -> Optional[Matrix34]:
+    # The affine matrix for a transform node, or None if name isn't one
+    if name == 'translate':
+        x, y, z = _xyz(params.get('v'), 0)
+        return ((1, 0, 0, x), (0, 1, 0, y), (0, 0, 1, z))
+    elif name == 'scale':
+        x, y, z = _xyz(params.get('v'), 1)
+        return ((x, 0, 0, 0), (0, y, 0, 0), (0, 0, z, 0))
+    elif name == 'resize':
+        # Scale each axis to its new size; 0 leaves an axis alone unless auto
+        # is set, in which case it scales with the largest resized axis
+        sizes = [hi - lo for lo, hi in zip(*bounds)]
+        new_sizes = _xyz(params.get('newsize'), 0)
+        auto = params.get('auto') or False
+        auto = _xyz(auto, False) if not isinstance(auto, bool) else (auto, auto, auto)
+        factors = [n / s if n and s else None for n, s in zip(new_sizes, sizes)]
+        known = [f for f in factors if f is not None]
+        largest = max(known, key=abs) if known else 1
+        factors = [f if f is not None else (largest if a else 1) for f, a in zip(factors, auto)]
+        return ((factors[0], 0, 0, 0), (0, factors[1], 0, 0), (0, 0, factors[2], 0))
+    elif name == 'mirror':
+        nx, ny, nz = _xyz(params.get('v'), 0)
+        length_sq = nx*nx + ny*ny + nz*nz
+        if not length_sq:
+            return ((1, 0, 0, 0), (0, 1, 0, 0), (0, 0, 1, 0))
+        n = (nx, ny, nz)
+        return tuple(tuple((1 if i == j else 0) - 2 * n[i] * n[j] / length_sq for j in range(3)) + (0,) 
+                     for i in range(3)) # type: ignore
+    elif name == 'rotate':
+        return _rotation_matrix(params.get('a'), params.get('v'))
+    elif name == 'multmatrix':
+        m = params['m']
+        return tuple((row[0], row[1], row[2], row[3] if len(row) > 3 else 0) for row in m[:3]) # type: ignore
+    return None
+
+def _rotation_matrix(a: Union[float, Sequence[float], None], v: Optional[Sequence[float]]) -> Matrix34:
+    if a is None:
+        a = 0
+    if not isinstance(a, (int, float)):
+        # rotate([x, y, z]) rotates about X, then Y, then Z
+        ax, ay, az = _xyz(a, 0)
+        m = _rotation_matrix(ax, (1, 0, 0))
+        m = _matrix_product(_rotation_matrix(ay, (0, 1, 0)), m)
+        return _matrix_product(_rotation_matrix(az, (0, 0, 1)), m)
+
+    ux, uy, uz = v if v else (0, 0, 1)
+    length = sqrt(ux*ux + uy*uy + uz*uz)
+    if not length:
+        return ((1, 0, 0, 0), (0, 1, 0, 0), (0, 0, 1, 0))
+    ux, uy, uz = ux / length, uy / length, uz / length
+    rads = radians(a)
+    c, s = cos(rads), sin(rads)
+    t = 1 - c
+    return ((t*ux*ux + c,    t*ux*uy - s*uz, t*ux*uz + s*uy, 0),
+            (t*ux*uy + s*uz, t*uy*uy + c,    t*uy*uz - s*ux, 0),
+            (t*ux*uz - s*uy, t*uy*uz + s*ux, t*uz*uz + c,    0))
+
+def _matrix_product(a: Matrix34, b: Matrix34) -> Matrix34:
+    # a * b, treating each as a 4x4 affine matrix
+    return tuple(tuple(sum(a[i][k] * b[k][j] for k in range(3)) + (a[i][3] if j == 3 else 0) 
+                       for j in range(4)) 
+                 for i in range(3)) # type: ignore
+
+def _transformed_bounds(m: Matrix34, bounds: Tuple[Tuple3, Tuple3]) -> Bounds:
+    corners = [(x, y, z) for x in (bounds[0][0], bounds[1][0]) 
+                         for y in (bounds[0][1], bounds[1][1]) 
+                         for z in (bounds[0][2], bounds[1][2])]
+    moved = [tuple(row[0] * x + row[1] * y + row[2] * z + row[3] for row in m) for x, y, z in corners]
+    return bounding_box(moved) # type: ignore
 
 # =======================
 # = Hardware dimensions =
@@ -735,14 +1366,17 @@ def euclidify(an_obj:EucOrTuple, intended_class:type=Vector3) -> Union[Point23,
     # -- 2D input has its z-values set to 0 when intended_class is 3D
 
     The general idea is to take in data in whatever form is handy to users
-    and return euclid3 types with vector math capabilities
+    and return euclid3 types with vector math capabilities.
+    PointArrays and NumPy arrays of shape (N, 2|3) or (2|3,) are accepted as well.
     '''
     sequence = (list, tuple)
     euclidable = (list, tuple, Vector2, Vector3, Point2, Point3)
     numeric = (int, float)
+    if _is_ndarray(an_obj) or isinstance(an_obj, PointArray):
+        an_obj = an_obj.tolist() if _is_ndarray(an_obj) else an_obj.tuples()
     # If this is a list of lists, return a list of euclid objects
     if isinstance(an_obj, sequence) and isinstance(an_obj[0], euclidable):
-        return list((_euc_obj(ao, intended_class) for ao in an_obj))
+        return _euc_objs(an_obj, intended_class)
     elif isinstance(an_obj, euclidable):
         return _euc_obj(an_obj, intended_class)
     else:
@@ -770,6 +1404,36 @@ def _euc_obj(an_obj: Any, intended_class:type=Vector3) -> Union[Point23, Vector2
     result = intended_class(*an_obj[:elts_in_constructor])
     return result
 
+def _euc_objs(objs: Sequence[Any], intended_class:type=Vector3) -> List[Union[Point23, Vector23]]:
+    # Bulk version of _euc_obj(). Lists of a single type, which is what
+    # callers almost always pass, are converted without per-point checks
+    # or slicing; anything else falls back to _euc_obj() point by point
+    elts_in_constructor = 2 if intended_class in (Point2, Vector2) else 3
+    kind = _homogeneous_type(objs)
+    if kind is None:
+        return [_euc_obj(o, intended_class) for o in objs]
+    if issubclass(kind, Vector2):
+        return [intended_class(o.x, o.y) for o in objs]
+    if issubclass(kind, Vector3):
+        if elts_in_constructor == 2:
+            return [intended_class(o.x, o.y) for o in objs]
+        return [intended_class(o.x, o.y, o.z) for o in objs]
+    size = len(objs[0])
+    if size <= elts_in_constructor and all(len(o) == size for o in objs):
+        return list(starmap(intended_class, objs))
+    return [intended_class(*o[:elts_in_constructor]) for o in objs]
+
+def _homogeneous_type(objs: Sequence[Any]) -> Optional[type]:
+    # The type shared by every member of objs, or None if they differ
+    kind = type(objs[0])
+    if all(type(o) is kind for o in objs):
+        return kind
+    return None
+
+def _is_ndarray(obj: Any) -> bool:
+    # Duck-typed so NumPy stays an optional dependency
+    return hasattr(obj, 'ndim') and hasattr(obj, 'tolist')
+
 def euc_to_arr(euc_obj_or_list: EucOrTuple) -> List[float]:  # Inverse of euclidify()
     # Call as_arr on euc_obj_or_list or on all its members if it's a list
     result: List[float] = []
@@ -777,7 +1441,12 @@ def euc_to_arr(euc_obj_or_list: EucOrTuple) -> List[float]:  # Inverse of euclid
     if hasattr(euc_obj_or_list, "as_arr"):
         result = euc_obj_or_list.as_arr()   # type: ignore
     elif isinstance(euc_obj_or_list, (list, tuple)) and hasattr(euc_obj_or_list[0], 'as_arr'):
-        result = [euc_to_arr(p) for p in euc_obj_or_list] # type: ignore
+        kind = _homogeneous_type(euc_obj_or_list)
+        if kind is not None:
+            # One lookup of as_arr for the whole list
+            result = list(map(kind.as_arr, euc_obj_or_list)) # type: ignore
+        else:
+            result = [euc_to_arr(p) for p in euc_obj_or_list] # type: ignore
     else:
         # euc_obj_or_list is neither an array-based PyEuclid object,
         # nor a list of them.  Assume it's a list of points or vectors,
@@ -850,52 +1519,118 @@ def transform_to_point( body: OpenSCADObject,
     #   -- an openSCAD object
     #   -- a list of 3-tuples  or PyEuclid Point3s
     #   -- a single 3-tuple or Point3
-    dest_point = euclidify(dest_point, Point3)
-    dest_normal = euclidify(dest_normal, Vector3)
-    at = dest_point + dest_normal
-
-    EUC_UP = euclidify(UP_VEC)
-    EUC_FORWARD = euclidify(FORWARD_VEC)
-    EUC_ORIGIN = euclidify(ORIGIN, Vector3)
-    # if dest_normal and src_up are parallel, the transform collapses
-    # all points to dest_point.  Instead, use EUC_FORWARD if needed
-    if dest_normal.cross(src_up) == EUC_ORIGIN:
-        if src_up.cross(EUC_UP) == EUC_ORIGIN:
-            src_up = EUC_FORWARD
-        else:
-            src_up = EUC_UP
-            
-    def _orig_euclid_look_at(eye, at, up):
-        '''
-        Taken from the original source of PyEuclid's Matrix4.new_look_at() 
-        prior to 1184a07d119a62fc40b2c6becdbeaf053a699047 (11 Jan 2015), 
-        as discussed here:
-        https://github.com/ezag/pyeuclid/commit/1184a07d119a62fc40b2c6becdbeaf053a699047
-    
-        We were dependent on the old behavior, which is duplicated here:
-        '''
-        z = (eye - at).normalized()
-        x = up.cross(z).normalized()
-        y = z.cross(x)
-
-        m = Matrix4.new_rotate_triple_axis(x, y, z)
-        m.d, m.h, m.l = eye.x, eye.y, eye.z
-        return m
-            
-    look_at_matrix = _orig_euclid_look_at(eye=dest_point, at=at, up=src_up)
-    
+    return transform_to_points(body, [dest_point], [dest_normal], src_up)[0]
+
+def transform_to_points(body: OpenSCADObject, 
+                        dest_points: Sequence[EucOrTuple], 
+                        dest_normals: Sequence[EucOrTuple], 
+                        src_up: EucOrTuple=Vector3(0, 0, 1)) -> List[OpenSCADObject]:
+    """
+    Batch version of transform_to_point(): return a copy of body moved to 
+    each of dest_points and looking along the matching dest_normal, exactly
+    as transform_to_point() would place it.
+
+    body may be an OpenSCADObject, which is wrapped in a multmatrix() for 
+    each destination, a single point, or a list of points, which are 
+    transformed in Python to Point3s. A PointArray body yields one 
+    transformed PointArray per destination.
+    """
+    if isinstance(body, (list, tuple)) and not body:
+        # No points to move, wherever they're going
+        return [[] for _ in dest_points]
+    matrices = look_at_matrices(dest_points, dest_normals, src_up)
+    if isinstance(body, PointArray):
+        return [body.transform(m) for m in matrices] # type: ignore
     if is_scad(body):
         # If the body being altered is a SCAD object, do the matrix mult
         # in OpenSCAD
-        sc_matrix = scad_matrix(look_at_matrix)
-        res = multmatrix(m=sc_matrix)(body)
-    else:
-        body = euclidify(body, Point3)
-        if isinstance(body, (list, tuple)):
-            res = [look_at_matrix * p for p in body]
-        else:
-            res = look_at_matrix * body
-    return res
+        return [multmatrix(m=[list(row) for row in m] + [[0, 0, 0, 1.0]])(body) for m in matrices]
+
+    if isinstance(body, (list, tuple)) and isinstance(body[0], (list, tuple, Point2, Point3, Vector2, Vector3)):
+        points = [_xyz_tuple(p) for p in body]
+        return [[Point3(*p) for p in apply_matrix(m, points)] for m in matrices] # type: ignore
+    point = [_xyz_tuple(body)]
+    return [Point3(*apply_matrix(m, point)[0]) for m in matrices] # type: ignore
+
+def look_at_matrices(dest_points: Sequence[EucOrTuple], 
+                     dest_normals: Sequence[EucOrTuple], 
+                     src_up: EucOrTuple=(0, 0, 1)) -> List[Matrix34]:
+    """
+    Return the matrices transform_to_point() would use to move points to 
+    each of dest_points, looking along the matching dest_normal. Each matrix 
+    is the top three rows of the 4x4 affine matrix, in the same format 
+    used by apply_matrix()
+    """
+    # The arithmetic here is arranged exactly as euclid3's would be, 
+    # so results are identical to euclid3's look-at matrices
+    src_up = _xyz_tuple(src_up)
+    matrices = []
+    for eye, normal in zip(dest_points, dest_normals):
+        eye, normal = _xyz_tuple(eye), _xyz_tuple(normal)
+        up = src_up
+        # if dest_normal and src_up are parallel, the transform collapses
+        # all points to dest_point.  Instead, use FORWARD if needed
+        if _cross(normal, up) == (0, 0, 0):
+            up = (0, 1, 0) if _cross(up, (0, 0, 1)) == (0, 0, 0) else (0, 0, 1)
+        at = (eye[0] + normal[0], eye[1] + normal[1], eye[2] + normal[2])
+        z = _normalized((eye[0] - at[0], eye[1] - at[1], eye[2] - at[2]))
+        x = _normalized(_cross(up, z))
+        y = _cross(z, x)
+        matrices.append(((x[0], y[0], z[0], eye[0]),
+                         (x[1], y[1], z[1], eye[1]),
+                         (x[2], y[2], z[2], eye[2])))
+    return matrices
+
+def apply_matrix(m: Matrix34, points: Sequence[Tuple3]) -> List[List[float]]:
+    """
+    Return points, a sequence of (x, y, z) tuples, transformed by m, the top
+    three rows of a 4x4 affine matrix, as from look_at_matrices().
+    A PointArray is returned as a transformed PointArray.
+    """
+    if isinstance(points, PointArray):
+        return points.transform(m) # type: ignore
+    (a, b, c, d), (e, f, g, h), (i, j, k, l) = m
+    return [[a * x + b * y + c * z + d,
+             e * x + f * y + g * z + h,
+             i * x + j * y + k * z + l] for x, y, z in points]
+
+# =====================
+# = Tuple vector math =
+# =====================
+# Plain (x, y, z) tuple arithmetic, shared by the modules that avoid 
+# allocating euclid3 objects in their inner loops
+def _xyz_tuple(p: EucOrTuple) -> Tuple3:
+    # 2D points get z == 0, as euclidify() would do
+    return (p[0], p[1], p[2] if len(p) > 2 else 0) # type: ignore
+
+def _xyz_tuples(points: Iterable[EucOrTuple]) -> List[Tuple3]:
+    return [(p[0], p[1], p[2] if len(p) > 2 else 0) for p in points] # type: ignore
+
+def _add(a: Tuple3, b: Tuple3) -> Tuple3:
+    return (a[0] + b[0], a[1] + b[1], a[2] + b[2])
+
+def _sub(a: Tuple3, b: Tuple3) -> Tuple3:
+    return (a[0] - b[0], a[1] - b[1], a[2] - b[2])
+
+def _scaled(v: Tuple3, factor: float) -> Tuple3:
+    return (v[0] * factor, v[1] * factor, v[2] * factor)
+
+def _dot(a: Tuple3, b: Tuple3) -> float:
+    return a[0] * b[0] + a[1] * b[1] + a[2] * b[2]
+
+def _magnitude_squared(v: Tuple3) -> float:
+    return v[0]**2 + v[1]**2 + v[2]**2
+
+def _normalized(v: Tuple3) -> Tuple3:
+    d = sqrt(v[0]**2 + v[1]**2 + v[2]**2)
+    if d:
+        return (v[0] / d, v[1] / d, v[2] / d)
+    return v
+
+def _cross(a: Tuple3, b: Tuple3) -> Tuple3:
+    return (a[1] * b[2] - a[2] * b[1],
+            -a[0] * b[2] + a[2] * b[0],
+            a[0] * b[1] - a[1] * b[0])
     
 # ========================================
 # = Vector drawing: 3D arrow from a line =
@@ -965,33 +1700,92 @@ def offset_points(points:Sequence[Point23],
     an incorrect (internal points are all external, or vice versa) if the first
     segment pair is concave. This could be mitigated with a point_is_in_polygon()
     function, but I haven't written that yet.
+
+    For non-convex shapes, holes, or offsets that intersect themselves, use
+    solid.polygon_offset.offset_polygon_points() instead.
     """
-    # Note that we could just call offset_point() repeatedly, but we'd do 
-    # a lot of repeated calculations that way
-    src_points = euclidify(points, Point2)
-    if closed:
-        src_points.append(src_points[0])
+    return [Point2(x, y) for x, y in offset_point_tuples(points, offset, internal, closed)]
 
-    vecs = vectors_between_points(src_points)
-    direction = direction_of_bend(*src_points[:3])
+def offset_point_tuples(points:Sequence[Union[Point23, Tuple2, Tuple3]], 
+                        offset:float, 
+                        internal:bool=True,
+                        closed=True) -> List[Tuple2]:
+    """
+    Like offset_points(), but accepts and returns (x, y) tuples, so long
+    polylines are offset without creating any euclid3 objects. Results are
+    identical to offset_points().
+
+    Where consecutive segments are parallel, or a segment has zero length,
+    their offset lines have no single intersection. The end of the incoming
+    segment's offset line is used there instead, or the start of the 
+    outgoing one if the incoming segment has zero length.
+    """
+    src_points = [(p[0], p[1]) for p in points]
+    direction = _first_bend_direction(src_points, closed)
     if not internal:
         direction = opposite_direction(direction)
-
-    perp_vecs = list((perpendicular_vector(v, direction=direction, length=offset) for v in vecs))
-
-    lines: List[Line2] = []
-    for perp, a, b in zip(perp_vecs, src_points[:-1], src_points[1:]):
-        lines.append(Line2(a+perp, b+perp))
-    
-    intersections = list((a.intersect(b) for a,b in zip(lines[:-1], lines[1:])))
+    return _offset_tuples(src_points, offset, direction, closed)
+
+def _first_bend_direction(points:Sequence[Tuple2], closed:bool) -> DirectionLR:
+    # direction_of_bend() for the first three points, on tuples. Paths with
+    # fewer than three points don't bend, so they count as colinear
+    first = (points + points[:1] if closed else points)[:3]
+    if len(first) < 3:
+        return RIGHT_DIR
+    (ax, ay), (bx, by), (cx, cy) = first
+    return LEFT_DIR if (bx - ax) * (cy - by) - (by - ay) * (cx - bx) > 0 else RIGHT_DIR
+
+def _offset_tuples(points:Sequence[Tuple2], 
+                   offset:float, 
+                   direction:DirectionLR, 
+                   closed:bool) -> List[Tuple2]:
+    # The arithmetic here follows euclid3's Line2 construction and 
+    # intersection exactly, for identical results
+    if closed:
+        points = list(points) + [points[0]]
+
+    # Each segment's offset line, as (start x, start y, vector x, vector y)
+    lines = []
+    for (ax, ay), (bx, by) in zip(points[:-1], points[1:]):
+        vx, vy = bx - ax, by - ay
+        px, py = (vy, -vx) if direction == RIGHT_DIR else (-vy, vx)
+        d = sqrt(px**2 + py**2)
+        if d:
+            factor = offset / d
+            px *= factor
+            py *= factor
+        sx, sy = ax + px, ay + py
+        lines.append((sx, sy, (bx + px) - sx, (by + py) - sy))
+
+    # Each joint is (a, b, incoming, outgoing): the intersection point is 
+    # measured along line a, as euclid3's b.intersect(a) does
+    result = []
     if closed:
         # First point is determined by intersection of first and last lines
-        intersections.insert(0, lines[0].intersect(lines[-1]))
+        joints = [(lines[-1], lines[0], lines[-1], lines[0])]
     else:
         # otherwise use first and last points in lines
-        intersections.insert(0, lines[0].p)
-        intersections.append(lines[-1].p + lines[-1].v)
-    return intersections
+        result.append(lines[0][:2])
+        joints = []
+    joints += [(b, a, a, b) for a, b in zip(lines[:-1], lines[1:])]
+
+    for (apx, apy, avx, avy), (bpx, bpy, bvx, bvy), incoming, outgoing in joints:
+        d = bvy * avx - bvx * avy
+        if d == 0:
+            # Parallel lines: end at the incoming line's end, or start at 
+            # the outgoing line's start after a zero-length segment
+            if incoming[2] or incoming[3]:
+                result.append((incoming[0] + incoming[2], incoming[1] + incoming[3]))
+            else:
+                result.append(outgoing[:2])
+            continue
+        ua = (bvx * (apy - bpy) - bvy * (apx - bpx)) / d
+        result.append((apx + ua * avx, apy + ua * avy))
+
+    if not closed:
+        sx, sy, vx, vy = lines[-1]
+        result.append((sx + vx, sy + vy))
+    return result
 
 def offset_point(a:Point2, b:Point2, c:Point2, offset:float, direction:DirectionLR=LEFT_DIR) -> Point2:
     ab_perp = perpendicular_vector(b-a, direction, length=offset)
@@ -1049,14 +1843,24 @@ def vectors_between_points(points: Sequence[Point23]) -> List[Vector23]:
 def fillet_2d(three_point_sets: Sequence[Tuple[Point23, Point23, Point23]], 
               orig_poly: OpenSCADObject, 
               fillet_rad: float, 
-              remove_material: bool=True) -> OpenSCADObject:
+              remove_material: bool=True,
+              batch: bool=False,
+              segments: int=32) -> OpenSCADObject:
     """
     Return a polygon with arcs of radius `fillet_rad` added/removed (according to
     `remove_material`) to corners specified in `three_point_sets`. 
 
     e.g. Turn a sharp external corner to a rounded one, or add material
     to a sharp interior corner to smooth it out.
+
+    By default each corner adds a boolean operation to the OpenSCAD tree.
+    If `batch` is True, orig_poly must be a single-path polygon(), and the
+    result is one polygon() whose corners are replaced by arcs of
+    `segments` segments per circle, as from fillet_points()
     """
+    if batch:
+        return _fillet_2d_batch(three_point_sets, orig_poly, fillet_rad, remove_material, segments)
+
     arc_objs: List[OpenSCADObject] = []
     # TODO: accept Point3s, and project them all to z==0
     for three_points in three_point_sets:
@@ -1094,6 +1898,88 @@ def fillet_2d(three_point_sets: Sequence[Tuple[Point23, Point23, Point23]],
 
     return poly 
 
+def _fillet_2d_batch(three_point_sets: Sequence[Tuple[Point23, Point23, Point23]], 
+                     orig_poly: OpenSCADObject, 
+                     fillet_rad: float, 
+                     remove_material: bool,
+                     segments: int) -> OpenSCADObject:
+    if orig_poly.name != 'polygon' or orig_poly.params.get('paths'):
+        raise ValueError('fillet_2d(batch=True) needs a polygon() with a single path')
+    points = [(p[0], p[1]) for p in orig_poly.params['points']]
+
+    # Removing material only changes convex corners, and adding it only
+    # changes concave ones, just as the boolean version does
+    orientation = 1 if is_counterclockwise(points) else -1
+    index_of = {p: i for i, p in enumerate(points)}
+    corners = []
+    for three_points in three_point_sets:
+        i = index_of.get((three_points[1][0], three_points[1][1]))
+        if i is None:
+            raise ValueError(f'Corner {three_points[1]} is not a point of orig_poly')
+        # A corner turns the same way as its polygon if it's convex
+        corner = (points[i - 1], points[i], points[(i + 1) % len(points)])
+        convex = signed_area(corner) * orientation > 0
+        if convex == remove_material:
+            corners.append(i)
+    return polygon(fillet_points(points, fillet_rad, corners, segments))
+
+def fillet_points(points: Sequence[Point23], 
+                  fillet_rad: float, 
+                  corners: Iterable[int]=None, 
+                  segments: int=32) -> List[Tuple[float, float]]:
+    """
+    Return the points of the closed outline `points`, with the corners at
+    the indices in `corners` (all corners by default) replaced by arcs of
+    radius `fillet_rad`, tangent to both edges at the corner. Arcs get
+    `segments` segments per full circle, as OpenSCAD's $fn would.
+
+    Convex corners are rounded off and concave ones filled in. Straight
+    corners are left alone, and fillet_rad should be small enough that 
+    neighboring arcs don't overlap.
+    """
+    points = [(p[0], p[1]) for p in points]
+    count = len(points)
+    to_fillet = set(range(count) if corners is None else (i % count for i in corners))
+    result: List[Tuple[float, float]] = []
+    for i, b in enumerate(points):
+        if i in to_fillet:
+            result.extend(_fillet_arc(points[i - 1], b, points[(i + 1) % count], fillet_rad, segments))
+        else:
+            result.append(b)
+    return result
+
+def _fillet_arc(a: Tuple[float, float], 
+                b: Tuple[float, float], 
+                c: Tuple[float, float], 
+                rad: float, 
+                segments: int) -> List[Tuple[float, float]]:
+    # Arc of radius rad tangent to ab and bc, from the tangent point on ab
+    # to the tangent point on bc
+    ux, uy = a[0] - b[0], a[1] - b[1]
+    vx, vy = c[0] - b[0], c[1] - b[1]
+    u_len, v_len = sqrt(ux * ux + uy * uy), sqrt(vx * vx + vy * vy)
+    if not u_len or not v_len:
+        return [b]
+    ux, uy, vx, vy = ux / u_len, uy / u_len, vx / v_len, vy / v_len
+    half_angle = atan2(abs(ux * vy - uy * vx), ux * vx + uy * vy) / 2
+    if half_angle < 1e-9 or half_angle > pi / 2 - 1e-9:
+        # A spike or a straight line; there's no arc to fit
+        return [b]
+
+    # The center lies on the bisector of the corner
+    tangent_dist = rad / tan(half_angle)
+    bx, by = ux + vx, uy + vy
+    b_len = sqrt(bx * bx + by * by)
+    center_dist = rad / sin(half_angle)
+    cx, cy = b[0] + bx / b_len * center_dist, b[1] + by / b_len * center_dist
+
+    start = degrees(atan2(b[1] + uy * tangent_dist - cy, b[0] + ux * tangent_dist - cx))
+    end = degrees(atan2(b[1] + vy * tangent_dist - cy, b[0] + vx * tangent_dist - cx))
+    # The arc never covers 180 degrees or more, so take the short way round
+    if (end - start) % 360 < 180:
+        return arc_points(rad, start, end, segments, center=(cx, cy))
+    return arc_points(rad, end, start, segments, center=(cx, cy))[::-1]
+
 def _widen_angle_for_fillet(start_degrees:float, end_degrees:float) -> Tuple[float, float]:
     # Fix start/end degrees as needed; find a way to make an acute angle
     if end_degrees < start_degrees:
@@ -1121,9 +2007,12 @@ def path_2d(points:Sequence[Point23], width:float=1, closed:bool=False) -> List[
 
     Or, you know, just call `path_2d_polygon()` and let it do that for you
     '''
-    p_a = offset_points(points, offset=width/2, internal=True, closed=closed)
-    p_b = list(reversed(offset_points(points, offset=width/2, internal=False, closed=closed)))
-    return p_a + p_b
+    # Both sides share the source points & bend direction
+    src_points = [(p[0], p[1]) for p in points]
+    direction = _first_bend_direction(src_points, closed)
+    p_a = _offset_tuples(src_points, width/2, direction, closed)
+    p_b = _offset_tuples(src_points, width/2, opposite_direction(direction), closed)
+    return [Point2(x, y) for x, y in p_a + p_b[::-1]]
 
 def path_2d_polygon(points:Sequence[Point23], width:float=1, closed:bool=False) -> polygon:
     '''
@@ -1251,4 +2140,4 @@ def obj_tree_str(sp_obj:OpenSCADObject, vars_to_print:Sequence[str]=None) -> str
 # = DEPENDENT IMPORTS =
 # =====================
 # imported here to mitigate import loops
-from solid.extrude_along_path import extrude_along_path
+from solid.extrude_along_path import extrude_along_path, batch_transform